@@ -0,0 +1,135 @@
+import time
+
+import aiohttp
+from api.codec import get_codec
+from api.metrics import default_recorder
+from config.config import ConfigApi
+
+
+class AsyncResponse:
+    """Fully read response exposing the parts of requests.Response tests use"""
+
+    def __init__(self, status_code, headers, content, url, codec):
+        self.status_code = status_code
+        self.headers = headers
+        self.content = content
+        self.url = url
+        self.codec = codec
+        self._decoded = []
+
+    @property
+    def text(self):
+        return self.content.decode("utf-8", errors="replace")
+
+    def json(self):
+        """Decoded body, parsed once and reused on later calls"""
+        if not self._decoded:
+            self._decoded.append(self.codec.decode(self.content))
+        return self._decoded[0]
+
+
+async def _on_request_start(session, context, params):
+    context.trace_request_ctx["start"] = time.perf_counter()
+
+
+async def _on_connection_create_start(session, context, params):
+    context.trace_request_ctx["connect_start"] = time.perf_counter()
+
+
+async def _on_connection_create_end(session, context, params):
+    timings = context.trace_request_ctx
+    timings["connect"] = time.perf_counter() - timings["connect_start"]
+
+
+async def _on_request_end(session, context, params):
+    timings = context.trace_request_ctx
+    timings["server"] = time.perf_counter() - timings["start"]
+
+
+def _timing_trace_config():
+    """Trace hooks splitting connection setup from time-to-headers"""
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(_on_request_start)
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_request_end.append(_on_request_end)
+    return trace_config
+
+
+class AsyncBaseAPI:
+    def __init__(self, pool_size=None, recorder=None, codec=None):
+        self.base_url = ConfigApi.BASE_URL
+        self.timeout = ConfigApi.TIMEOUT
+        self.headers = ConfigApi.HEADERS
+        self.pool_size = pool_size or ConfigApi.POOL_SIZE
+        self.recorder = recorder or default_recorder
+        self.codec = get_codec(codec)
+        self._session = None
+
+    @property
+    def session(self):
+        """Pooled session, created lazily inside the running event loop"""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(limit=self.pool_size)
+            self._session = aiohttp.ClientSession(
+                connector=connector, trace_configs=[_timing_trace_config()]
+            )
+        return self._session
+
+    async def request(self, method, endpoint, **kwargs):
+        """Send a request and read the whole body before releasing the connection"""
+        url = f"{self.base_url}{endpoint}"
+        timeout = aiohttp.ClientTimeout(total=kwargs.pop("timeout", self.timeout))
+        headers = kwargs.pop("headers", self.headers)
+        timings = {}
+        start = time.perf_counter()
+        try:
+            async with self.session.request(
+                method,
+                url,
+                timeout=timeout,
+                headers=headers,
+                trace_request_ctx=timings,
+                **kwargs,
+            ) as response:
+                content = await response.read()
+        except Exception:
+            self.recorder.record(
+                method, endpoint, time.perf_counter() - start, error=True
+            )
+            raise
+        self.recorder.record(
+            method,
+            endpoint,
+            time.perf_counter() - start,
+            server=timings.get("server"),
+            connect=timings.get("connect"),
+        )
+        return AsyncResponse(
+            response.status, response.headers, content, str(response.url), self.codec
+        )
+
+    async def get(self, endpoint, params=None, **kwargs):
+        """Generic GET request"""
+        return await self.request("GET", endpoint, params=params, **kwargs)
+
+    async def post(self, endpoint, data=None, json=None, **kwargs):
+        """Generic POST request"""
+        if json is not None:
+            data = self.codec.encode(json)
+        return await self.request("POST", endpoint, data=data, **kwargs)
+
+    async def put(self, endpoint, data=None, json=None, **kwargs):
+        """Generic PUT request"""
+        if json is not None:
+            data = self.codec.encode(json)
+        return await self.request("PUT", endpoint, data=data, **kwargs)
+
+    async def delete(self, endpoint, **kwargs):
+        """Generic DELETE request"""
+        return await self.request("DELETE", endpoint, **kwargs)
+
+    async def close(self):
+        """Close the session"""
+        if self._session is not None:
+            await self._session.close()
@@ -0,0 +1,39 @@
+from api.async_base_api import AsyncBaseAPI
+
+
+class AsyncPetAPI(AsyncBaseAPI):
+    def __init__(self, pool_size=None):
+        super().__init__(pool_size)
+        self.endpoint = "/pet"
+
+    async def create_pet(self, pet_data):
+        return await self.post(self.endpoint, json=pet_data)
+
+    async def get_pet_by_id(self, pet_id):
+        return await self.get(f"{self.endpoint}/{pet_id}")
+
+    async def update_pet(self, pet_data):
+        return await self.put(self.endpoint, json=pet_data)
+
+    async def update_pet_with_form(self, pet_id, name=None, status=None):
+        form_data = {}
+        if name:
+            form_data["name"] = name
+        if status:
+            form_data["status"] = status
+
+        headers = {"Content-Type": "application/x-www-form-urlencoded"}
+        return await self.post(
+            f"{self.endpoint}/{pet_id}", data=form_data, headers=headers
+        )
+
+    async def delete_pet(self, pet_id):
+        return await self.delete(f"{self.endpoint}/{pet_id}")
+
+    async def find_pets_by_status(self, status):
+        return await self.get(
+            f"{self.endpoint}/findByStatus", params={"status": status}
+        )
+
+    async def find_pets_by_tags(self, tags):
+        return await self.get(f"{self.endpoint}/findByTags", params={"tags": tags})
@@ -1,56 +1,133 @@
+import time
 import requests
+from requests.adapters import HTTPAdapter
+from api.codec import get_codec, install_cached_json
+from api.metrics import default_recorder
 from config.config import ConfigApi
 
 
 class BaseAPI:
-    def __init__(self):
+    def __init__(self, cache=None, recorder=None, transport=None, codec=None):
         self.base_url = ConfigApi.BASE_URL
         self.timeout = ConfigApi.TIMEOUT
         self.headers = ConfigApi.HEADERS
         self.session = requests.Session()
+        # Size the pool so bulk workers do not queue on a single connection;
+        # a custom transport (e.g. CassetteAdapter) replaces the default adapter
+        adapter = transport or HTTPAdapter(pool_maxsize=ConfigApi.POOL_SIZE)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # Optional ResponseCache for GET requests
+        self.cache = cache
+        self.recorder = recorder or default_recorder
+        self.codec = get_codec(codec)
+        self.session.hooks["response"].append(
+            lambda response, *args, **kwargs: install_cached_json(response, self.codec)
+        )
+
+    def _encode_body(self, data, json, headers):
+        """Serialize a JSON body to bytes once, with the configured codec"""
+        if json is None:
+            return data, headers
+        if "Content-Type" not in headers:
+            headers = {**headers, "Content-Type": "application/json"}
+        return self.codec.encode(json), headers
+
+    def _timed(self, method, endpoint, send):
+        """Run send() and record its latency against the endpoint"""
+        start = time.perf_counter()
+        try:
+            response = send()
+        except Exception:
+            self.recorder.record(
+                method, endpoint, time.perf_counter() - start, error=True
+            )
+            raise
+        self.recorder.record(
+            method,
+            endpoint,
+            time.perf_counter() - start,
+            server=response.elapsed.total_seconds(),
+        )
+        return response
 
     def get(self, endpoint, params=None, **kwargs):
-        """Generic GET request"""
+        """Generic GET request, served from the cache when one is configured"""
         url = f"{self.base_url}{endpoint}"
-        response = self.session.get(
-            url,
-            params=params,
-            timeout=kwargs.get("timeout", self.timeout),
-            headers=kwargs.get("headers", self.headers),
+
+        def _fetch():
+            return self._timed(
+                "GET",
+                endpoint,
+                lambda: self.session.get(
+                    url,
+                    params=params,
+                    timeout=kwargs.get("timeout", self.timeout),
+                    headers=kwargs.get("headers", self.headers),
+                    stream=kwargs.get("stream", False),
+                ),
+            )
+
+        # Streamed bodies can only be read once, so they are never cached
+        if (
+            self.cache is None
+            or kwargs.get("stream")
+            or not kwargs.get("use_cache", True)
+        ):
+            return _fetch()
+        key = self.cache.make_key(
+            "GET", url, params, kwargs.get("headers", self.headers)
         )
-        return response
+        # Copies lose the per-response json(); give each its own
+        return install_cached_json(self.cache.get_or_fetch(key, _fetch), self.codec)
 
     def post(self, endpoint, data=None, json=None, **kwargs):
         """Generic POST request"""
         url = f"{self.base_url}{endpoint}"
-        response = self.session.post(
-            url,
-            data=data,
-            json=json,
-            timeout=kwargs.get("timeout", self.timeout),
-            headers=kwargs.get("headers", self.headers),
+        data, headers = self._encode_body(
+            data, json, kwargs.get("headers", self.headers)
+        )
+        response = self._timed(
+            "POST",
+            endpoint,
+            lambda: self.session.post(
+                url,
+                data=data,
+                timeout=kwargs.get("timeout", self.timeout),
+                headers=headers,
+            ),
         )
         return response
 
     def put(self, endpoint, data=None, json=None, **kwargs):
         """Generic PUT request"""
         url = f"{self.base_url}{endpoint}"
-        response = self.session.put(
-            url,
-            data=data,
-            json=json,
-            timeout=kwargs.get("timeout", self.timeout),
-            headers=kwargs.get("headers", self.headers),
+        data, headers = self._encode_body(
+            data, json, kwargs.get("headers", self.headers)
+        )
+        response = self._timed(
+            "PUT",
+            endpoint,
+            lambda: self.session.put(
+                url,
+                data=data,
+                timeout=kwargs.get("timeout", self.timeout),
+                headers=headers,
+            ),
         )
         return response
 
     def delete(self, endpoint, **kwargs):
         """Generic DELETE request"""
         url = f"{self.base_url}{endpoint}"
-        response = self.session.delete(
-            url,
-            timeout=kwargs.get("timeout", self.timeout),
-            headers=kwargs.get("headers", self.headers),
+        response = self._timed(
+            "DELETE",
+            endpoint,
+            lambda: self.session.delete(
+                url,
+                timeout=kwargs.get("timeout", self.timeout),
+                headers=kwargs.get("headers", self.headers),
+            ),
         )
         return response
 
@@ -0,0 +1,82 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+class BulkItem:
+    """Outcome of a single call inside a bulk operation"""
+
+    def __init__(self, index, argument, response=None, error=None, elapsed=0.0):
+        self.index = index
+        self.argument = argument
+        self.response = response
+        self.error = error
+        self.elapsed = elapsed
+
+    @property
+    def ok(self):
+        return self.error is None and self.response.status_code == 200
+
+
+class BulkResult:
+    """Bulk operation outcome with items kept in input order"""
+
+    def __init__(self, items, elapsed, concurrency):
+        self.items = items
+        self.elapsed = elapsed
+        self.concurrency = concurrency
+
+    def __len__(self):
+        return len(self.items)
+
+    def __iter__(self):
+        return iter(self.items)
+
+    def __getitem__(self, index):
+        return self.items[index]
+
+    @property
+    def responses(self):
+        return [item.response for item in self.items]
+
+    @property
+    def failures(self):
+        return [item for item in self.items if not item.ok]
+
+    @property
+    def throughput(self):
+        """Completed calls per second"""
+        return len(self.items) / self.elapsed if self.elapsed else 0.0
+
+    def summary(self):
+        return (
+            f"{len(self.items)} calls, {len(self.failures)} failed, "
+            f"{self.elapsed:.2f}s total, {self.throughput:.1f}/s "
+            f"(concurrency {self.concurrency})"
+        )
+
+
+def run_bulk(func, arguments, concurrency):
+    """Call func once per argument on a bounded worker pool
+
+    Workers share the client's requests.Session. Each call only takes a
+    connection from its urllib3 pool, which is thread-safe and sized by
+    ConfigApi.POOL_SIZE, so no per-thread clients are needed.
+    """
+
+    def _call(index, argument):
+        start = time.perf_counter()
+        try:
+            response = func(argument)
+            return BulkItem(
+                index, argument, response, elapsed=time.perf_counter() - start
+            )
+        except Exception as e:
+            return BulkItem(
+                index, argument, error=e, elapsed=time.perf_counter() - start
+            )
+
+    arguments = list(arguments)
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+        items = list(executor.map(_call, range(len(arguments)), arguments))
+    return BulkResult(items, time.perf_counter() - start, concurrency)
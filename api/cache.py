@@ -0,0 +1,145 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+from config.config import ConfigApi
+
+# Request headers that can change the response body, so they are part of the key
+VARY_HEADERS = (
+    "accept",
+    "accept-encoding",
+    "accept-language",
+    "api_key",
+    "authorization",
+)
+
+
+class _Flight:
+    """Pending fetch that concurrent callers for the same key wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+class ResponseCache:
+    """TTL + LRU cache for idempotent requests with single-flight fetching
+
+    Every caller gets its own copy of the cached Response.
+    """
+
+    def __init__(
+        self, ttl=ConfigApi.CACHE_TTL, max_entries=ConfigApi.CACHE_MAX_ENTRIES
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._inflight = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    @staticmethod
+    def make_key(method, url, params=None, headers=None):
+        """Hashable key from method, URL, list-valued params and VARY_HEADERS"""
+        items = []
+        for name, value in sorted((params or {}).items()):
+            if isinstance(value, (list, tuple)):
+                value = tuple(value)
+            items.append((name, value))
+        vary = sorted(
+            (name.lower(), value)
+            for name, value in (headers or {}).items()
+            if name.lower() in VARY_HEADERS
+        )
+        return method.upper(), url, tuple(items), tuple(vary)
+
+    @staticmethod
+    def _copy(response):
+        """A caller's own Response sharing the cached body bytes
+
+        Callers may mutate what they get back, so the stored response is never
+        handed out itself. A json() installed on the instance would share its
+        decoded result between copies, so the copy goes back to the plain one.
+        """
+        response = copy.copy(response)
+        response.__dict__.pop("json", None)
+        return response
+
+    def get_or_fetch(self, key, fetch):
+        """Return a fresh cached response or fetch it once for all waiting callers"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                expires_at, response = entry
+                if expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return self._copy(response)
+                del self._entries[key]
+
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if leader:
+                flight = _Flight()
+                self._inflight[key] = flight
+                self.misses += 1
+                generation = self._generation
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return self._copy(flight.response)
+
+        try:
+            flight.response = fetch()
+        except Exception as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._inflight[key]
+                if (
+                    flight.response is not None
+                    and flight.response.ok
+                    and generation == self._generation
+                ):
+                    self._store(key, flight.response)
+            flight.done.set()
+        return self._copy(flight.response)
+
+    def _store(self, key, response):
+        self._entries[key] = (time.monotonic() + self.ttl, response)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, predicate):
+        """Drop every entry whose key matches the predicate"""
+        with self._lock:
+            self._generation += 1
+            for key in [key for key in self._entries if predicate(key)]:
+                del self._entries[key]
+                self.invalidations += 1
+
+    def clear(self):
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self):
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "coalesced": self.coalesced,
+                "invalidations": self.invalidations,
+                "entries": len(self._entries),
+            }
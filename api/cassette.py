@@ -0,0 +1,212 @@
+import base64
+import hashlib
+import json
+import mmap
+import os
+import threading
+import time
+from datetime import timedelta
+from urllib.parse import parse_qsl, urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+
+class CassetteMissError(Exception):
+    """Raised in replay mode when a request has no recorded response"""
+
+
+def normalize_body(body):
+    """Canonical form of a request body so key order and spacing do not matter"""
+    if not body:
+        return ""
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    try:
+        return json.dumps(json.loads(body), sort_keys=True, separators=(",", ":"))
+    except ValueError:
+        return "&".join(f"{k}={v}" for k, v in sorted(parse_qsl(body)))
+
+
+def request_key(method, url, body):
+    """Match key: method, path, sorted query params and normalized body"""
+    parts = urlsplit(url)
+    params = sorted(parse_qsl(parts.query, keep_blank_values=True))
+    raw = json.dumps([method.upper(), parts.path, params, normalize_body(body)])
+    return hashlib.sha1(raw.encode()).hexdigest()
+
+
+class Cassette:
+    """Append-only file of recorded interactions, one line per response
+
+    Each line is "<key>\\t<json>". Replay memory-maps the file and only reads
+    the key prefixes up front; a response's JSON is parsed when it is used.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._index = None
+        self._mmap = None
+        self._file = None
+        self._writer = None
+        self._played = {}
+        self._lock = threading.Lock()
+
+    @property
+    def exists(self):
+        return os.path.exists(self.path) and os.path.getsize(self.path) > 0
+
+    def _load_index(self):
+        """Map each key to the (start, end) offsets of its recorded responses"""
+        self._index = {}
+        if not self.exists:
+            return
+        self._file = open(self.path, "rb")
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        position, size = 0, len(self._mmap)
+        while position < size:
+            end = self._mmap.find(b"\n", position)
+            end = size if end == -1 else end
+            tab = self._mmap.find(b"\t", position, end)
+            if tab != -1:
+                key = self._mmap[position:tab].decode()
+                self._index.setdefault(key, []).append((tab + 1, end))
+            position = end + 1
+
+    def play(self, key):
+        """Next recorded response for the key; the last one repeats when exhausted"""
+        with self._lock:
+            if self._index is None:
+                self._load_index()
+            offsets = self._index.get(key)
+            if not offsets:
+                return None, False
+            count = self._played.get(key, 0)
+            self._played[key] = count + 1
+            start, end = offsets[min(count, len(offsets) - 1)]
+            return json.loads(self._mmap[start:end]), count >= len(offsets)
+
+    def record(self, key, interaction):
+        line = f"{key}\t{json.dumps(interaction, separators=(',', ':'))}\n"
+        with self._lock:
+            if self._writer is None:
+                os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+                self._writer = open(self.path, "a", encoding="utf-8")
+            self._writer.write(line)
+            self._writer.flush()
+
+    def truncate(self):
+        """Start a fresh recording"""
+        self.close()
+        if os.path.exists(self.path):
+            os.remove(self.path)
+        self._index = None
+        self._played.clear()
+
+    def close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+        if self._mmap is not None:
+            self._mmap.close()
+            self._file.close()
+            self._mmap = self._file = None
+        # Re-read lazily on next use; play positions are kept
+        self._index = None
+
+
+def _serialize_response(response):
+    content = response.content
+    interaction = {
+        "status": response.status_code,
+        "reason": response.reason,
+        "headers": dict(response.headers),
+    }
+    try:
+        interaction["body"] = content.decode("utf-8")
+    except UnicodeDecodeError:
+        interaction["body_b64"] = base64.b64encode(content).decode()
+    return interaction
+
+
+def _serialize_request(request, started):
+    """What was sent and when, so recorded traffic can be replayed as load"""
+    body = request.body
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", errors="replace")
+    return {
+        "method": request.method,
+        "url": request.url,
+        "headers": {
+            name: value
+            for name, value in request.headers.items()
+            if name.lower() in ("content-type", "accept")
+        },
+        "body": body or "",
+        "started": started,
+        "session": threading.current_thread().name,
+    }
+
+
+def _build_response(request, interaction):
+    response = requests.Response()
+    response.status_code = interaction["status"]
+    response.reason = interaction["reason"]
+    response.headers = CaseInsensitiveDict(interaction["headers"])
+    # Content-Encoding was already undone when the body was recorded
+    response.headers.pop("Content-Encoding", None)
+    if "body_b64" in interaction:
+        response._content = base64.b64decode(interaction["body_b64"])
+    else:
+        response._content = interaction["body"].encode("utf-8")
+    # Lets iter_content() stream the recorded body instead of reading raw
+    response._content_consumed = True
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+    response.url = request.url
+    response.request = request
+    response.elapsed = timedelta(0)
+    return response
+
+
+class CassetteAdapter(HTTPAdapter):
+    """Transport adapter recording to or replaying from a Cassette
+
+    record - always hit the network and write a fresh cassette
+    replay - never hit the network; unmatched requests raise CassetteMissError
+    auto   - replay what is recorded, record anything new
+    """
+
+    MODES = ("record", "replay", "auto")
+
+    def __init__(self, cassette, mode="auto", **kwargs):
+        if mode not in self.MODES:
+            raise ValueError(f"Unsupported cassette mode: {mode}")
+        super().__init__(**kwargs)
+        self.cassette = cassette
+        self.mode = mode
+        if mode == "record":
+            cassette.truncate()
+
+    def send(self, request, **kwargs):
+        key = request_key(request.method, request.url, request.body)
+
+        if self.mode != "record":
+            interaction, exhausted = self.cassette.play(key)
+            if interaction is not None and (self.mode == "replay" or not exhausted):
+                return _build_response(request, interaction)
+            if self.mode == "replay":
+                raise CassetteMissError(
+                    f"No recorded response for {request.method} {request.url}"
+                )
+
+        started = time.time()
+        response = super().send(request, **kwargs)
+        interaction = _serialize_response(response)
+        interaction["request"] = _serialize_request(request, started)
+        self.cassette.record(key, interaction)
+        return response
+
+    def close(self):
+        super().close()
+        self.cassette.close()
@@ -0,0 +1,74 @@
+import json
+
+try:
+    import orjson
+except ImportError:  # optional fast backend
+    orjson = None
+
+from requests.exceptions import JSONDecodeError as RequestsJSONDecodeError
+from config.config import ConfigApi
+
+
+class JsonCodec:
+    """Standard library JSON"""
+
+    name = "json"
+
+    @staticmethod
+    def encode(obj):
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":")).encode()
+
+    @staticmethod
+    def decode(data):
+        return json.loads(data)
+
+
+class OrjsonCodec:
+    """orjson backend, several times faster on large payloads"""
+
+    name = "orjson"
+
+    @staticmethod
+    def encode(obj):
+        return orjson.dumps(obj)
+
+    @staticmethod
+    def decode(data):
+        return orjson.loads(data)
+
+
+CODECS = {JsonCodec.name: JsonCodec}
+if orjson is not None:
+    CODECS[OrjsonCodec.name] = OrjsonCodec
+
+
+def get_codec(name=None):
+    """Return the named codec, or the fastest installed one for "auto" """
+    name = name or ConfigApi.JSON_CODEC
+    if name == "auto":
+        return CODECS.get(OrjsonCodec.name, JsonCodec)
+    if name not in CODECS:
+        raise ValueError(f"JSON codec not available: {name}")
+    return CODECS[name]
+
+
+def install_cached_json(response, codec):
+    """Replace response.json() with a codec-backed version that parses only once
+
+    Repeated calls on this response return the same decoded object, so it is
+    only installed on responses owned by a single caller; ResponseCache hands
+    out copies without it. Invalid bodies raise requests' JSONDecodeError, like
+    the json() it replaces.
+    """
+    decoded = []
+
+    def _json(**kwargs):
+        if not decoded:
+            try:
+                decoded.append(codec.decode(response.content))
+            except json.JSONDecodeError as e:
+                raise RequestsJSONDecodeError(e.msg, e.doc, e.pos)
+        return decoded[0]
+
+    response.json = _json
+    return response
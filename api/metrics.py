@@ -0,0 +1,70 @@
+import re
+import threading
+from utils.latency import LatencyHistogram
+
+_ID_SEGMENT = re.compile(r"/\d+(?=/|$)")
+
+
+def endpoint_label(method, endpoint):
+    """Collapse numeric path segments so /pet/123 and /pet/456 share stats"""
+    return f"{method} {_ID_SEGMENT.sub('/{id}', endpoint)}"
+
+
+class EndpointLatency:
+    """Latency histograms for one endpoint
+
+    total   - wall time seen by the caller, including reading the body
+    server  - time until response headers arrived (requests' Response.elapsed)
+    connect - time to open a new connection, when the client reports it
+    """
+
+    def __init__(self):
+        self.total = LatencyHistogram()
+        self.server = LatencyHistogram()
+        self.connect = LatencyHistogram()
+        self.errors = 0
+
+    def summary(self):
+        return {
+            "total": self.total.summary(),
+            "server": self.server.summary(),
+            "connect": self.connect.summary(),
+            "errors": self.errors,
+        }
+
+
+class LatencyRecorder:
+    """Thread-safe per-endpoint latency collection for API clients"""
+
+    def __init__(self):
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+    def record(self, method, endpoint, total, server=None, connect=None, error=False):
+        label = endpoint_label(method, endpoint)
+        with self._lock:
+            stats = self.endpoints.get(label)
+            if stats is None:
+                stats = self.endpoints[label] = EndpointLatency()
+            stats.total.record(total)
+            if server is not None:
+                stats.server.record(server)
+            if connect is not None:
+                stats.connect.record(connect)
+            if error:
+                stats.errors += 1
+
+    def reset(self):
+        with self._lock:
+            self.endpoints.clear()
+
+    def summary(self):
+        with self._lock:
+            return {
+                label: stats.summary()
+                for label, stats in sorted(self.endpoints.items())
+            }
+
+
+# Shared by every client so the session report covers all API traffic
+default_recorder = LatencyRecorder()
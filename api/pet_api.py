@@ -1,19 +1,36 @@
 from api.base_api import BaseAPI
+from api.bulk import run_bulk
+from utils.json_stream import iter_json_array
+from config.config import ConfigApi
 
 
 class PetAPI(BaseAPI):
-    def __init__(self):
-        super().__init__()
+    def __init__(self, cache=None, transport=None):
+        super().__init__(cache, transport=transport)
         self.endpoint = "/pet"
 
+    def invalidate_pet(self, pet_id):
+        """Drop cached reads of this pet and every cached find result"""
+        if self.cache is None:
+            return
+        pet_url = f"{self.base_url}{self.endpoint}/{pet_id}"
+        find_url = f"{self.base_url}{self.endpoint}/findBy"
+        self.cache.invalidate(
+            lambda key: key[1] == pet_url or key[1].startswith(find_url)
+        )
+
     def create_pet(self, pet_data):
-        return self.post(self.endpoint, json=pet_data)
+        response = self.post(self.endpoint, json=pet_data)
+        self.invalidate_pet(pet_data.get("id"))
+        return response
 
     def get_pet_by_id(self, pet_id):
         return self.get(f"{self.endpoint}/{pet_id}")
 
     def update_pet(self, pet_data):
-        return self.put(self.endpoint, json=pet_data)
+        response = self.put(self.endpoint, json=pet_data)
+        self.invalidate_pet(pet_data.get("id"))
+        return response
 
     def update_pet_with_form(self, pet_id, name=None, status=None):
         form_data = {}
@@ -23,13 +40,54 @@ class PetAPI(BaseAPI):
             form_data["status"] = status
 
         headers = {"Content-Type": "application/x-www-form-urlencoded"}
-        return self.post(f"{self.endpoint}/{pet_id}", data=form_data, headers=headers)
+        response = self.post(
+            f"{self.endpoint}/{pet_id}", data=form_data, headers=headers
+        )
+        self.invalidate_pet(pet_id)
+        return response
 
     def delete_pet(self, pet_id):
-        return self.delete(f"{self.endpoint}/{pet_id}")
+        response = self.delete(f"{self.endpoint}/{pet_id}")
+        self.invalidate_pet(pet_id)
+        return response
 
     def find_pets_by_status(self, status):
         return self.get(f"{self.endpoint}/findByStatus", params={"status": status})
 
     def find_pets_by_tags(self, tags):
         return self.get(f"{self.endpoint}/findByTags", params={"tags": tags})
+
+    def iter_pets_by_status(self, status, chunk_size=ConfigApi.STREAM_CHUNK_SIZE):
+        """Stream pets one at a time; closing the iterator early drops the rest"""
+        return self._iter_pets(
+            f"{self.endpoint}/findByStatus", {"status": status}, chunk_size
+        )
+
+    def iter_pets_by_tags(self, tags, chunk_size=ConfigApi.STREAM_CHUNK_SIZE):
+        """Stream pets one at a time; closing the iterator early drops the rest"""
+        return self._iter_pets(
+            f"{self.endpoint}/findByTags", {"tags": tags}, chunk_size
+        )
+
+    def _iter_pets(self, endpoint, params, chunk_size):
+        response = self.get(endpoint, params=params, stream=True)
+        try:
+            response.raise_for_status()
+            yield from iter_json_array(response.iter_content(chunk_size))
+        finally:
+            response.close()
+
+    def create_pets(self, pets, concurrency=None):
+        return run_bulk(
+            self.create_pet, pets, concurrency or ConfigApi.BULK_CONCURRENCY
+        )
+
+    def get_pets(self, pet_ids, concurrency=None):
+        return run_bulk(
+            self.get_pet_by_id, pet_ids, concurrency or ConfigApi.BULK_CONCURRENCY
+        )
+
+    def delete_pets(self, pet_ids, concurrency=None):
+        return run_bulk(
+            self.delete_pet, pet_ids, concurrency or ConfigApi.BULK_CONCURRENCY
+        )
@@ -0,0 +1,103 @@
+import threading
+import time
+from collections import deque
+from config.config import ConfigApi
+from utils.test_data import TestDataFactory
+
+
+class PetPool:
+    """Pets created ahead of time so fixtures can take one without a round trip
+
+    A background thread tops the pool up to size with a bulk create whenever
+    it falls to low_water. acquire() falls back to creating a pet inline when
+    the pool is empty or disabled (size=0). Pets never handed out are deleted
+    by close(), or handed to reaper when one is given.
+    """
+
+    def __init__(
+        self,
+        pet_api,
+        factory=TestDataFactory.valid_pet,
+        size=ConfigApi.PET_POOL_SIZE,
+        low_water=ConfigApi.PET_POOL_LOW_WATER,
+        reaper=None,
+    ):
+        self.pet_api = pet_api
+        self.factory = factory
+        self.size = size
+        self.low_water = low_water
+        self.reaper = reaper
+        self._ready = deque()
+        self._condition = threading.Condition()
+        self._closed = False
+        self._thread = None
+        self.created = 0
+        self.handed_out = 0
+        self.misses = 0
+
+    def start(self):
+        if self.size:
+            self._thread = threading.Thread(
+                target=self._refill, name="pet-pool", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def _refill(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or len(self._ready) <= self.low_water
+                )
+                if self._closed:
+                    return
+                missing = self.size - len(self._ready)
+
+            result = self.pet_api.create_pets([self.factory() for _ in range(missing)])
+            pets = [item.response.json() for item in result if item.ok]
+            with self._condition:
+                self._ready.extend(pets)
+                self.created += len(pets)
+                self._condition.notify_all()
+            if not pets:
+                # Target is failing; do not spin on it
+                time.sleep(1)
+
+    def acquire(self, timeout=ConfigApi.PET_POOL_TIMEOUT):
+        """A created pet's data, owned by the caller from now on"""
+        with self._condition:
+            if self._thread is not None and not self._closed:
+                self._condition.wait_for(lambda: self._ready, timeout)
+            if self._ready:
+                self.handed_out += 1
+                pet = self._ready.popleft()
+                self._condition.notify_all()
+                return pet
+            self.misses += 1
+
+        response = self.pet_api.create_pet(self.factory())
+        return response.json()
+
+    def stats(self):
+        with self._condition:
+            return {
+                "ready": len(self._ready),
+                "created": self.created,
+                "handed_out": self.handed_out,
+                "misses": self.misses,
+            }
+
+    def close(self):
+        """Stop refilling and delete the pets nobody took"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        leftovers = [pet["id"] for pet in self._ready]
+        self._ready.clear()
+        if self.reaper is not None:
+            self.reaper.register(*leftovers)
+        elif leftovers:
+            self.pet_api.delete_pets(leftovers)
+        return leftovers
@@ -0,0 +1,101 @@
+import threading
+import time
+from config.config import ConfigApi
+
+# Worth another attempt: throttling and server-side errors
+TRANSIENT_STATUSES = {429, 500, 502, 503, 504}
+
+
+class PetReaper:
+    """Deletes pets registered by fixtures, in concurrent batches off the test path
+
+    batch_size - pending ids that trigger a background flush
+    interval   - seconds between background flushes; None deletes only on
+                 flush() and close()
+    retries    - extra attempts for transient failures, with doubling backoff
+
+    A pet counts as cleaned once DELETE answers 200 or 404. Ids that still fail
+    are kept in failed with the last status or error.
+    """
+
+    def __init__(
+        self,
+        pet_api,
+        batch_size=ConfigApi.REAPER_BATCH_SIZE,
+        interval=ConfigApi.REAPER_INTERVAL,
+        retries=ConfigApi.REAPER_RETRIES,
+        backoff=0.5,
+    ):
+        self.pet_api = pet_api
+        self.batch_size = batch_size
+        self.interval = interval
+        self.retries = retries
+        self.backoff = backoff
+        self.deleted = 0
+        self.failed = {}
+        self._pending = []
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._closed = False
+        self._thread = None
+
+    def start(self):
+        if self.interval is not None:
+            self._thread = threading.Thread(
+                target=self._run, name="pet-reaper", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def register(self, *pet_ids):
+        with self._condition:
+            self._pending.extend(pet_ids)
+            if len(self._pending) >= self.batch_size:
+                self._condition.notify_all()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                self._condition.wait_for(
+                    lambda: self._closed or len(self._pending) >= self.batch_size,
+                    self.interval,
+                )
+                if self._closed:
+                    return
+            self.flush()
+
+    def flush(self):
+        """Delete everything registered so far"""
+        with self._flush_lock:
+            with self._condition:
+                pending, self._pending = self._pending, []
+            for start in range(0, len(pending), self.batch_size):
+                self._delete(pending[start : start + self.batch_size])
+
+    def _delete(self, pet_ids):
+        for attempt in range(self.retries + 1):
+            if attempt:
+                time.sleep(self.backoff * 2 ** (attempt - 1))
+            retry = []
+            for item in self.pet_api.delete_pets(pet_ids):
+                status = item.response.status_code if item.error is None else None
+                if status in (200, 404):
+                    self.deleted += 1
+                    self.failed.pop(item.argument, None)
+                    continue
+                self.failed[item.argument] = status or repr(item.error)
+                if status is None or status in TRANSIENT_STATUSES:
+                    retry.append(item.argument)
+            if not retry:
+                return
+            pet_ids = retry
+
+    def close(self):
+        """Stop the background flushes, delete what is left and return failures"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        if self._thread is not None:
+            self._thread.join()
+        self.flush()
+        return self.failed
@@ -0,0 +1,38 @@
+"""Compare JSON codecs on Pet API payloads
+
+Run from the project root:
+    python -m benchmarks.bench_codec
+"""
+
+import timeit
+from api.codec import CODECS
+from utils.test_data import PetDataBuilder, TestDataFactory
+
+
+def find_by_status_payload(count=5000):
+    """A findByStatus-sized list of pets"""
+    return [
+        PetDataBuilder()
+        .with_id(i)
+        .with_name(f"Pet{i}")
+        .with_status("available")
+        .with_category(1, "Dogs")
+        .with_tags(["friendly", "trained"])
+        .build()
+        for i in range(count)
+    ]
+
+
+def bench(label, payload, number):
+    print(f"\n{label} ({number} iterations)")
+    print(f"{'codec':<10}{'encode us':>12}{'decode us':>12}")
+    for name, codec in CODECS.items():
+        encoded = codec.encode(payload)
+        encode = timeit.timeit(lambda: codec.encode(payload), number=number)
+        decode = timeit.timeit(lambda: codec.decode(encoded), number=number)
+        print(f"{name:<10}{encode / number * 1e6:>12.1f}{decode / number * 1e6:>12.1f}")
+
+
+if __name__ == "__main__":
+    bench("TestDataFactory.valid_pet()", TestDataFactory.valid_pet(), 20000)
+    bench("findByStatus, 5000 pets", find_by_status_payload(), 20)
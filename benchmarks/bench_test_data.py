@@ -0,0 +1,72 @@
+"""Bulk pet generation: PetDataBuilder loop against TestDataFactory.many()
+
+Run from the project root:
+    python -m benchmarks.bench_test_data [count]
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from utils.test_data import (
+    CATEGORIES,
+    PET_NAMES,
+    STATUSES,
+    TAGS,
+    PetDataBuilder,
+    TestDataFactory,
+)
+
+
+def builder_loop(count, seed=0):
+    """The same kind of pets, one fluent chain each"""
+    rng = random.Random(seed)
+    return [
+        PetDataBuilder()
+        .with_id(i + 1)
+        .with_name(rng.choice(PET_NAMES))
+        .with_status(rng.choice(STATUSES))
+        .with_category(*rng.choice(CATEGORIES))
+        .with_tags(rng.sample(TAGS, rng.randint(0, len(TAGS))))
+        .with_photo_urls([f"https://example.com/pets/{i + 1}.jpg"])
+        .build()
+        for i in range(count)
+    ]
+
+
+def builder_jsonl(count, path):
+    with open(path, "w", encoding="utf-8") as f:
+        for pet in builder_loop(count):
+            f.write(json.dumps(pet, ensure_ascii=False) + "\n")
+
+
+def measure(label, func):
+    """Time one untraced run, then take peak memory from a traced one"""
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(f"{label:<40}{seconds:>10.3f}{peak / 2**20:>12.1f}")
+
+
+if __name__ == "__main__":
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 100000
+    path = os.path.join(tempfile.mkdtemp(), "pets.jsonl")
+    print(f"{count} pets")
+    print(f"{'':<40}{'seconds':>10}{'peak MiB':>12}")
+    measure("builder loop, list of dicts", lambda: builder_loop(count))
+    measure("many(), columnar batch", lambda: TestDataFactory.many(count, first_id=1))
+    batch = TestDataFactory.many(count, first_id=1)
+    measure("many(), iterate as dicts", lambda: sum(1 for _ in batch))
+    measure("builder loop + json.dumps to JSONL", lambda: builder_jsonl(count, path))
+    measure(
+        "many() + write_jsonl()",
+        lambda: TestDataFactory.many(count, first_id=1).write_jsonl(path),
+    )
+    os.remove(path)
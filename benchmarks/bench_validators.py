@@ -0,0 +1,101 @@
+"""Cost of validating n11 search responses compared to request latency
+
+Run from the project root:
+    python -m benchmarks.bench_validators
+"""
+
+import asyncio
+import statistics
+import time
+import timeit
+from loadgen.runner import Sample, new_session, send_sample
+from loadgen.validators import SearchResultsValidator
+from utils.n11_server import N11Server, render_search_page
+
+# Order of magnitude of a real n11 /arama response over the internet
+REMOTE_LATENCY = 0.2
+
+# Navigation, inline scripts and styles around the results, so the page is
+# closer to the ~300 KB a real /arama response weighs
+PAGE_CHROME = (
+    "<header>"
+    + '<nav><a class="menu" href="/kategori">Kategori</a></nav>' * 400
+    + "<script>"
+    + "var x = 1;" * 5000
+    + "</script>"
+    + "<style>"
+    + ".c{color:red}" * 5000
+    + "</style></header>"
+)
+
+
+def realistic_page(query, result_count):
+    page = render_search_page(query, result_count)
+    return page.replace("<body>", "<body>" + PAGE_CHROME).encode()
+
+
+def local_latency(count=200):
+    """Median seconds per /arama request to the local stand-in"""
+
+    async def measure(base_url):
+        async with new_session({}) as session:
+            samples = [
+                await send_sample(
+                    session, "GET", f"{base_url}/arama?q=laptop", "s", "t"
+                )
+                for _ in range(count)
+            ]
+        return statistics.median(sample.elapsed for sample in samples)
+
+    with N11Server() as server:
+        return asyncio.run(measure(server.base_url))
+
+
+def bench(label, body, query, number, latency):
+    validator = SearchResultsValidator()
+    sample = _sample(query, body)
+    seconds = timeit.timeit(lambda: validator(sample), number=number) / number
+    print(
+        f"{label:<34}{len(body) / 1024:>9.1f}{seconds * 1e6:>12.1f}"
+        f"{seconds / latency * 100:>10.2f}{seconds / REMOTE_LATENCY * 100:>11.3f}"
+    )
+
+
+def _sample(query, body):
+    url = f"http://localhost/arama?q={query}"
+    return Sample("s", time.time(), 0, 0, 200, True, len(body), url, "t", body=body)
+
+
+if __name__ == "__main__":
+    latency = local_latency()
+    print(f"Median local /arama latency: {latency * 1e6:.0f} us")
+    print(f"Reference remote latency: {REMOTE_LATENCY * 1000:.0f} ms\n")
+    print(f"{'page':<34}{'KB':>9}{'check us':>12}{'% local':>10}{'% remote':>11}")
+    bench(
+        "results (stand-in)",
+        render_search_page("laptop", 1234).encode(),
+        "laptop",
+        2000,
+        latency,
+    )
+    bench(
+        "no results (stand-in)",
+        render_search_page("x", 0).encode(),
+        "zxywvut-nonexistent",
+        2000,
+        latency,
+    )
+    bench(
+        "results, full page chrome",
+        realistic_page("laptop", 1234),
+        "laptop",
+        50,
+        latency,
+    )
+    bench(
+        "error page, full page chrome",
+        realistic_page("x", 0).replace(b"notFoundContainer", b"x"),
+        "laptop",
+        50,
+        latency,
+    )
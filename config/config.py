@@ -1,12 +1,52 @@
 """Configuration management for API tests"""
 
+import os
+
 
 class ConfigApi:
     BASE_URL = "https://petstore.swagger.io/v2"
     TIMEOUT = 10
     HEADERS = {"Content-Type": "application/json", "Accept": "application/json"}
+    # Max open connections per client session
+    POOL_SIZE = 50
+    # Default worker count for PetAPI bulk operations
+    BULK_CONCURRENCY = 20
+    # Opt-in GET response cache (enabled with --api-cache)
+    CACHE_TTL = 30
+    CACHE_MAX_ENTRIES = 256
+    # Bytes read per chunk by the streaming find iterators
+    STREAM_CHUNK_SIZE = 64 * 1024
+    # "auto" picks orjson when installed, else the stdlib json module
+    JSON_CODEC = "auto"
+    # Pets kept pre-created for fixtures; refilled when down to the low-water mark
+    PET_POOL_SIZE = 10
+    PET_POOL_LOW_WATER = 3
+    # Seconds acquire() waits for a refill before creating a pet itself
+    PET_POOL_TIMEOUT = 10
+    # Deferred pet cleanup: batch size, seconds between flushes, retries per pet
+    REAPER_BATCH_SIZE = 50
+    REAPER_INTERVAL = 2
+    REAPER_RETRIES = 3
 
 
 class ConfigUI:
     BASE_URL = "https://useinsider.com/"
     QA_CAREERS_URL = "https://useinsider.com/careers/quality-assurance/"
+    # Browser sessions kept per worker, and tests each serves before relaunching
+    BROWSER_POOL_SIZE = 1
+    BROWSER_MAX_USES = 20
+    # Resolved driver binaries, re-checked online once a day
+    DRIVER_CACHE_PATH = os.path.join(
+        os.path.expanduser("~"), ".cache", "ui-tests", "drivers.json"
+    )
+    DRIVER_CACHE_MAX_AGE = 24 * 60 * 60
+    # Seconds without DOM changes after which a re-rendering element counts as loaded
+    DOM_QUIET_SECONDS = 0.5
+    # Page waits: default timeout, first poll interval and the cap it backs off to
+    WAIT_TIMEOUT = 60
+    WAIT_FIRST_POLL = 0.05
+    WAIT_MAX_POLL = 1.0
+    # find_elements() gives up and returns [] after this many seconds
+    FIND_ELEMENTS_TIMEOUT = 10
+    # WebDriver's default script timeout, restored after in-page waits change it
+    SCRIPT_TIMEOUT = 30
@@ -0,0 +1,135 @@
+"""Run a JMeter plan without a JVM
+
+python -m loadgen jmeter/test_n11.jmx --threads 50 --loops 100
+python -m loadgen jmeter/test_n11.jmx --arrival poisson --rate 200 --duration 60
+python -m loadgen jmeter/test_n11.jmx --arrival constant --rate 2000 --duration 60 --workers 8
+"""
+
+import argparse
+import contextlib
+from loadgen.arrival import build_schedule
+from loadgen.distributed import DistributedRunner
+from loadgen.jmx import parse_jmx
+from loadgen.jtl import JtlWriter
+from loadgen.validators import SearchResultsValidator
+from loadgen.open_model import OpenModelRunner
+from loadgen.runner import LoadRunner
+
+
+def _steps(text):
+    """Parse "10:30,20:30" into [(10.0, 30.0), (20.0, 30.0)]"""
+    return [tuple(float(x) for x in step.split(":")) for step in text.split(",")]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="loadgen",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("jmx", help="JMeter test plan")
+    parser.add_argument("--base-url", help="Target instead of HTTP Request Defaults")
+    parser.add_argument("--threads", type=int, help="Override thread count")
+    parser.add_argument("--loops", type=int, help="Override loop count")
+    parser.add_argument(
+        "--timer-scale",
+        type=float,
+        default=1.0,
+        help="Multiply timer delays (0 disables think time)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        help="Spread the run over this many processes (0 = one per core)",
+    )
+    parser.add_argument(
+        "--csv", help="Feed this file (e.g. from loadgen.corpus) to the CSV data sets"
+    )
+    parser.add_argument(
+        "--validate",
+        action="store_true",
+        help="Fail /arama samples that are not real result or no-result pages",
+    )
+    parser.add_argument(
+        "--jtl", help="Write every sample to this CSV JTL (single process only)"
+    )
+    open_model = parser.add_argument_group(
+        "open model", "start iterations at a target arrival rate instead of looping"
+    )
+    open_model.add_argument(
+        "--arrival", choices=["constant", "ramp", "poisson", "step"]
+    )
+    open_model.add_argument("--rate", type=float, help="Iterations per second")
+    open_model.add_argument("--end-rate", type=float, help="Final rate for ramp")
+    open_model.add_argument("--duration", type=float, help="Seconds to schedule")
+    open_model.add_argument("--steps", type=_steps, help='"rate:seconds,..." for step')
+    open_model.add_argument(
+        "--max-in-flight", type=int, help="Cap on concurrent iterations"
+    )
+    args = parser.parse_args(argv)
+    distributed = args.workers is not None
+    if distributed and args.jtl:
+        parser.error("--jtl cannot be combined with --workers")
+
+    schedule = None
+    if args.arrival:
+        try:
+            schedule = build_schedule(
+                args.arrival, args.rate, args.duration, args.end_rate, args.steps
+            )
+        except ValueError as e:
+            parser.error(str(e))
+
+    with contextlib.ExitStack() as stack:
+        listeners = [stack.enter_context(JtlWriter(args.jtl))] if args.jtl else []
+        _run(args, schedule, distributed, listeners)
+
+
+def _run(args, schedule, distributed, listeners):
+    validators = [SearchResultsValidator()] if args.validate else []
+    if schedule is not None:
+        options = {
+            "base_url": args.base_url,
+            "max_in_flight": args.max_in_flight,
+            "validators": validators,
+        }
+        if distributed:
+            runner = DistributedRunner(
+                args.jmx, args.workers, schedule=schedule, csv_file=args.csv, **options
+            )
+        else:
+            runner = OpenModelRunner(
+                parse_jmx(args.jmx, args.csv), schedule, listeners=listeners, **options
+            )
+        result = runner.run()
+        print(result.format_table())
+        print(
+            f"\n{result.scheduled} iterations in {result.duration:.2f}s "
+            f"({result.achieved_rate:.1f}/s)"
+        )
+        return
+
+    options = {
+        "base_url": args.base_url,
+        "timer_scale": args.timer_scale,
+        "loops": args.loops,
+        "validators": validators,
+    }
+    if distributed:
+        runner = DistributedRunner(
+            args.jmx, args.workers, threads=args.threads, csv_file=args.csv, **options
+        )
+    else:
+        runner = LoadRunner(
+            parse_jmx(args.jmx, args.csv),
+            threads=args.threads,
+            listeners=listeners,
+            **options,
+        )
+    result = runner.run()
+    print(result.format_table())
+    print(f"\n{result.count} samples in {result.duration:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
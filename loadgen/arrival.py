@@ -0,0 +1,120 @@
+"""Arrival schedules for open-model load: when each iteration should start
+
+A schedule iterates over start offsets in seconds from the beginning of the
+run. Offsets do not depend on how fast the target answers, which is what
+makes the model "open".
+"""
+
+import abc
+import itertools
+import math
+import random
+
+
+class ArrivalSchedule(abc.ABC):
+    @abc.abstractmethod
+    def offsets(self):
+        """Start offsets in seconds, in increasing order"""
+
+    def __iter__(self):
+        return iter(self.offsets())
+
+    def partition(self, parts, index):
+        """Every parts-th arrival starting at index, for splitting across workers"""
+        return itertools.islice(self.offsets(), index, None, parts)
+
+
+class ConstantRate(ArrivalSchedule):
+    """Evenly spaced arrivals at rate per second"""
+
+    def __init__(self, rate, duration):
+        self.rate = rate
+        self.duration = duration
+
+    def offsets(self):
+        for i in range(int(self.rate * self.duration)):
+            yield i / self.rate
+
+
+class RampRate(ArrivalSchedule):
+    """Rate changing linearly from start_rate to end_rate over duration"""
+
+    def __init__(self, start_rate, end_rate, duration):
+        self.start_rate = start_rate
+        self.end_rate = end_rate
+        self.duration = duration
+
+    def offsets(self):
+        r0, d = self.start_rate, self.duration
+        slope = (self.end_rate - r0) / d
+        total = int(r0 * d + slope * d * d / 2)
+        for k in range(total):
+            # Solve r0*t + slope*t^2/2 = k for t
+            if slope == 0:
+                yield k / r0
+            else:
+                yield (-r0 + math.sqrt(max(0.0, r0 * r0 + 2 * slope * k))) / slope
+
+
+class PoissonRate(ArrivalSchedule):
+    """Random arrivals with exponential gaps averaging rate per second"""
+
+    def __init__(self, rate, duration, seed=None):
+        self.rate = rate
+        self.duration = duration
+        self.seed = seed
+
+    def offsets(self):
+        rng = random.Random(self.seed)
+        offset = rng.expovariate(self.rate)
+        while offset < self.duration:
+            yield offset
+            offset += rng.expovariate(self.rate)
+
+
+class StepRate(ArrivalSchedule):
+    """Constant rate held for each (rate, duration) step in turn"""
+
+    def __init__(self, steps):
+        self.steps = steps
+
+    def offsets(self):
+        start = 0.0
+        for rate, duration in self.steps:
+            for i in range(int(rate * duration)):
+                yield start + i / rate
+            start += duration
+
+
+def _positive(name, value):
+    if value is None or value <= 0:
+        raise ValueError(f"{name} must be greater than 0, got {value}")
+
+
+def build_schedule(profile, rate, duration, end_rate=None, steps=None, seed=None):
+    """Schedule from command line style arguments
+
+    Raises ValueError for an unknown profile or rates and durations that
+    cannot make a schedule.
+    """
+    if profile == "step":
+        if not steps:
+            raise ValueError("step profile needs at least one rate:seconds step")
+        for step_rate, step_duration in steps:
+            _positive("step rate", step_rate)
+            _positive("step duration", step_duration)
+        return StepRate(steps)
+    if profile not in ("constant", "ramp", "poisson"):
+        raise ValueError(f"Unsupported arrival profile: {profile}")
+    _positive("duration", duration)
+    if profile == "ramp":
+        end_rate = end_rate if end_rate is not None else rate
+        if rate is None or rate < 0 or end_rate < 0 or rate == end_rate == 0:
+            raise ValueError(
+                f"ramp rates must be 0 or more and not both 0, got {rate} -> {end_rate}"
+            )
+        return RampRate(rate, end_rate, duration)
+    _positive("rate", rate)
+    if profile == "constant":
+        return ConstantRate(rate, duration)
+    return PoissonRate(rate, duration, seed)
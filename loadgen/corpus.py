@@ -0,0 +1,212 @@
+"""Search-term feeds with realistic popularity skew
+
+A fixed vocabulary of queries is ranked and sampled with Zipfian weights, so a
+few head terms dominate (and hit the target's caches) while a long tail
+misses. Some queries get typos, ASCII-folded Turkish letters or special
+characters. Rows are written as they are generated, and the output is a plain
+one-column CSV that CsvFeed reads line by line, so neither side holds the
+corpus in memory.
+
+python -m loadgen.corpus search_terms.csv --rows 5000000 --vocabulary 50000
+"""
+
+import argparse
+import bisect
+import itertools
+import random
+
+PRODUCTS = [
+    "laptop",
+    "telefon",
+    "kulaklık",
+    "ayakkabı",
+    "çanta",
+    "gömlek",
+    "şarj aleti",
+    "saat",
+    "tablet",
+    "televizyon",
+    "buzdolabı",
+    "çamaşır makinesi",
+    "süpürge",
+    "kahve makinesi",
+    "oyuncak",
+    "bebek arabası",
+    "spor ayakkabı",
+    "mont",
+    "etek",
+    "güneş gözlüğü",
+    "parfüm",
+    "kitap",
+    "bisiklet",
+    "koltuk",
+    "halı",
+    "çaydanlık",
+    "ütü",
+    "klavye",
+    "mouse",
+    "monitör",
+]
+BRANDS = [
+    "",
+    "apple",
+    "samsung",
+    "xiaomi",
+    "lenovo",
+    "asus",
+    "philips",
+    "arçelik",
+    "beko",
+    "vestel",
+    "nike",
+    "adidas",
+    "puma",
+    "koton",
+    "defacto",
+    "sony",
+]
+MODIFIERS = [
+    "",
+    "siyah",
+    "beyaz",
+    "kırmızı",
+    "erkek",
+    "kadın",
+    "çocuk",
+    "ucuz",
+    "indirimli",
+    "orijinal",
+    "kablosuz",
+    "büyük beden",
+    "64gb",
+    "128gb",
+    "2024",
+    "ikinci el",
+    "şık",
+    "su geçirmez",
+]
+# Kept free of the CSV delimiter, quotes and line breaks
+SPECIAL = ["!", "@", "#", "$", "%", "^", "&", "*", "(", ")", "+", "?", "/", "-", "'"]
+ASCII_FOLD = str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosuCGIOSU")
+
+
+def vocabulary(size, seed=0):
+    """size distinct queries in a fixed random popularity order"""
+    terms = [
+        " ".join(part for part in (brand, product, modifier) if part)
+        for product, brand, modifier in itertools.product(PRODUCTS, BRANDS, MODIFIERS)
+    ]
+    rng = random.Random(seed)
+    rng.shuffle(terms)
+    # Beyond the combinations, numbered variants keep the tail distinct
+    extra = (f"{terms[i % len(terms)]} {i // len(terms)}" for i in itertools.count())
+    return list(itertools.islice(itertools.chain(terms, extra), size))
+
+
+def zipf_cum_weights(size, exponent):
+    """Cumulative weights of ranks 1..size for P(rank) ~ 1 / rank**exponent"""
+    return list(itertools.accumulate(1 / rank**exponent for rank in range(1, size + 1)))
+
+
+def typo(term, rng):
+    """One keyboard slip: swapped, dropped or doubled letter, or ASCII folding"""
+    if len(term) < 2:
+        return term
+    kind = rng.randrange(4)
+    if kind == 3:
+        folded = term.translate(ASCII_FOLD)
+        if folded != term:
+            return folded
+    i = rng.randrange(len(term) - 1)
+    if kind == 0:
+        return term[:i] + term[i + 1] + term[i] + term[i + 2 :]
+    if kind == 1:
+        return term[:i] + term[i + 1 :]
+    return term[:i] + term[i] + term[i:]
+
+
+def with_special(term, rng):
+    chars = "".join(rng.choices(SPECIAL, k=rng.randint(1, 3)))
+    return f"{term} {chars}" if rng.random() < 0.5 else f"{chars}{term}"
+
+
+class CorpusGenerator:
+    """Stream of search terms with Zipfian popularity
+
+    vocabulary   - distinct base queries
+    exponent     - Zipf exponent; ~1 matches typical search logs, higher
+                   means more traffic on the head terms
+    typo_rate    - share of rows with a typo or folded Turkish letters
+    special_rate - share of rows with special characters added
+    """
+
+    def __init__(
+        self,
+        vocabulary_size=50000,
+        exponent=1.0,
+        typo_rate=0.05,
+        special_rate=0.01,
+        seed=0,
+    ):
+        self.terms = vocabulary(vocabulary_size, seed)
+        self.exponent = exponent
+        self.cum_weights = zipf_cum_weights(len(self.terms), exponent)
+        self.typo_rate = typo_rate
+        self.special_rate = special_rate
+        self.seed = seed
+
+    def head_share(self, fraction):
+        """Expected share of rows drawn from the top fraction of terms"""
+        top = max(1, int(len(self.terms) * fraction))
+        return self.cum_weights[top - 1] / self.cum_weights[-1]
+
+    def terms_stream(self, rows):
+        """rows search terms, generated lazily and repeatable for a seed"""
+        rng = random.Random(self.seed)
+        terms, cum_weights = self.terms, self.cum_weights
+        total = cum_weights[-1]
+        for _ in range(rows):
+            term = terms[bisect.bisect(cum_weights, rng.random() * total)]
+            if rng.random() < self.typo_rate:
+                term = typo(term, rng)
+            if rng.random() < self.special_rate:
+                term = with_special(term, rng)
+            yield term
+
+    def write(self, path, rows, header=None):
+        """Write rows terms to a UTF-8 CSV, one per line"""
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            if header:
+                f.write(header + "\n")
+            for term in self.terms_stream(rows):
+                f.write(term + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m loadgen.corpus",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("output", help="CSV file to write")
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--vocabulary", type=int, default=50000)
+    parser.add_argument("--exponent", type=float, default=1.0, help="Zipf exponent")
+    parser.add_argument("--typo-rate", type=float, default=0.05)
+    parser.add_argument("--special-rate", type=float, default=0.01)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    generator = CorpusGenerator(
+        args.vocabulary, args.exponent, args.typo_rate, args.special_rate, args.seed
+    )
+    generator.write(args.output, args.rows)
+    print(f"{args.rows} rows from {len(generator.terms)} terms -> {args.output}")
+    for fraction in (0.001, 0.01, 0.1):
+        print(
+            f"top {fraction:.1%} of terms: {generator.head_share(fraction):.1%} of rows"
+        )
+
+
+if __name__ == "__main__":
+    main()
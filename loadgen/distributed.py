@@ -0,0 +1,134 @@
+"""Spread one load run over several local worker processes
+
+Each worker parses the plan itself, reads its own slice of every CSV file
+(line i goes to worker i % N), takes every N-th arrival of the schedule (open
+model) or its share of the threads (closed model, at most one worker per
+thread), and sends back histogram state instead of raw samples. The
+coordinator merges those, so percentiles cover the whole run while only a few
+KB cross process boundaries.
+"""
+
+import multiprocessing
+import os
+import time
+
+from loadgen.jmx import parse_jmx
+from loadgen.open_model import OpenModelResult, OpenModelRunner
+from loadgen.runner import LoadRunner, RunResult
+
+
+class _PartitionedSchedule:
+    """The index-th of parts slices of a schedule"""
+
+    def __init__(self, schedule, parts, index):
+        self.schedule = schedule
+        self.parts = parts
+        self.index = index
+
+    def __iter__(self):
+        return self.schedule.partition(self.parts, self.index)
+
+
+def _wait_until(start_at):
+    delay = start_at - time.time()
+    if delay > 0:
+        time.sleep(delay)
+
+
+def _open_model_worker(jmx_path, csv_file, schedule, parts, index, start_at, options):
+    runner = OpenModelRunner(
+        parse_jmx(jmx_path, csv_file),
+        _PartitionedSchedule(schedule, parts, index),
+        feed_partition=(parts, index),
+        **options,
+    )
+    _wait_until(start_at)
+    return runner.run().to_dict()
+
+
+def _closed_model_worker(jmx_path, csv_file, threads, parts, index, start_at, options):
+    runner = LoadRunner(
+        parse_jmx(jmx_path, csv_file),
+        threads=threads,
+        feed_partition=(parts, index),
+        **options,
+    )
+    _wait_until(start_at)
+    return runner.run().to_dict()
+
+
+def _split(total, parts):
+    """Split total into parts that differ by at most one"""
+    return [total // parts + (1 if i < total % parts else 0) for i in range(parts)]
+
+
+class DistributedRunner:
+    """Run a plan on N processes (default: one per core) and merge the results
+
+    schedule - an ArrivalSchedule for open-model runs; without it the plan
+               runs closed-model with its threads divided between workers
+    csv_file - replaces the plan's CSV Data Set files (see parse_jmx)
+    options  - passed to OpenModelRunner / LoadRunner (base_url, timeout, ...)
+    """
+
+    def __init__(
+        self,
+        jmx_path,
+        workers=None,
+        schedule=None,
+        threads=None,
+        csv_file=None,
+        **options,
+    ):
+        self.jmx_path = jmx_path
+        self.csv_file = csv_file
+        self.workers = workers or os.cpu_count() or 1
+        self.schedule = schedule
+        self.threads = threads
+        self.options = options
+        # Time for every worker to import and parse before the common start
+        self.startup_delay = 1.0
+
+    def _jobs(self, start_at):
+        if self.schedule is not None:
+            return _open_model_worker, [
+                (
+                    self.jmx_path,
+                    self.csv_file,
+                    self.schedule,
+                    self.workers,
+                    i,
+                    start_at,
+                    self.options,
+                )
+                for i in range(self.workers)
+            ]
+        threads = self.threads or parse_jmx(self.jmx_path).thread_groups[0].threads
+        # A worker without threads would leave its CSV slice unread, so the
+        # rows are split only between workers that run
+        counts = _split(threads, max(1, min(self.workers, threads)))
+        return _closed_model_worker, [
+            (
+                self.jmx_path,
+                self.csv_file,
+                count,
+                len(counts),
+                i,
+                start_at,
+                self.options,
+            )
+            for i, count in enumerate(counts)
+        ]
+
+    def run(self):
+        start_at = time.time() + self.startup_delay
+        worker, jobs = self._jobs(start_at)
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(len(jobs)) as pool:
+            results = pool.starmap(worker, jobs)
+
+        result_class = OpenModelResult if self.schedule is not None else RunResult
+        merged = result_class()
+        for data in results:
+            merged.merge(result_class.from_dict(data))
+        return merged
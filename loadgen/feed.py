@@ -0,0 +1,60 @@
+"""CSV Data Set Config feeds read lazily, one line at a time"""
+
+
+class CsvFeed:
+    """Rows shared by every virtual user of a run (JMeter shareMode.all)
+
+    At end of file the feed restarts when recycle is on; otherwise it either
+    stops the user (stop_thread) or hands out "<EOF>" like JMeter does.
+    With parts > 1 the feed only yields every parts-th line starting at
+    index, so several worker processes can split one file without overlap.
+    """
+
+    EOF_VALUE = "<EOF>"
+
+    def __init__(self, data_set, parts=1, index=0):
+        self.data_set = data_set
+        self.parts = parts
+        self.index = index
+        self._file = None
+        self._line_number = 0
+        self.rows_read = 0
+
+    def _open(self):
+        self._file = open(self.data_set.filename, encoding=self.data_set.encoding)
+        if self.data_set.ignore_first_line:
+            self._file.readline()
+        self._line_number = 0
+
+    def _next_line(self):
+        """Next line of this partition, or "" at end of file"""
+        while True:
+            line = self._file.readline()
+            if not line:
+                return ""
+            self._line_number += 1
+            if (self._line_number - 1) % self.parts == self.index:
+                return line
+
+    def next_row(self):
+        """Variables for the next row, or None when the user should stop"""
+        if self._file is None:
+            self._open()
+        line = self._next_line()
+        if not line and self.data_set.recycle and self._line_number > self.index:
+            self._open()
+            line = self._next_line()
+        if not line:
+            if self.data_set.stop_thread:
+                return None
+            return {name: self.EOF_VALUE for name in self.data_set.variable_names}
+
+        self.rows_read += 1
+        names = self.data_set.variable_names
+        values = line.rstrip("\r\n").split(self.data_set.delimiter)
+        return dict(zip(names, values + [""] * len(names)))
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,248 @@
+"""Parser for the subset of JMeter .jmx test plans used in jmeter/"""
+
+import os
+import re
+import xml.etree.ElementTree as ET
+from urllib.parse import quote, quote_plus
+
+_VARIABLE = re.compile(r"\$\{(\w+)\}")
+
+
+def substitute(text, variables):
+    """Replace ${NAME} references; unknown names are left as they are"""
+    return _VARIABLE.sub(lambda m: str(variables.get(m.group(1), m.group(0))), text)
+
+
+def _props(element):
+    """Map of direct stringProp/intProp/boolProp children by name"""
+    props = {}
+    for child in element:
+        if child.tag in ("stringProp", "intProp", "longProp"):
+            props[child.get("name")] = child.text or ""
+        elif child.tag == "boolProp":
+            props[child.get("name")] = (child.text or "").strip() == "true"
+    return props
+
+
+class Argument:
+    def __init__(self, name, value, always_encode=False, use_equals=True):
+        self.name = name
+        self.value = value
+        self.always_encode = always_encode
+        self.use_equals = use_equals
+
+    def render(self, variables):
+        value = substitute(self.value, variables)
+        if self.always_encode:
+            value = quote_plus(value)
+        else:
+            # Like JMeter without "URL Encode?": keep &, = and + as typed,
+            # but make the rest safe to put on the wire
+            value = quote(value, safe="&=+")
+        return f"{quote_plus(self.name)}={value}" if self.use_equals else value
+
+
+class Sampler:
+    """HTTP Request sampler
+
+    Samples are labelled with the name as written, ${...} included, so each
+    sampler gets one set of percentiles however many CSV values feed it
+    (JMeter would report every substituted label separately). use_keepalive
+    is not read: virtual users always reuse their connections.
+    """
+
+    def __init__(self, name, method, path, arguments, follow_redirects):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.arguments = arguments
+        self.follow_redirects = follow_redirects
+
+    def url_path(self, variables):
+        """Path plus query string with variables substituted"""
+        path = substitute(self.path, variables)
+        query = "&".join(argument.render(variables) for argument in self.arguments)
+        return f"{path}?{query}" if query else path
+
+
+class CsvDataSet:
+    """CSV Data Set Config"""
+
+    def __init__(
+        self,
+        filename,
+        variable_names,
+        delimiter=",",
+        ignore_first_line=False,
+        recycle=True,
+        stop_thread=False,
+        encoding="utf-8",
+    ):
+        self.filename = filename
+        self.variable_names = variable_names
+        self.delimiter = delimiter
+        self.ignore_first_line = ignore_first_line
+        self.recycle = recycle
+        self.stop_thread = stop_thread
+        self.encoding = encoding
+
+
+class ThreadGroup:
+    def __init__(self, name, threads, ramp_time, loops):
+        self.name = name
+        self.threads = threads
+        self.ramp_time = ramp_time
+        self.loops = loops
+        self.samplers = []
+        self.timers = []
+        self.headers = {}
+        self.csv_data_sets = []
+        self.defaults = {}
+
+    @property
+    def base_url(self):
+        """Scheme, host and port from HTTP Request Defaults"""
+        protocol = self.defaults.get("HTTPSampler.protocol") or "https"
+        domain = self.defaults.get("HTTPSampler.domain") or ""
+        port = self.defaults.get("HTTPSampler.port")
+        return f"{protocol}://{domain}{f':{port}' if port else ''}"
+
+
+class TestPlan:
+    def __init__(self, name, thread_groups):
+        self.name = name
+        self.thread_groups = thread_groups
+
+
+def _arguments(element):
+    arguments = []
+    for arg in element.iter("elementProp"):
+        if arg.get("elementType") != "HTTPArgument":
+            continue
+        props = _props(arg)
+        arguments.append(
+            Argument(
+                props.get("Argument.name", ""),
+                props.get("Argument.value", ""),
+                props.get("HTTPArgument.always_encode", False),
+                props.get("HTTPArgument.use_equals", True),
+            )
+        )
+    return arguments
+
+
+def _children(hash_tree):
+    """(element, its hashTree) pairs of a JMeter hashTree"""
+    items = list(hash_tree)
+    for i, element in enumerate(items):
+        if element.tag == "hashTree":
+            continue
+        subtree = items[i + 1] if i + 1 < len(items) else None
+        if subtree is not None and subtree.tag != "hashTree":
+            subtree = None
+        yield element, subtree
+
+
+class _Scope:
+    """Config elements collected while walking the tree"""
+
+    def __init__(self):
+        self.timers = []
+        self.headers = {}
+        self.csv_data_sets = []
+        self.defaults = {}
+
+
+def _collect(hash_tree, scope, base_dir, samplers, thread_groups):
+    for element, subtree in _children(hash_tree):
+        if element.get("enabled") == "false":
+            continue
+        props = _props(element)
+        tag = element.tag
+
+        if tag == "ConstantTimer":
+            scope.timers.append(int(props.get("ConstantTimer.delay") or 0) / 1000)
+        elif tag == "HeaderManager":
+            for header in element.iter("elementProp"):
+                header_props = _props(header)
+                if "Header.name" in header_props:
+                    scope.headers[header_props["Header.name"]] = header_props.get(
+                        "Header.value", ""
+                    )
+        elif tag == "ConfigTestElement":
+            scope.defaults.update(
+                {k: v for k, v in props.items() if k.startswith("HTTPSampler.")}
+            )
+        elif tag == "CSVDataSet":
+            scope.csv_data_sets.append(
+                CsvDataSet(
+                    os.path.join(base_dir, props.get("filename", "")),
+                    [n.strip() for n in props.get("variableNames", "").split(",")],
+                    delimiter=props.get("delimiter") or ",",
+                    ignore_first_line=props.get("ignoreFirstLine", False),
+                    recycle=props.get("recycle", True),
+                    stop_thread=props.get("stopThread", False),
+                    encoding=props.get("fileEncoding") or "utf-8",
+                )
+            )
+        elif tag == "HTTPSamplerProxy":
+            samplers.append(
+                Sampler(
+                    element.get("testname"),
+                    props.get("HTTPSampler.method") or "GET",
+                    props.get("HTTPSampler.path") or "/",
+                    _arguments(element),
+                    props.get("HTTPSampler.follow_redirects", True),
+                )
+            )
+        elif tag == "ThreadGroup":
+            controller = element.find(
+                "elementProp[@name='ThreadGroup.main_controller']"
+            )
+            loops = int(_props(controller).get("LoopController.loops") or 1)
+            group = ThreadGroup(
+                element.get("testname"),
+                int(props.get("ThreadGroup.num_threads") or 1),
+                int(props.get("ThreadGroup.ramp_time") or 0),
+                loops,
+            )
+            group_scope = _Scope()
+            group_scope.timers = list(scope.timers)
+            group_scope.headers = dict(scope.headers)
+            group_scope.csv_data_sets = list(scope.csv_data_sets)
+            group_scope.defaults = dict(scope.defaults)
+            if subtree is not None:
+                _collect(subtree, group_scope, base_dir, group.samplers, thread_groups)
+            group.timers = group_scope.timers
+            group.headers = group_scope.headers
+            group.csv_data_sets = group_scope.csv_data_sets
+            group.defaults = group_scope.defaults
+            thread_groups.append(group)
+            continue
+
+        if subtree is not None:
+            _collect(subtree, scope, base_dir, samplers, thread_groups)
+
+
+def parse_jmx(path, csv_file=None):
+    """Parse a .jmx file into a TestPlan; CSV paths resolve next to the plan
+
+    csv_file replaces the file of every CSV Data Set, e.g. with a generated
+    search-term corpus.
+    """
+    root = ET.parse(path).getroot()
+    plan_element = root.find("hashTree/TestPlan")
+    thread_groups = []
+    _collect(
+        root.find("hashTree"),
+        _Scope(),
+        os.path.dirname(os.path.abspath(path)),
+        [],
+        thread_groups,
+    )
+    if csv_file:
+        for group in thread_groups:
+            for data_set in group.csv_data_sets:
+                data_set.filename = csv_file
+    name = plan_element.get("testname") if plan_element is not None else ""
+    return TestPlan(name, thread_groups)
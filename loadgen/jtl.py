@@ -0,0 +1,322 @@
+"""Write and analyze JMeter JTL (CSV) result files in bounded memory
+
+The analyzer streams the file row by row and keeps only the columns it
+needs. JTL elapsed times are whole milliseconds, so each time window counts
+samples per distinct value and builds its histograms from those counts when
+the window closes. Memory depends on the number of labels and open windows,
+not on the size of the file.
+
+python -m loadgen.jtl results.jtl --window 60 --json summary.json --timeseries ts.csv
+"""
+
+import argparse
+import csv
+import itertools
+import json
+from collections import Counter
+from operator import itemgetter
+
+from loadgen.runner import LabelStats, RunResult
+from utils.latency import LatencyHistogram
+
+JTL_FIELDS = [
+    "timeStamp",
+    "elapsed",
+    "label",
+    "responseCode",
+    "responseMessage",
+    "threadName",
+    "success",
+    "failureMessage",
+    "bytes",
+    "URL",
+    "Latency",
+]
+
+OTHER_LABELS = "(other labels)"
+
+
+class JtlWriter:
+    """Listener that writes every Sample as a CSV JTL row, like a ResultCollector"""
+
+    def __init__(self, path):
+        self._file = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+        self._writer.writerow(JTL_FIELDS)
+
+    def __call__(self, sample):
+        self._writer.writerow(
+            [
+                int(sample.timestamp * 1000),
+                round(sample.elapsed * 1000),
+                sample.label,
+                sample.status or "",
+                sample.error or "",
+                sample.thread,
+                "true" if sample.ok else "false",
+                sample.error or "",
+                sample.bytes,
+                sample.url,
+                round(sample.latency * 1000),
+            ]
+        )
+
+    def close(self):
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class _WindowCounts:
+    """Per-label counts for one time window, keyed by whole milliseconds"""
+
+    __slots__ = ("elapsed", "latency", "count", "errors", "bytes")
+
+    def __init__(self):
+        self.elapsed = Counter()
+        self.latency = Counter()
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+
+    def to_stats(self):
+        stats = LabelStats()
+        stats.elapsed = _histogram(self.elapsed)
+        stats.latency = _histogram(self.latency)
+        stats.count = self.count
+        stats.errors = self.errors
+        stats.bytes = self.bytes
+        return stats
+
+
+def _histogram(counts):
+    histogram = LatencyHistogram()
+    for ms, count in counts.items():
+        histogram.record(ms / 1000, count)
+    return histogram
+
+
+class JtlReport:
+    """Whole-run totals per label plus a per-window time series"""
+
+    def __init__(self, window):
+        self.window = window
+        self.totals = RunResult()
+        self.windows = []
+        self.rows = 0
+        self.late = 0
+
+    def add_window(self, start, labels):
+        self.windows.append(
+            {
+                "start": start,
+                "labels": {
+                    label: stats.summary(self.window)
+                    for label, stats in sorted(labels.items())
+                },
+            }
+        )
+        self.totals.merge(_run_result(labels))
+
+    def summary(self):
+        return {
+            "rows": self.rows,
+            "late_rows": self.late,
+            "window_seconds": self.window,
+            "started": self.totals.started,
+            "finished": self.totals.finished,
+            "labels": self.totals.summary(),
+            "windows": self.windows,
+        }
+
+    def write_timeseries(self, path):
+        """One CSV row per window and label"""
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                [
+                    "start",
+                    "label",
+                    "count",
+                    "errors",
+                    "rps",
+                    "p50_ms",
+                    "p95_ms",
+                    "p99_ms",
+                ]
+            )
+            for window in self.windows:
+                for label, stats in window["labels"].items():
+                    elapsed = stats["elapsed"]
+                    writer.writerow(
+                        [
+                            window["start"],
+                            label,
+                            stats["count"],
+                            stats["errors"],
+                            round(stats["throughput"], 3),
+                            elapsed["p50_ms"],
+                            elapsed["p95_ms"],
+                            elapsed["p99_ms"],
+                        ]
+                    )
+
+    def format_table(self):
+        return self.totals.format_table()
+
+
+def _run_result(labels):
+    result = RunResult()
+    result.labels = labels
+    return result
+
+
+class JtlAnalyzer:
+    """Stream a CSV JTL into a JtlReport
+
+    window     - seconds per time-series bucket
+    grace      - windows kept open for rows that arrive out of order (JMeter
+                 writes rows when samples finish, not when they start)
+    chunk_rows - rows between checks for windows that can be closed
+    max_labels - labels beyond this are folded into OTHER_LABELS so plans
+                 with per-row labels (e.g. "Search for ${QUERY}") stay bounded
+    """
+
+    REQUIRED = ("timeStamp", "elapsed", "label", "success")
+
+    def __init__(self, window=60, grace=1, chunk_rows=8192, max_labels=1000):
+        self.window = window
+        self.grace = grace
+        self.chunk_rows = chunk_rows
+        self.max_labels = max_labels
+
+    def _columns(self, header):
+        missing = [name for name in self.REQUIRED if name not in header]
+        if missing:
+            raise ValueError(
+                f"JTL header is missing {', '.join(missing)} "
+                "(save it with fieldNames=true)"
+            )
+        names = list(self.REQUIRED) + [
+            name for name in ("Latency", "bytes") if name in header
+        ]
+        return names, itemgetter(*(header.index(name) for name in names))
+
+    def analyze(self, path, delimiter=","):
+        report = JtlReport(self.window)
+        window_ms = int(self.window * 1000)
+        open_windows = {}
+        late = {}
+        labels = set()
+        newest = -1
+        first = last = None
+
+        with open(path, newline="", encoding="utf-8", buffering=1 << 20) as f:
+            reader = csv.reader(f, delimiter=delimiter)
+            header = next(reader, None)
+            if header is None:
+                return report
+            names, columns = self._columns(header)
+            has_latency, has_bytes = "Latency" in names, "bytes" in names
+            # Only the needed columns, without keeping the full rows around
+            rows = map(columns, reader)
+
+            while True:
+                chunk = itertools.islice(rows, self.chunk_rows)
+                read = 0
+                for row in chunk:
+                    read += 1
+                    timestamp, elapsed = int(row[0]), int(row[1])
+                    label = row[2]
+                    if label not in labels:
+                        if len(labels) < self.max_labels:
+                            labels.add(label)
+                        else:
+                            label = OTHER_LABELS
+
+                    index = timestamp // window_ms
+                    if index < newest - self.grace:
+                        report.late += 1
+                        bucket = late
+                    else:
+                        bucket = open_windows.get(index)
+                        if bucket is None:
+                            bucket = open_windows[index] = {}
+                            newest = max(newest, index)
+                    counts = bucket.get(label)
+                    if counts is None:
+                        counts = bucket[label] = _WindowCounts()
+
+                    counts.count += 1
+                    counts.elapsed[elapsed] += 1
+                    if has_latency:
+                        counts.latency[int(row[4])] += 1
+                    if has_bytes:
+                        counts.bytes += int(row[-1] or 0)
+                    if row[3] != "true":
+                        counts.errors += 1
+                    if first is None or timestamp < first:
+                        first = timestamp
+                    if last is None or timestamp + elapsed > last:
+                        last = timestamp + elapsed
+                if not read:
+                    break
+
+                report.rows += read
+                for index in sorted(open_windows):
+                    if index >= newest - self.grace:
+                        break
+                    self._close(report, index, open_windows.pop(index), window_ms)
+
+        for index in sorted(open_windows):
+            self._close(report, index, open_windows.pop(index), window_ms)
+        if late:
+            report.totals.merge(
+                _run_result({label: c.to_stats() for label, c in late.items()})
+            )
+        if first is not None:
+            report.totals.started = first / 1000
+            report.totals.finished = last / 1000
+        return report
+
+    def _close(self, report, index, counts, window_ms):
+        report.add_window(
+            index * window_ms // 1000,
+            {label: c.to_stats() for label, c in counts.items()},
+        )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m loadgen.jtl",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("jtl", help="CSV JTL written by JMeter or --jtl")
+    parser.add_argument("--window", type=float, default=60, help="Seconds per bucket")
+    parser.add_argument("--delimiter", default=",")
+    parser.add_argument("--max-labels", type=int, default=1000)
+    parser.add_argument("--json", help="Write the summary and windows here")
+    parser.add_argument("--timeseries", help="Write per-window rows as CSV here")
+    args = parser.parse_args(argv)
+
+    analyzer = JtlAnalyzer(window=args.window, max_labels=args.max_labels)
+    report = analyzer.analyze(args.jtl, args.delimiter)
+    print(report.format_table())
+    print(
+        f"\n{report.rows} rows, {len(report.windows)} windows "
+        f"of {args.window:g}s, {report.late} late"
+    )
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report.summary(), f, indent=2)
+    if args.timeseries:
+        report.write_timeseries(args.timeseries)
+
+
+if __name__ == "__main__":
+    main()
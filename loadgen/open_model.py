@@ -0,0 +1,216 @@
+"""Open-model execution with coordinated-omission correction
+
+Each arrival from the schedule runs one iteration of the thread group's
+samplers (think time is not applied; the schedule replaces it). Latency is
+reported twice:
+
+uncorrected - measured from when the request was actually sent
+corrected   - measured from when the request would have been sent had its
+              iteration started on schedule
+
+When the target or the generator falls behind, iterations start late. The
+uncorrected numbers hide that wait; the corrected ones include it, which is
+what a real user arriving at that moment would have seen.
+"""
+
+import asyncio
+import copy
+import time
+
+from loadgen.feed import CsvFeed
+from loadgen.runner import (
+    RunResult,
+    Sample,
+    apply_validators,
+    new_session,
+    send_sample,
+)
+from utils.latency import LatencyHistogram
+
+ITERATION_LABEL = "Iteration"
+
+
+class OpenModelResult:
+    def __init__(self):
+        self.uncorrected = RunResult()
+        self.corrected = RunResult()
+        self.lag = LatencyHistogram()
+        self.scheduled = 0
+
+    @property
+    def duration(self):
+        return self.uncorrected.duration
+
+    @property
+    def achieved_rate(self):
+        """Iterations started per second"""
+        return self.scheduled / self.duration if self.duration else 0.0
+
+    def merge(self, other):
+        self.uncorrected.merge(other.uncorrected)
+        self.corrected.merge(other.corrected)
+        self.lag.merge(other.lag)
+        self.scheduled += other.scheduled
+        return self
+
+    def to_dict(self):
+        return {
+            "uncorrected": self.uncorrected.to_dict(),
+            "corrected": self.corrected.to_dict(),
+            "lag": self.lag.to_dict(),
+            "scheduled": self.scheduled,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        result = cls()
+        result.uncorrected = RunResult.from_dict(data["uncorrected"])
+        result.corrected = RunResult.from_dict(data["corrected"])
+        result.lag = LatencyHistogram.from_dict(data["lag"])
+        result.scheduled = data["scheduled"]
+        return result
+
+    def add(self, sample):
+        self.uncorrected.add(sample)
+        corrected = copy.copy(sample)
+        corrected.elapsed = sample.elapsed + sample.lag
+        self.corrected.add(corrected)
+
+    def summary(self):
+        return {
+            "scheduled": self.scheduled,
+            "achieved_rate": self.achieved_rate,
+            "start_lag": self.lag.summary(),
+            "uncorrected": self.uncorrected.summary(),
+            "corrected": self.corrected.summary(),
+        }
+
+    def format_table(self):
+        lines = [
+            f"{'label':<40}{'count':>8}{'err %':>8}"
+            f"{'p95 ms':>10}{'p99 ms':>10}{'p95* ms':>10}{'p99* ms':>10}"
+        ]
+        corrected = self.corrected.summary()
+        for label, stats in self.uncorrected.summary().items():
+            raw, fixed = stats["elapsed"], corrected[label]["elapsed"]
+            lines.append(
+                f"{label[:39]:<40}{stats['count']:>8}"
+                f"{stats['error_rate'] * 100:>8.2f}"
+                f"{raw['p95_ms']:>10}{raw['p99_ms']:>10}"
+                f"{fixed['p95_ms']:>10}{fixed['p99_ms']:>10}"
+            )
+        lines.append("* corrected for coordinated omission (from intended start)")
+        return "\n".join(lines)
+
+
+class OpenModelRunner:
+    """Start iterations of the first thread group at scheduled times
+
+    max_in_flight  - cap on concurrent iterations (like a fixed pool of
+                     virtual users); arrivals beyond it wait and accrue lag
+    feed_partition - (parts, index) share of each CSV file this runner reads
+    validators     - response checks (see loadgen.validators)
+    """
+
+    def __init__(
+        self,
+        plan,
+        schedule,
+        base_url=None,
+        max_in_flight=None,
+        listeners=(),
+        connection_limit=0,
+        timeout=30,
+        feed_partition=(1, 0),
+        validators=(),
+    ):
+        self.group = plan.thread_groups[0]
+        self.schedule = schedule
+        self.base_url = (base_url or self.group.base_url).rstrip("/")
+        self.max_in_flight = max_in_flight
+        self.listeners = list(listeners)
+        self.connection_limit = connection_limit
+        self.timeout = timeout
+        self.feed_partition = feed_partition
+        self.validators = list(validators)
+
+    def _emit(self, result, sample):
+        apply_validators(sample, self.validators)
+        result.add(sample)
+        for listener in self.listeners:
+            listener(sample)
+
+    async def _iteration(self, session, feeds, result, intended, slots, number):
+        if slots is not None:
+            await slots.acquire()
+        try:
+            started = time.perf_counter()
+            lag = max(0.0, started - intended)
+            result.lag.record(lag)
+            variables = {}
+            for feed in feeds:
+                variables.update(feed.next_row() or {})
+
+            thread = f"{self.group.name} arrival-{number}"
+            ok = True
+            for sampler in self.group.samplers:
+                sample = await send_sample(
+                    session,
+                    sampler.method,
+                    self.base_url + sampler.url_path(variables),
+                    sampler.name,
+                    thread,
+                    sampler.follow_redirects,
+                )
+                # A late start pushes every request of the iteration back by lag
+                sample.lag = lag
+                self._emit(result, sample)
+                ok = ok and sample.ok
+
+            finished = time.perf_counter()
+            result.uncorrected.add(_iteration_sample(finished - started, ok, thread))
+            result.corrected.add(_iteration_sample(finished - intended, ok, thread))
+        finally:
+            if slots is not None:
+                slots.release()
+
+    async def run_async(self):
+        result = OpenModelResult()
+        feeds = [
+            CsvFeed(data_set, *self.feed_partition)
+            for data_set in self.group.csv_data_sets
+        ]
+        slots = asyncio.Semaphore(self.max_in_flight) if self.max_in_flight else None
+        pending = set()
+
+        async with new_session(
+            self.group.headers, self.connection_limit, self.timeout
+        ) as session:
+            start = time.perf_counter()
+            result.uncorrected.started = result.corrected.started = time.time()
+            for number, offset in enumerate(self.schedule, 1):
+                intended = start + offset
+                delay = intended - time.perf_counter()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+                result.scheduled += 1
+                task = asyncio.create_task(
+                    self._iteration(session, feeds, result, intended, slots, number)
+                )
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+            result.uncorrected.finished = result.corrected.finished = time.time()
+
+        for feed in feeds:
+            feed.close()
+        return result
+
+    def run(self):
+        return asyncio.run(self.run_async())
+
+
+def _iteration_sample(elapsed, ok, thread):
+    """Whole-iteration pseudo sample, reported under ITERATION_LABEL"""
+    return Sample(ITERATION_LABEL, time.time(), elapsed, elapsed, 0, ok, 0, "", thread)
@@ -0,0 +1,227 @@
+"""Replay captured traffic as load, keeping its original timing
+
+Sources are HAR files (one session per page, or per file when entries have
+no pageref) and Pet API cassettes recorded with CassetteAdapter (one session
+per recording thread). Every session runs on its own virtual user: its
+requests go out in order, each no earlier than its original offset divided
+by speed, while different sessions overlap as they did when captured.
+
+python -m loadgen.replay capture.har --base-url http://localhost:8080 --speed 10 --repeat 20
+"""
+
+import argparse
+import asyncio
+import json
+import time
+from datetime import datetime
+from urllib.parse import urlsplit, urlunsplit
+
+from api.metrics import endpoint_label
+from loadgen.open_model import OpenModelResult
+from loadgen.runner import new_session, send_sample
+
+_KEPT_HEADERS = ("content-type", "accept")
+
+
+class ReplayRequest:
+    __slots__ = ("offset", "method", "url", "body", "headers")
+
+    def __init__(self, offset, method, url, body="", headers=None):
+        self.offset = offset
+        self.method = method
+        self.url = url
+        self.body = body
+        self.headers = headers or {}
+
+
+class TrafficSession:
+    """Requests of one captured user, with offsets from the capture start"""
+
+    def __init__(self, name, requests):
+        self.name = name
+        self.requests = sorted(requests, key=lambda request: request.offset)
+
+
+def _sessions(captured):
+    """TrafficSessions from {name: [(started, method, url, body, headers)]}"""
+    if not captured:
+        return []
+    origin = min(entry[0] for entries in captured.values() for entry in entries)
+    return [
+        TrafficSession(
+            name,
+            [
+                ReplayRequest(started - origin, method, url, body, headers)
+                for started, method, url, body, headers in entries
+            ],
+        )
+        for name, entries in captured.items()
+    ]
+
+
+def _kept_headers(headers):
+    return {
+        name: value for name, value in headers.items() if name.lower() in _KEPT_HEADERS
+    }
+
+
+def load_har(path):
+    """Sessions from a HAR file"""
+    with open(path, encoding="utf-8") as f:
+        entries = json.load(f)["log"]["entries"]
+    captured = {}
+    for entry in entries:
+        request = entry["request"]
+        started = datetime.fromisoformat(
+            entry["startedDateTime"].replace("Z", "+00:00")
+        ).timestamp()
+        headers = {header["name"]: header["value"] for header in request["headers"]}
+        captured.setdefault(entry.get("pageref") or path, []).append(
+            (
+                started,
+                request["method"],
+                request["url"],
+                (request.get("postData") or {}).get("text", ""),
+                _kept_headers(headers),
+            )
+        )
+    return _sessions(captured)
+
+
+def load_cassette(path):
+    """Sessions from a cassette; interactions recorded without request data are skipped"""
+    captured = {}
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            _, _, data = line.partition("\t")
+            request = json.loads(data).get("request") if data.strip() else None
+            if request is None:
+                continue
+            captured.setdefault(request["session"], []).append(
+                (
+                    request["started"],
+                    request["method"],
+                    request["url"],
+                    request["body"],
+                    _kept_headers(request["headers"]),
+                )
+            )
+    return _sessions(captured)
+
+
+def load_capture(path):
+    """HAR or cassette, by file extension"""
+    return load_har(path) if path.endswith(".har") else load_cassette(path)
+
+
+class TrafficReplayer:
+    """Replay sessions concurrently with their captured pacing
+
+    base_url - send to this scheme and host instead of the captured ones
+    speed    - 10 replays ten times faster than captured
+    repeat   - run every session this many times on separate virtual users
+    stagger  - seconds between the starts of consecutive repeats
+
+    Results are per endpoint ("GET /v2/pet/{id}"). Like the open model,
+    latency is also reported from each request's intended send time, so a
+    target that cannot keep up shows in the corrected columns.
+    """
+
+    def __init__(
+        self,
+        sessions,
+        base_url=None,
+        speed=1.0,
+        repeat=1,
+        stagger=0.0,
+        listeners=(),
+        connection_limit=0,
+        timeout=30,
+    ):
+        self.sessions = sessions
+        self.base_url = base_url
+        self.speed = speed
+        self.repeat = repeat
+        self.stagger = stagger
+        self.listeners = list(listeners)
+        self.connection_limit = connection_limit
+        self.timeout = timeout
+
+    def _target(self, url):
+        if not self.base_url:
+            return url
+        base, parts = urlsplit(self.base_url), urlsplit(url)
+        return urlunsplit((base.scheme, base.netloc, parts.path, parts.query, ""))
+
+    async def _play(self, http, session, copy, start, result):
+        thread = f"{session.name} #{copy + 1}"
+        for request in session.requests:
+            intended = start + request.offset / self.speed
+            delay = intended - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            lag = max(0.0, time.perf_counter() - intended)
+            result.lag.record(lag)
+            result.scheduled += 1
+
+            sample = await send_sample(
+                http,
+                request.method,
+                self._target(request.url),
+                endpoint_label(request.method, urlsplit(request.url).path),
+                thread,
+                data=request.body.encode("utf-8") or None,
+                headers=request.headers,
+            )
+            sample.lag = lag
+            result.add(sample)
+            for listener in self.listeners:
+                listener(sample)
+
+    async def run_async(self):
+        result = OpenModelResult()
+        async with new_session({}, self.connection_limit, self.timeout) as http:
+            start = time.perf_counter()
+            result.uncorrected.started = result.corrected.started = time.time()
+            await asyncio.gather(
+                *(
+                    self._play(http, session, copy, start + copy * self.stagger, result)
+                    for copy in range(self.repeat)
+                    for session in self.sessions
+                )
+            )
+            result.uncorrected.finished = result.corrected.finished = time.time()
+        return result
+
+    def run(self):
+        return asyncio.run(self.run_async())
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m loadgen.replay",
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+    parser.add_argument("captures", nargs="+", help=".har files or cassettes")
+    parser.add_argument("--base-url", help="Replay against this scheme and host")
+    parser.add_argument("--speed", type=float, default=1.0, help="Time compression")
+    parser.add_argument("--repeat", type=int, default=1, help="Copies per session")
+    parser.add_argument(
+        "--stagger", type=float, default=0.0, help="Seconds between copies"
+    )
+    args = parser.parse_args(argv)
+
+    sessions = [session for path in args.captures for session in load_capture(path)]
+    result = TrafficReplayer(
+        sessions, args.base_url, args.speed, args.repeat, args.stagger
+    ).run()
+    print(result.format_table())
+    print(
+        f"\n{result.scheduled} requests from {len(sessions)} sessions x {args.repeat} "
+        f"in {result.duration:.2f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,387 @@
+"""Run parsed JMeter thread groups on asyncio virtual users"""
+
+import asyncio
+import time
+
+import aiohttp
+from yarl import URL
+from loadgen.feed import CsvFeed
+from utils.latency import LatencyHistogram
+
+try:
+    import brotli  # noqa: F401  aiohttp decodes "br" only when this is installed
+
+    _BROTLI = True
+except ImportError:
+    _BROTLI = False
+
+
+class Sample:
+    """One sampler execution, with the fields JMeter writes to a JTL file"""
+
+    __slots__ = (
+        "label",
+        "timestamp",
+        "elapsed",
+        "latency",
+        "status",
+        "ok",
+        "bytes",
+        "url",
+        "thread",
+        "error",
+        "body",
+        "lag",
+    )
+
+    def __init__(
+        self,
+        label,
+        timestamp,
+        elapsed,
+        latency,
+        status,
+        ok,
+        bytes,
+        url,
+        thread,
+        error=None,
+        body=b"",
+        lag=0.0,
+    ):
+        self.label = label
+        self.timestamp = timestamp
+        self.elapsed = elapsed
+        self.latency = latency
+        self.status = status
+        self.ok = ok
+        self.bytes = bytes
+        self.url = url
+        self.thread = thread
+        self.error = error
+        self.body = body
+        # Seconds between the intended and actual start (open model only)
+        self.lag = lag
+
+
+class LabelStats:
+    def __init__(self):
+        self.elapsed = LatencyHistogram()
+        self.latency = LatencyHistogram()
+        self.count = 0
+        self.errors = 0
+        self.bytes = 0
+
+    def merge(self, other):
+        self.elapsed.merge(other.elapsed)
+        self.latency.merge(other.latency)
+        self.count += other.count
+        self.errors += other.errors
+        self.bytes += other.bytes
+        return self
+
+    def to_dict(self):
+        return {
+            "elapsed": self.elapsed.to_dict(),
+            "latency": self.latency.to_dict(),
+            "count": self.count,
+            "errors": self.errors,
+            "bytes": self.bytes,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        stats = cls()
+        stats.elapsed = LatencyHistogram.from_dict(data["elapsed"])
+        stats.latency = LatencyHistogram.from_dict(data["latency"])
+        stats.count = data["count"]
+        stats.errors = data["errors"]
+        stats.bytes = data["bytes"]
+        return stats
+
+    def summary(self, duration):
+        return {
+            "count": self.count,
+            "errors": self.errors,
+            "error_rate": self.errors / self.count if self.count else 0.0,
+            "throughput": self.count / duration if duration else 0.0,
+            "bytes": self.bytes,
+            "elapsed": self.elapsed.summary(),
+            "latency": self.latency.summary(),
+        }
+
+
+class RunResult:
+    """Per-label aggregates of a run
+
+    started/finished are wall-clock times so results from several processes
+    can be merged.
+    """
+
+    def __init__(self):
+        self.labels = {}
+        self.started = None
+        self.finished = None
+
+    def merge(self, other):
+        """Fold in another run's aggregates (e.g. from another worker process)"""
+        for label, stats in other.labels.items():
+            if label in self.labels:
+                self.labels[label].merge(stats)
+            else:
+                self.labels[label] = LabelStats().merge(stats)
+        if other.started is not None:
+            if self.started is None:
+                self.started, self.finished = other.started, other.finished
+            else:
+                self.started = min(self.started, other.started)
+                self.finished = max(self.finished, other.finished)
+        return self
+
+    def to_dict(self):
+        return {
+            "labels": {label: stats.to_dict() for label, stats in self.labels.items()},
+            "started": self.started,
+            "finished": self.finished,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        result = cls()
+        result.labels = {
+            label: LabelStats.from_dict(stats)
+            for label, stats in data["labels"].items()
+        }
+        result.started = data["started"]
+        result.finished = data["finished"]
+        return result
+
+    def add(self, sample):
+        stats = self.labels.get(sample.label)
+        if stats is None:
+            stats = self.labels[sample.label] = LabelStats()
+        stats.count += 1
+        stats.bytes += sample.bytes
+        stats.elapsed.record(sample.elapsed)
+        stats.latency.record(sample.latency)
+        if not sample.ok:
+            stats.errors += 1
+
+    @property
+    def duration(self):
+        if self.started is None or self.finished is None:
+            return 0.0
+        return self.finished - self.started
+
+    @property
+    def count(self):
+        return sum(stats.count for stats in self.labels.values())
+
+    @property
+    def errors(self):
+        return sum(stats.errors for stats in self.labels.values())
+
+    def summary(self):
+        return {
+            label: stats.summary(self.duration)
+            for label, stats in sorted(self.labels.items())
+        }
+
+    def format_table(self):
+        lines = [
+            f"{'label':<40}{'count':>8}{'err %':>8}{'rps':>9}"
+            f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}"
+        ]
+        for label, stats in self.summary().items():
+            elapsed = stats["elapsed"]
+            lines.append(
+                f"{label[:39]:<40}{stats['count']:>8}"
+                f"{stats['error_rate'] * 100:>8.2f}{stats['throughput']:>9.1f}"
+                f"{elapsed['p50_ms']:>10}{elapsed['p95_ms']:>10}{elapsed['p99_ms']:>10}"
+            )
+        return "\n".join(lines)
+
+
+def request_headers(headers):
+    """Plan headers minus content encodings this client cannot decode"""
+    headers = dict(headers)
+    encoding = headers.get("Accept-Encoding")
+    if encoding and not _BROTLI:
+        accepted = [e.strip() for e in encoding.split(",") if e.strip() != "br"]
+        headers["Accept-Encoding"] = ", ".join(accepted)
+    return headers
+
+
+async def send_sample(
+    session, method, url, label, thread, follow_redirects=True, data=None, headers=None
+):
+    """Execute one HTTP sample, reading the whole body like JMeter does"""
+    timestamp = time.time()
+    start = time.perf_counter()
+    latency = None
+    try:
+        async with session.request(
+            method,
+            URL(url, encoded=True),
+            allow_redirects=follow_redirects,
+            data=data,
+            headers=headers,
+        ) as response:
+            latency = time.perf_counter() - start
+            body = await response.read()
+        elapsed = time.perf_counter() - start
+        return Sample(
+            label,
+            timestamp,
+            elapsed,
+            latency,
+            response.status,
+            response.status < 400,
+            len(body),
+            url,
+            thread,
+            body=body,
+        )
+    except (aiohttp.ClientError, asyncio.TimeoutError, OSError) as e:
+        elapsed = time.perf_counter() - start
+        return Sample(
+            label,
+            timestamp,
+            elapsed,
+            latency if latency is not None else elapsed,
+            0,
+            False,
+            0,
+            url,
+            thread,
+            error=f"{type(e).__name__}: {e}",
+        )
+
+
+def apply_validators(sample, validators):
+    """Mark the sample failed with the first validator error, if any"""
+    for validator in validators:
+        error = validator(sample)
+        if error:
+            sample.ok = False
+            sample.error = error
+            return
+
+
+def new_session(headers, connection_limit=0, timeout=30):
+    """Keep-alive session whose pool is shared by all virtual users"""
+    connector = aiohttp.TCPConnector(limit=connection_limit, keepalive_timeout=60)
+    return aiohttp.ClientSession(
+        connector=connector,
+        headers=request_headers(headers),
+        timeout=aiohttp.ClientTimeout(total=timeout),
+    )
+
+
+class LoadRunner:
+    """Closed-model executor for a TestPlan, one coroutine per JMeter thread
+
+    base_url    - replace the plan's HTTP Request Defaults (e.g. a local stand-in)
+    timer_scale - multiply timer delays; 0 disables think time
+    threads / loops - override the thread group settings
+    listeners   - callables receiving every Sample as it completes
+    validators  - response checks (see loadgen.validators) run before listeners
+    feed_partition - (parts, index) share of each CSV file this runner reads
+    """
+
+    def __init__(
+        self,
+        plan,
+        base_url=None,
+        timer_scale=1.0,
+        threads=None,
+        loops=None,
+        listeners=(),
+        connection_limit=0,
+        timeout=30,
+        feed_partition=(1, 0),
+        validators=(),
+    ):
+        self.plan = plan
+        self.base_url = base_url
+        self.timer_scale = timer_scale
+        self.threads = threads
+        self.loops = loops
+        self.listeners = list(listeners)
+        self.connection_limit = connection_limit
+        self.timeout = timeout
+        self.feed_partition = feed_partition
+        self.validators = list(validators)
+
+    def _emit(self, result, sample):
+        apply_validators(sample, self.validators)
+        result.add(sample)
+        for listener in self.listeners:
+            listener(sample)
+
+    async def _user(self, group, session, feeds, result, thread_name, start_delay):
+        await asyncio.sleep(start_delay)
+        base_url = (self.base_url or group.base_url).rstrip("/")
+        loops = self.loops if self.loops is not None else group.loops
+        think_time = sum(group.timers) * self.timer_scale
+        iteration = 0
+
+        while loops < 0 or iteration < loops:
+            iteration += 1
+            variables = {}
+            for feed in feeds:
+                row = feed.next_row()
+                if row is None:
+                    return
+                variables.update(row)
+
+            for sampler in group.samplers:
+                if think_time:
+                    await asyncio.sleep(think_time)
+                sample = await send_sample(
+                    session,
+                    sampler.method,
+                    base_url + sampler.url_path(variables),
+                    sampler.name,
+                    thread_name,
+                    sampler.follow_redirects,
+                )
+                self._emit(result, sample)
+
+    async def _run_group(self, group, result):
+        threads = self.threads or group.threads
+        feeds = [
+            CsvFeed(data_set, *self.feed_partition) for data_set in group.csv_data_sets
+        ]
+        async with new_session(
+            group.headers, self.connection_limit, self.timeout
+        ) as session:
+            try:
+                await asyncio.gather(
+                    *(
+                        self._user(
+                            group,
+                            session,
+                            feeds,
+                            result,
+                            f"{group.name} 1-{i + 1}",
+                            group.ramp_time * i / threads,
+                        )
+                        for i in range(threads)
+                    )
+                )
+            finally:
+                for feed in feeds:
+                    feed.close()
+
+    async def run_async(self):
+        result = RunResult()
+        result.started = time.time()
+        await asyncio.gather(
+            *(self._run_group(group, result) for group in self.plan.thread_groups)
+        )
+        result.finished = time.time()
+        return result
+
+    def run(self):
+        return asyncio.run(self.run_async())
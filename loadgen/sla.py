@@ -0,0 +1,70 @@
+"""Pass/fail thresholds for load runs"""
+
+from loadgen.open_model import ITERATION_LABEL
+from loadgen.runner import LabelStats
+
+
+class SLA:
+    """Limits a run's samples must stay within; None skips a check
+
+    p95_ms / p99_ms - latency percentiles over the matching samples
+    error_rate      - highest allowed share of failed samples (0.01 = 1%)
+    min_throughput  - lowest allowed samples per second
+    labels          - only check samples whose label starts with this prefix
+    """
+
+    def __init__(
+        self,
+        p95_ms=None,
+        p99_ms=None,
+        error_rate=None,
+        min_throughput=None,
+        labels=None,
+    ):
+        self.p95_ms = p95_ms
+        self.p99_ms = p99_ms
+        self.error_rate = error_rate
+        self.min_throughput = min_throughput
+        self.labels = labels
+
+    def _stats(self, result):
+        """Merged stats of the sampler labels this SLA covers"""
+        stats = LabelStats()
+        for label, label_stats in result.labels.items():
+            if label == ITERATION_LABEL:
+                continue
+            if self.labels is None or label.startswith(self.labels):
+                stats.merge(label_stats)
+        return stats
+
+    def measure(self, result):
+        """Values of the checked metrics for a RunResult"""
+        stats = self._stats(result)
+        p95, p99 = stats.elapsed.percentile(95), stats.elapsed.percentile(99)
+        return {
+            "count": stats.count,
+            "p95_ms": None if p95 is None else round(p95 * 1000, 3),
+            "p99_ms": None if p99 is None else round(p99 * 1000, 3),
+            "error_rate": stats.errors / stats.count if stats.count else 0.0,
+            "throughput": stats.count / result.duration if result.duration else 0.0,
+        }
+
+    def violations(self, result):
+        """Human-readable list of broken thresholds, empty when the run passes"""
+        measured = self.measure(result)
+        if not measured["count"]:
+            return ["no samples matched the SLA"]
+
+        failures = []
+        for name in ("p95_ms", "p99_ms", "error_rate"):
+            limit = getattr(self, name)
+            if limit is not None and measured[name] > limit:
+                failures.append(f"{name} {measured[name]:g} > {limit:g}")
+        if (
+            self.min_throughput is not None
+            and measured["throughput"] < self.min_throughput
+        ):
+            failures.append(
+                f"throughput {measured['throughput']:.2f}/s < {self.min_throughput:g}/s"
+            )
+        return failures
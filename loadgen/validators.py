@@ -0,0 +1,112 @@
+"""Response assertions for load samples
+
+A validator is a callable taking a Sample and returning an error message, or
+None when the response is acceptable. Runners mark failed samples as errors,
+the way a JMeter Response Assertion would.
+"""
+
+import re
+from urllib.parse import parse_qs, urlsplit
+
+_DIGITS = re.compile(rb"\D")
+
+# Start of a script/style element, a comment, or a start tag whose class
+# attribute holds one of the classes we look for; other tags never reach Python
+_TAG = re.compile(
+    rb"<(?:(script|style)\b|(!--)|[a-zA-Z][^>]*?\sclass\s*=\s*[\"'][^\"']*?"
+    rb"(?<![\w-])(?-i:(pro|resultCount|notFoundContainer))(?![\w-])[^>]*>)",
+    re.IGNORECASE,
+)
+_CLOSING = {
+    b"script": re.compile(rb"</script\s*>", re.IGNORECASE),
+    b"style": re.compile(rb"</style\s*>", re.IGNORECASE),
+    b"!--": re.compile(rb"-->"),
+}
+
+
+class SearchPage:
+    """What a search result page says about itself"""
+
+    __slots__ = ("result_count", "cards", "no_results")
+
+    def __init__(self):
+        self.result_count = None
+        self.cards = 0
+        self.no_results = False
+
+
+def parse_search_page(body, min_cards=1):
+    """SearchPage for an HTML body, stopping once the outcome is known
+
+    The raw bytes are scanned with one compiled pattern that only stops at
+    tags carrying the classes we need; script/style bodies and comments are
+    jumped over. Scanning ends at the "no results" marker, or once the result
+    count and min_cards product cards have been seen.
+    """
+    if isinstance(body, str):
+        body = body.encode("utf-8")
+    page = SearchPage()
+    position = 0
+    while True:
+        match = _TAG.search(body, position)
+        if match is None:
+            break
+        raw_text, comment, css_class = match.groups()
+        skipped = raw_text or comment
+        if skipped:
+            # Jump over script/style bodies and comments without scanning them
+            end = _CLOSING[skipped.lower()].search(body, match.end())
+            position = end.end() if end else len(body)
+            continue
+        position = match.end()
+        if css_class == b"pro":
+            page.cards += 1
+        elif css_class == b"resultCount":
+            text_end = body.find(b"<", position)
+            digits = _DIGITS.sub(b"", body[position:text_end])
+            if digits:
+                page.result_count = int(digits)
+        else:
+            page.no_results = True
+            break
+        if page.result_count is not None and page.cards >= min_cards:
+            break
+    return page
+
+
+class SearchResultsValidator:
+    """Fail search samples whose 200 page is not a real result page
+
+    path         - only samples for this URL path are checked
+    min_cards    - product cards a page with results must contain
+    empty_marker - queries containing this must show the "no results" page
+                   (like zxywvut-nonexistent in test_data_n11.csv)
+    """
+
+    def __init__(self, path="/arama", min_cards=1, empty_marker="nonexistent"):
+        self.path = path
+        self.min_cards = min_cards
+        self.empty_marker = empty_marker
+
+    def __call__(self, sample):
+        if not sample.ok:
+            return None
+        url = urlsplit(sample.url)
+        if url.path != self.path:
+            return None
+
+        query = (parse_qs(url.query).get("q") or [""])[0]
+        page = parse_search_page(sample.body, self.min_cards)
+        if self.empty_marker and self.empty_marker in query:
+            if not page.no_results:
+                return f"Expected no results for {query!r}"
+            return None
+        if page.no_results:
+            # A blank search has nothing to match; the empty page is a valid answer
+            return f"No results for {query!r}" if query.strip() else None
+        if not page.result_count or page.cards < self.min_cards:
+            return (
+                f"Not a result page for {query!r}: count={page.result_count}, "
+                f"cards={page.cards}"
+            )
+        return None
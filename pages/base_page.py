@@ -1,24 +1,138 @@
-from selenium.webdriver.support.wait import WebDriverWait
+import time
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import TimeoutException, NoSuchElementException
+from selenium.common.exceptions import (
+    TimeoutException,
+    NoSuchElementException,
+    WebDriverException,
+)
 from selenium.webdriver.common.action_chains import ActionChains
+from selenium.webdriver.common.by import By
+from config.config import ConfigUI
+from pages.waits import AdaptiveWait, locator_label
+
+# Reads every row's fields in the page; arguments: [kind, query] of the rows,
+# then {field: [kind, query]} relative to each row
+EXTRACT_ROWS_SCRIPT = """
+const [rowQuery, fieldQueries] = arguments;
+function findAll(root, [kind, query]) {
+    if (kind === "css") return Array.from(root.querySelectorAll(query));
+    const found = document.evaluate(
+        query, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+    return Array.from({length: found.snapshotLength}, (_, i) => found.snapshotItem(i));
+}
+return findAll(document, rowQuery).map(row => {
+    const fields = {};
+    for (const [name, fieldQuery] of Object.entries(fieldQueries)) {
+        const element = findAll(row, fieldQuery)[0];
+        fields[name] = element ? element.innerText.trim() : null;
+    }
+    return fields;
+});
+"""
+
+
+def _script_query(locator):
+    """A Selenium locator as [kind, query] for EXTRACT_ROWS_SCRIPT"""
+    by, value = locator
+    if by == By.CSS_SELECTOR:
+        return ["css", value]
+    if by == By.XPATH:
+        return ["xpath", value]
+    if by == By.ID:
+        return ["css", f'[id="{value}"]']
+    if by == By.CLASS_NAME:
+        return ["css", f".{value}"]
+    if by == By.TAG_NAME:
+        return ["css", value]
+    raise ValueError(f"Locator not supported in batched extraction: {locator}")
+
+
+# Resolves true once none of arguments[0] has changed for arguments[1] ms, or
+# false after arguments[2] ms. With arguments[3] the quiet period only starts at
+# the first change, unless the first element's text already differs from
+# arguments[4] (when that is given)
+DOM_QUIET_SCRIPT = """
+const [targets, quietMs, timeoutMs, afterChange, unchangedText] = arguments;
+const done = arguments[arguments.length - 1];
+let quietTimer;
+const observer = new MutationObserver(() => {
+    clearTimeout(quietTimer);
+    quietTimer = setTimeout(finish, quietMs, true);
+});
+const deadline = setTimeout(finish, timeoutMs, false);
+function finish(quiet) {
+    observer.disconnect();
+    clearTimeout(quietTimer);
+    clearTimeout(deadline);
+    done(quiet);
+}
+for (const target of targets) {
+    observer.observe(target, {childList: true, subtree: true, characterData: true});
+}
+const changed = unchangedText !== null && targets[0].innerText.trim() !== unchangedText;
+if (!afterChange || changed) {
+    quietTimer = setTimeout(finish, quietMs, true);
+}
+"""
+
+
+# Scrolls arguments[0] to the middle of the viewport at once and resolves true
+# when it intersects the viewport and is not hidden by CSS, or false after
+# arguments[1] ms
+SCROLL_INTO_VIEW_SCRIPT = """
+const [element, timeoutMs] = arguments;
+const done = arguments[arguments.length - 1];
+const deadline = setTimeout(finish, timeoutMs, false);
+let frame;
+const observer = new IntersectionObserver(entries => {
+    if (entries.some(entry => entry.isIntersecting)) checkStyle();
+});
+function checkStyle() {
+    const style = getComputedStyle(element);
+    if (style.visibility !== "hidden" && style.opacity !== "0") {
+        finish(true);
+    } else {
+        // Fade-in animations: check again on the next frame
+        frame = requestAnimationFrame(checkStyle);
+    }
+}
+function finish(visible) {
+    observer.disconnect();
+    cancelAnimationFrame(frame);
+    clearTimeout(deadline);
+    done(visible);
+}
+element.scrollIntoView({behavior: "instant", block: "center"});
+observer.observe(element);
+"""
 
 
 class BasePage:
 
     def __init__(self, driver):
         self.driver = driver
-        self.wait = WebDriverWait(driver, 60)
+        self.wait = AdaptiveWait(driver)
         self.actions = ActionChains(driver)
 
+    def _wait(self, condition, step, target="", timeout=None):
+        """self.wait.until() recorded as "<Page>.<step> <target>" """
+        if isinstance(target, tuple):
+            target = locator_label(target)
+        label = f"{type(self).__name__}.{step} {target}".rstrip()
+        return self.wait.until(condition, label, timeout)
+
     def navigate_to(self, url):
         self.driver.get(url)
 
-    def wait_for_element_to_be_clickable(self, locator):
-        return self.wait.until(EC.element_to_be_clickable(locator))
+    def wait_for_element_to_be_clickable(self, locator, timeout=None):
+        return self._wait(
+            EC.element_to_be_clickable(locator), "clickable", locator, timeout
+        )
 
-    def wait_for_element_to_be_visible(self, locator):
-        return self.wait.until(EC.visibility_of_element_located(locator))
+    def wait_for_element_to_be_visible(self, locator, timeout=None):
+        return self._wait(
+            EC.visibility_of_element_located(locator), "visible", locator, timeout
+        )
 
     def click(self, locator):
         element = self.wait_for_element_to_be_clickable(locator)
@@ -28,90 +142,152 @@ class BasePage:
         return self.driver.current_url
 
     def hover_over_element_by_locator(self, locator):
-        element = self.wait.until(EC.visibility_of_element_located(locator))
+        element = self.wait_for_element_to_be_visible(locator)
         self.actions.move_to_element(element).perform()
 
     def hover_over_element(self, element):
-        element = self.wait.until(EC.visibility_of(element))
+        element = self._wait(EC.visibility_of(element), "visible", "element")
         self.actions.move_to_element(element).perform()
 
-    def wait_for_url_contains(self, text):
+    def wait_for_url_contains(self, text, timeout=None):
         try:
-            self.wait.until(EC.url_contains(text))
+            self._wait(EC.url_contains(text), "url_contains", text, timeout)
             return True
         except TimeoutException:
             return False
 
-    def find_element(self, locator):
+    def find_element(self, locator, timeout=None):
         try:
-            return self.wait.until(EC.presence_of_element_located(locator))
+            return self._wait(
+                EC.presence_of_element_located(locator), "present", locator, timeout
+            )
         except TimeoutException:
             raise TimeoutException(f"Element not found: {locator}")
 
-    def find_elements(self, locator):
+    def find_elements(self, locator, timeout=ConfigUI.FIND_ELEMENTS_TIMEOUT):
+        """Matching elements, or [] when none appear within timeout"""
         try:
-            elements = self.wait.until(EC.presence_of_all_elements_located(locator))
-            return elements
+            return self._wait(
+                EC.presence_of_all_elements_located(locator),
+                "present_all",
+                locator,
+                timeout,
+            )
         except TimeoutException:
             return []
 
-    def scroll_to_element_by_locator(self, locator):
-        element = self.wait.until(EC.presence_of_element_located(locator))
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
-            element,
-        )
+    def extract_rows(self, row_locator, fields, timeout=ConfigUI.FIND_ELEMENTS_TIMEOUT):
+        """Visible text of fields in every row, read in one script call
 
-        # Wait for the browser to stop scrolling (Custom Wait)
+        fields maps a name to a locator relative to the row. Returns a list of
+        {name: text} dicts, with None for fields a row does not have, or an
+        empty list when no row appears before the wait times out.
+        """
+        row_query = _script_query(row_locator)
+        field_queries = {
+            name: _script_query(locator) for name, locator in fields.items()
+        }
         try:
-            scroll_finished = self.wait.until(
+            return self._wait(
                 lambda driver: driver.execute_script(
-                    """
-                    let scrollingElement = document.scrollingElement || document.documentElement;
-                    let initialScrollY = scrollingElement.scrollTop;
-                    let currentScrollY = window.scrollY || document.documentElement.scrollTop;
-                    return currentScrollY;
-                    """
-                )
+                    EXTRACT_ROWS_SCRIPT, row_query, field_queries
+                ),
+                "extract_rows",
+                row_locator,
+                timeout,
             )
-
         except TimeoutException:
-            print("Warning: Timed out waiting for smooth scrolling to fully finish.")
+            return []
 
-        self.wait.until(EC.visibility_of_element_located(locator))
-        return element
+    def wait_for_dom_quiet(
+        self,
+        *locators,
+        quiet=ConfigUI.DOM_QUIET_SECONDS,
+        timeout=30,
+        after_change=False,
+        unchanged_text=None,
+    ):
+        """Wait until the text and children under locators stop changing
 
-    def scroll_to_element(self, element):
-        self.driver.execute_script(
-            "arguments[0].scrollIntoView({behavior: 'smooth', block: 'center'});",
-            element,
-        )
+        A MutationObserver in the page watches the elements, so this is one
+        script call that returns quiet seconds after the last change.
 
-        # Wait for the browser to stop scrolling (Custom Wait)
-        try:
-            scroll_finished = self.wait.until(
-                lambda driver: driver.execute_script(
-                    """
-                    let scrollingElement = document.scrollingElement || document.documentElement;
-                    let initialScrollY = scrollingElement.scrollTop;
-                    let currentScrollY = window.scrollY || document.documentElement.scrollTop;
-                    return currentScrollY;
-                    """
-                )
+        after_change    - only start the quiet period once something changes,
+                          for updates (e.g. AJAX re-renders) that may not have
+                          begun yet; no change within timeout is a timeout
+        unchanged_text  - with after_change, the first element's text before
+                          the update; text that already differs counts as the
+                          change
+        """
+        targets = [self.find_element(locator) for locator in locators]
+        if not self._execute_async(
+            "dom_quiet",
+            DOM_QUIET_SCRIPT,
+            timeout,
+            targets,
+            quiet * 1000,
+            timeout * 1000,
+            after_change,
+            unchanged_text,
+        ):
+            what = "change and settle" if after_change else "stop changing"
+            raise TimeoutException(
+                f"Elements did not {what} within {timeout} seconds: {locators}"
             )
 
-        except TimeoutException:
-            print("Warning: Timed out waiting for smooth scrolling to fully finish.")
+    def _execute_async(self, step, script, timeout, *args):
+        """Run an in-page wait script; recorded like a wait with a single poll"""
+        self.driver.set_script_timeout(timeout + 5)
+        start = time.perf_counter()
+        try:
+            result = self.driver.execute_async_script(script, *args)
+        finally:
+            self.driver.set_script_timeout(ConfigUI.SCRIPT_TIMEOUT)
+        self.wait.recorder.record(
+            f"{type(self).__name__}.{step}",
+            time.perf_counter() - start,
+            1,
+            timed_out=not result,
+        )
+        return result
 
-        self.wait.until(EC.visibility_of(element))
+    def scroll_to_element(self, element, timeout=10):
+        """Jump to element without animation and wait until it is visible
+
+        Scrolling and the visibility check are one script call; an
+        IntersectionObserver reports when the element is in the viewport.
+        """
+        if not self._execute_async(
+            "scroll_into_view",
+            SCROLL_INTO_VIEW_SCRIPT,
+            timeout,
+            element,
+            timeout * 1000,
+        ):
+            raise TimeoutException(f"Element not visible after scrolling: {element}")
         return element
 
+    def scroll_to_element_by_locator(self, locator, timeout=10):
+        return self.scroll_to_element(self.find_element(locator), timeout)
+
+    def is_visible_after_scroll(self, locator, timeout=10):
+        try:
+            self.scroll_to_element_by_locator(locator, timeout)
+            return True
+        except WebDriverException:
+            return False
+
     def get_window_count(self):
         return len(self.driver.window_handles)
 
-    def wait_for_number_of_windows(self, num_windows):
+    def wait_for_number_of_windows(self, num_windows, timeout=None):
         try:
-            self.wait.until(lambda driver: len(driver.window_handles) == num_windows)
+            self._wait(
+                lambda driver: len(driver.window_handles) == num_windows,
+                "windows",
+                num_windows,
+                timeout,
+            )
             return True
         except TimeoutException:
             return False
@@ -121,7 +297,12 @@ class BasePage:
         if len(windows) > window_index:
             self.driver.switch_to.window(windows[window_index])
 
-    def wait_for_text_to_be_present_in_attribute(self, locator, text, attribute):
-        self.wait.until(
-            EC.text_to_be_present_in_element_attribute(locator, attribute, text)
+    def wait_for_text_to_be_present_in_attribute(
+        self, locator, text, attribute, timeout=None
+    ):
+        self._wait(
+            EC.text_to_be_present_in_element_attribute(locator, attribute, text),
+            f"{attribute}_contains",
+            locator,
+            timeout,
         )
@@ -20,25 +20,10 @@ class CareersPage(BasePage):
         return self.find_element(self.BIG_TITLE)
 
     def is_locations_block_visible(self):
-        try:
-            self.scroll_to_element_by_locator(self.LOCATIONS_BLOCK)
-            self.wait_for_element_to_be_visible(self.LOCATIONS_BLOCK)
-            return True
-        except:
-            return False
+        return self.is_visible_after_scroll(self.LOCATIONS_BLOCK)
 
     def is_teams_block_visible(self):
-        try:
-            self.scroll_to_element_by_locator(self.TEAMS_BLOCK)
-            self.wait_for_element_to_be_visible(self.TEAMS_BLOCK)
-            return True
-        except:
-            return False
+        return self.is_visible_after_scroll(self.TEAMS_BLOCK)
 
     def is_life_at_insider_block_visible(self):
-        try:
-            self.scroll_to_element_by_locator(self.LIFE_AT_INSIDER_BLOCK)
-            self.wait_for_element_to_be_visible(self.LIFE_AT_INSIDER_BLOCK)
-            return True
-        except:
-            return False
+        return self.is_visible_after_scroll(self.LIFE_AT_INSIDER_BLOCK)
@@ -1,7 +1,6 @@
 from selenium.webdriver.common.by import By
 from pages.base_page import BasePage
 from config.config import ConfigUI
-import time
 
 
 class QAJobsPage(BasePage):
@@ -10,42 +9,25 @@ class QAJobsPage(BasePage):
     LOCATION_FILTER = (By.ID, "select2-filter-by-location-container")
     DEPARTMENT_FILTER = (By.ID, "select2-filter-by-department-container")
     JOB_COUNT = (By.ID, "deneme")
+    JOB_LIST_CONTAINER = (By.ID, "jobs-list")
     JOB_LIST = (By.CSS_SELECTOR, ".position-list-item")
     DEPARTMENT_SEARCH = (By.XPATH, "//li[text()='Quality Assurance']")
     POSITION_TITLE = (By.CSS_SELECTOR, ".position-title")
     POSITION_LOCATION = (By.CSS_SELECTOR, ".position-location")
     POSITION_DEPARTMENT = (By.CSS_SELECTOR, ".position-department")
     POSITION_VIEW_ROLE = (By.LINK_TEXT, "View Role")
+    JOB_FIELDS = {
+        "position": POSITION_TITLE,
+        "department": POSITION_DEPARTMENT,
+        "location": POSITION_LOCATION,
+    }
 
     def __init__(self, driver):
         super().__init__(driver)
         self.url = ConfigUI.QA_CAREERS_URL
 
-    def wait_for_count_to_stabilize(self, stability_duration=3, timeout=30):
-        element = self.find_element(self.JOB_COUNT)
-
-        start_time = time.time()
-        last_value = None
-        last_change_time = time.time()
-
-        while time.time() - start_time < timeout:
-            current_value = element.text
-
-            if current_value != last_value:
-                # Value changed, reset the stability timer
-                last_value = current_value
-                last_change_time = time.time()
-            else:
-                # Value hasn't changed, check if it's been stable long enough
-                if time.time() - last_change_time >= stability_duration:
-                    return current_value
-
-            # Short sleep to avoid excessive CPU usage
-            time.sleep(0.1)
-
-        raise TimeoutError(
-            f"Element #{self.JOB_COUNT[1]} did not stabilize within {timeout} seconds"
-        )
+    def get_job_count(self):
+        return self.find_element(self.JOB_COUNT).text
 
     def open(self):
         self.navigate_to(self.url)
@@ -55,8 +37,22 @@ class QAJobsPage(BasePage):
         self.click(self.SEE_ALL_QA_JOBS_BUTTON)
         self.wait_for_url_contains("open-positions")
 
-    def wait_for_jobs_to_load(self):
-        self.wait_for_count_to_stabilize()
+    def wait_for_jobs_to_load(self, previous_count=None):
+        """Wait for the job list to re-render after a filter change
+
+        The list is reloaded by AJAX, sometimes well after the filter shows its
+        new value. previous_count is the count text read before the filter
+        changed: settling then only counts once the count or the list changed,
+        and a count that already differs means the reload has happened.
+        Without it this is a plain wait for the list to stop changing.
+        """
+        # The count and the list re-render separately after a filter changes
+        self.wait_for_dom_quiet(
+            self.JOB_COUNT,
+            self.JOB_LIST_CONTAINER,
+            after_change=previous_count is not None,
+            unchanged_text=previous_count,
+        )
         self.find_elements(self.JOB_LIST)
 
     def wait_for_deparment_filter_population(self):
@@ -65,31 +61,17 @@ class QAJobsPage(BasePage):
         )
 
     def filter_by_location(self, location):
+        previous_count = self.get_job_count()
         self.click(self.LOCATION_FILTER)
         self.click((By.XPATH, f"//li[text()='{location}']"))
-        self.wait_for_jobs_to_load()
+        self.wait_for_jobs_to_load(previous_count)
 
     def get_job_listings(self):
-        return self.find_elements(self.JOB_LIST)
-
-    def get_job_details(self, job_element):
-        try:
-            position = job_element.find_element(*self.POSITION_TITLE).text
-            department = job_element.find_element(*self.POSITION_DEPARTMENT).text
-            location = job_element.find_element(*self.POSITION_LOCATION).text
-
-            print(position)
-            print(department)
-            print(location)
-
-            return {
-                "position": position,
-                "department": department,
-                "location": location,
-            }
-        except Exception as e:
-            print(f"Error extracting job details: {e}")
-            return None
+        """Every listed job as a {"position", "department", "location"} dict
+
+        Values are the fields' visible text, or None when a listing lacks one.
+        """
+        return self.extract_rows(self.JOB_LIST, self.JOB_FIELDS)
 
     def verify_job_criteria(
         self,
@@ -97,7 +79,7 @@ class QAJobsPage(BasePage):
         expected_department="Quality Assurance",
         expected_location="Istanbul, Turkiye",
     ):
-        if not job_details:
+        if not job_details or None in job_details.values():
             return False
 
         position_match = expected_department in job_details["position"]
@@ -107,32 +89,11 @@ class QAJobsPage(BasePage):
         return position_match and department_match and location_match
 
     def verify_all_jobs(self):
-        jobs = self.get_job_listings()
-
-        for i, job in enumerate(jobs, 1):
-            job_details = self.get_job_details(job)
-
-            if not job_details:
-                print(f"\nJob {i}: Could not extract job details")
-                continue
-
-            print(f"\nJob {i}:")
-            print(f"  Position: {job_details['position']}")
-            print(f"  Department: {job_details['department']}")
-            print(f"  Location: {job_details['location']}")
-
-            is_valid = self.verify_job_criteria(job_details)
-
-            if is_valid:
-                print(f"Valid")
-            else:
-                print(f"Invalid")
-                return False
-
-        return True
+        """True when every listed job is a QA position in Istanbul"""
+        return all(self.verify_job_criteria(job) for job in self.get_job_listings())
 
     def click_view_role_for_first_job(self):
-        jobs = self.get_job_listings()
+        jobs = self.find_elements(self.JOB_LIST)
         if jobs:
             self.scroll_to_element(jobs[0])
             self.hover_over_element(jobs[0])
@@ -147,9 +108,11 @@ class QAJobsPage(BasePage):
             self.switch_to_window(1)
 
         # Wait for Lever page to load
-        self.wait.until(
+        self._wait(
             lambda driver: "lever.co" in driver.current_url
-            or "jobs.lever.co" in driver.current_url
+            or "jobs.lever.co" in driver.current_url,
+            "url_contains",
+            "lever.co",
         )
 
         current_url = self.get_current_url()
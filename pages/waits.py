@@ -0,0 +1,122 @@
+import threading
+import time
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from config.config import ConfigUI
+from utils.latency import LatencyHistogram
+
+
+def locator_label(locator):
+    by, value = locator
+    return f"{by}={value}"
+
+
+class WaitStats:
+    """Wait times and poll counts for one label"""
+
+    def __init__(self):
+        self.seconds = LatencyHistogram()
+        self.polls = 0
+        self.max_polls = 0
+        self.timeouts = 0
+
+    def summary(self):
+        summary = self.seconds.summary()
+        return {
+            "count": summary["count"],
+            "p50_ms": summary["p50_ms"],
+            "p95_ms": summary["p95_ms"],
+            "max_ms": summary["max_ms"],
+            "total_s": round(self.seconds.total, 3),
+            "mean_polls": round(self.polls / summary["count"], 1),
+            "max_polls": self.max_polls,
+            "timeouts": self.timeouts,
+        }
+
+
+class WaitRecorder:
+    """Thread-safe collection of how long each page wait took"""
+
+    def __init__(self):
+        self.labels = {}
+        self._lock = threading.Lock()
+
+    def record(self, label, seconds, polls, timed_out=False):
+        with self._lock:
+            stats = self.labels.get(label)
+            if stats is None:
+                stats = self.labels[label] = WaitStats()
+            stats.seconds.record(seconds)
+            stats.polls += polls
+            stats.max_polls = max(stats.max_polls, polls)
+            if timed_out:
+                stats.timeouts += 1
+
+    def reset(self):
+        with self._lock:
+            self.labels.clear()
+
+    def summary(self):
+        """Per-label stats, the labels that cost the most wall time first"""
+        with self._lock:
+            summaries = {label: stats.summary() for label, stats in self.labels.items()}
+        return dict(
+            sorted(summaries.items(), key=lambda item: item[1]["total_s"], reverse=True)
+        )
+
+
+# Shared by every page so the session report covers all UI tests
+default_wait_recorder = WaitRecorder()
+
+
+class AdaptiveWait:
+    """WebDriverWait replacement that polls fast at first and then backs off
+
+    timeout    - default seconds before until() raises TimeoutException
+    first_poll - seconds before the second check; most conditions hold
+                 within a few hundred milliseconds of the first try
+    max_poll   - cap on the interval as it grows by backoff after each poll
+    recorder   - gets each call's label, wait time and poll count
+    """
+
+    def __init__(
+        self,
+        driver,
+        timeout=ConfigUI.WAIT_TIMEOUT,
+        first_poll=ConfigUI.WAIT_FIRST_POLL,
+        max_poll=ConfigUI.WAIT_MAX_POLL,
+        backoff=1.5,
+        ignored_exceptions=(NoSuchElementException,),
+        recorder=default_wait_recorder,
+    ):
+        self.driver = driver
+        self.timeout = timeout
+        self.first_poll = first_poll
+        self.max_poll = max_poll
+        self.backoff = backoff
+        self.ignored_exceptions = ignored_exceptions
+        self.recorder = recorder
+
+    def until(self, condition, label=None, timeout=None, message=""):
+        """Return condition(driver) once it is truthy, like WebDriverWait.until"""
+        timeout = self.timeout if timeout is None else timeout
+        label = label or getattr(condition, "__name__", type(condition).__name__)
+        start = time.perf_counter()
+        deadline = start + timeout
+        interval = self.first_poll
+        polls = 0
+        while True:
+            polls += 1
+            try:
+                value = condition(self.driver)
+                if value:
+                    self.recorder.record(label, time.perf_counter() - start, polls)
+                    return value
+            except self.ignored_exceptions:
+                pass
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            time.sleep(min(interval, remaining))
+            interval = min(interval * self.backoff, self.max_poll)
+        self.recorder.record(label, time.perf_counter() - start, polls, timed_out=True)
+        raise TimeoutException(message or f"Timed out after {timeout}s: {label}")
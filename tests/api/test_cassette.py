@@ -0,0 +1,40 @@
+import pytest
+from api.cassette import Cassette, CassetteAdapter, CassetteMissError
+from utils.test_data import TestDataFactory
+
+
+class TestCassette:
+    """Test cases for recording and replaying Pet API traffic"""
+
+    def test_replay_returns_recorded_responses_without_network(
+        self, local_petstore, local_pet_api, tmp_path
+    ):
+        """Test replay serves recorded responses in order after the server is gone"""
+        path = str(tmp_path / "pets.cassette")
+        pet_data = TestDataFactory.valid_pet()
+
+        api = local_pet_api(transport=CassetteAdapter(Cassette(path), mode="record"))
+        api.create_pet(pet_data)
+        api.update_pet_with_form(pet_data["id"], name="Recorded")
+        recorded = api.get_pet_by_id(pet_data["id"]).json()
+        api.delete_pet(pet_data["id"])
+        missing = api.get_pet_by_id(pet_data["id"])
+        api.close()
+        local_petstore.stop()
+
+        api = local_pet_api(transport=CassetteAdapter(Cassette(path), mode="replay"))
+        # Body key order does not matter for matching
+        reordered = dict(reversed(list(pet_data.items())))
+        assert api.create_pet(reordered).status_code == 200
+        api.update_pet_with_form(pet_data["id"], name="Recorded")
+        assert api.get_pet_by_id(pet_data["id"]).json() == recorded
+        assert api.delete_pet(pet_data["id"]).status_code == 200
+        assert api.get_pet_by_id(pet_data["id"]).status_code == missing.status_code
+
+    def test_replay_miss_raises(self, local_pet_api, tmp_path):
+        """Test replay refuses to fall back to the network"""
+        cassette = Cassette(str(tmp_path / "empty.cassette"))
+        api = local_pet_api(transport=CassetteAdapter(cassette, mode="replay"))
+
+        with pytest.raises(CassetteMissError):
+            api.find_pets_by_status("available")
@@ -0,0 +1,61 @@
+import pytest
+import requests
+from api.cache import ResponseCache
+from api.codec import CODECS, get_codec, install_cached_json
+from utils.test_data import TestDataFactory
+
+
+class TestJsonCodec:
+    """Test cases for pluggable JSON codecs"""
+
+    @pytest.mark.parametrize("name", sorted(CODECS))
+    def test_round_trip(self, name):
+        """Test every installed codec encodes to bytes and decodes back"""
+        codec = CODECS[name]
+        pet_data = TestDataFactory.valid_pet()
+        pet_data["name"] = "宠物🐕Питомец"
+
+        encoded = codec.encode(pet_data)
+
+        assert isinstance(encoded, bytes)
+        assert codec.decode(encoded) == pet_data
+
+    def test_unknown_codec_is_rejected(self):
+        with pytest.raises(ValueError):
+            get_codec("yaml")
+
+    @pytest.mark.parametrize("name", sorted(CODECS))
+    def test_pet_api_with_codec(self, local_pet_api, monkeypatch, name):
+        """Test create pet with each codec and parse the response only once"""
+        pet_api = local_pet_api()
+        monkeypatch.setattr(pet_api, "codec", CODECS[name])
+        pet_data = TestDataFactory.valid_pet()
+
+        response = pet_api.create_pet(pet_data)
+
+        assert response.status_code == 200
+        assert response.json()["name"] == pet_data["name"]
+        assert response.json() is response.json()
+
+    @pytest.mark.parametrize("name", sorted(CODECS))
+    def test_invalid_body_raises_requests_error(self, name):
+        """Test a bad body fails the way requests' own json() does"""
+        response = requests.Response()
+        response._content = b"<html>Bad Gateway</html>"
+        install_cached_json(response, CODECS[name])
+
+        with pytest.raises(requests.exceptions.JSONDecodeError):
+            response.json()
+
+    def test_cached_copies_do_not_share_decoded_json(self, local_pet_api):
+        """Test callers served from the cache each get their own parsed body"""
+        pet_api = local_pet_api(cache=ResponseCache())
+        pet_data = TestDataFactory.valid_pet()
+        pet_api.create_pet(pet_data)
+
+        first = pet_api.get_pet_by_id(pet_data["id"])
+        first.json()["name"] = "changed"
+        second = pet_api.get_pet_by_id(pet_data["id"])
+
+        assert second.json()["name"] == pet_data["name"]
+        assert pet_api.cache.hits == 1
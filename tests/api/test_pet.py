@@ -1,4 +1,11 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 import pytest
+import requests
+from api.cache import ResponseCache
+from api.pet_api import PetAPI
+from utils.id_allocator import missing_id
 from utils.test_data import TestDataFactory, PetDataBuilder
 
 
@@ -140,6 +147,15 @@ class TestPetRetrieval:
         if len(data) > 0:
             assert data[0]["status"] == "available"
 
+    def test_iter_pets_by_available_status(self, pet_api):
+        """Test stream pets with available status and stop after the first"""
+        pets = pet_api.iter_pets_by_status("available")
+        first = next(pets, None)
+        pets.close()
+
+        if first is not None:
+            assert first["status"] == "available"
+
     def test_find_pets_by_multiple_statuses(self, pet_api):
         """Test find pets with multiple statuses"""
         response = pet_api.find_pets_by_status(["available", "pending"])
@@ -148,9 +164,20 @@ class TestPetRetrieval:
         data = response.json()
         assert isinstance(data, list)
 
+    def test_find_pets_by_tags(self, pet_api, created_pet):
+        """Test find pets by tag name"""
+        response = pet_api.find_pets_by_tags(["friendly"])
+
+        assert response.status_code == 200
+        data = response.json()
+        assert isinstance(data, list)
+        assert all(
+            "friendly" in [tag["name"] for tag in pet.get("tags", [])] for pet in data
+        )
+
     def test_get_non_existent_pet(self, pet_api):
         """Test return 404 for non-existent pet"""
-        response = pet_api.get_pet_by_id(999999991)
+        response = pet_api.get_pet_by_id(missing_id())
 
         assert response.status_code == 404
         assert "message" in response.json()
@@ -280,11 +307,14 @@ class TestPetUpdate:
         assert data["name"] == "Form Updated"
         assert data["status"] == "pending"
 
-    def test_update_non_existent_pet(self, pet_api):
+    def test_update_non_existent_pet(self, pet_api, cleanup_pet):
         """Test fail to update non-existent pet"""
-        pet_data = PetDataBuilder().with_id(999999991).with_name("Non Existent").build()
+        # A freshly allocated id that was never created; Petstore creates the pet
+        # instead, so it is cleaned up like any other
+        pet_data = PetDataBuilder().with_id().with_name("Non Existent").build()
 
         response = pet_api.update_pet(pet_data)
+        cleanup_pet(pet_data["id"])
 
         assert response.status_code in [404, 405]
 
@@ -339,7 +369,7 @@ class TestPetDeletion:
 
     def test_delete_non_existent_pet(self, pet_api):
         """Should return 404 when deleting non-existent pet"""
-        response = pet_api.delete_pet(999999991)
+        response = pet_api.delete_pet(missing_id())
 
         assert response.status_code == 404
 
@@ -358,3 +388,137 @@ class TestPetDeletion:
         response = pet_api.delete_pet("invalid_id")
 
         assert response.status_code in [400, 404]
+
+
+class TestPetBulk:
+    """Test cases for bulk pet operations"""
+
+    def test_bulk_create_get_delete(self, pet_api):
+        """Test bulk operations keep results in input order"""
+        pets = [
+            PetDataBuilder().with_id().with_name(f"Bulk{i}").build() for i in range(25)
+        ]
+        pet_ids = [pet["id"] for pet in pets]
+
+        created = pet_api.create_pets(pets, concurrency=5)
+
+        assert not created.failures, created.summary()
+        assert [r.json()["id"] for r in created.responses] == pet_ids
+
+        fetched = pet_api.get_pets(pet_ids, concurrency=5)
+
+        assert not fetched.failures, fetched.summary()
+        assert [r.json()["name"] for r in fetched.responses] == [
+            pet["name"] for pet in pets
+        ]
+
+        deleted = pet_api.delete_pets(pet_ids, concurrency=5)
+
+        assert not deleted.failures, deleted.summary()
+        assert deleted.elapsed > 0
+
+    def test_bulk_reports_per_item_failures(self, pet_api):
+        """Test failed items are reported without stopping the batch"""
+        result = pet_api.get_pets([missing_id(), "invalid_id"])
+
+        assert len(result) == 2
+        assert [item.index for item in result] == [0, 1]
+        assert len(result.failures) == 2
+
+
+class TestPetCaching:
+    """Test cases for the opt-in GET response cache"""
+
+    @pytest.fixture
+    def cached_pet_api(self, api_transport):
+        api = PetAPI(
+            cache=ResponseCache(ttl=60, max_entries=16), transport=api_transport
+        )
+        yield api
+        api.close()
+
+    def test_repeated_get_is_served_from_cache(self, cached_pet_api, created_pet):
+        """Test a second identical GET does not hit the network"""
+        first = cached_pet_api.get_pet_by_id(created_pet["id"])
+        second = cached_pet_api.get_pet_by_id(created_pet["id"])
+
+        assert first.status_code == 200
+        assert second.json() == first.json()
+        assert cached_pet_api.cache.stats()["hits"] == 1
+
+    def test_callers_get_independent_copies(self, cached_pet_api, created_pet):
+        """Test mutating one caller's cached response does not leak to the next"""
+        first = cached_pet_api.get_pet_by_id(created_pet["id"])
+        name = first.json()["name"]
+        first.json()["name"] = "Mutated"
+        second = cached_pet_api.get_pet_by_id(created_pet["id"])
+
+        assert second is not first
+        assert second.json()["name"] == name
+        assert cached_pet_api.cache.stats()["hits"] == 1
+
+    def test_vary_headers_are_part_of_the_key(self):
+        """Test requests differing only in Accept are cached separately"""
+        url = "http://petstore/pet/1"
+        json_key = ResponseCache.make_key(
+            "GET", url, headers={"Accept": "application/json"}
+        )
+        xml_key = ResponseCache.make_key(
+            "GET", url, headers={"Accept": "application/xml"}
+        )
+        other_key = ResponseCache.make_key(
+            "GET", url, headers={"Accept": "application/json", "X-Trace": "1"}
+        )
+
+        assert json_key != xml_key
+        assert json_key == other_key
+
+    def test_update_invalidates_cached_pet(self, cached_pet_api, cleanup_pet):
+        """Test update_pet_with_form drops the cached read of the same pet"""
+        # Its own pet: the update must not leak into tests sharing created_pet
+        pet_id = cached_pet_api.create_pet(TestDataFactory.valid_pet()).json()["id"]
+        cleanup_pet(pet_id)
+        cached_pet_api.get_pet_by_id(pet_id)
+
+        cached_pet_api.update_pet_with_form(pet_id, name="Cache Busted")
+        data = cached_pet_api.get_pet_by_id(pet_id).json()
+
+        assert data["name"] == "Cache Busted"
+        assert cached_pet_api.cache.stats()["invalidations"] == 1
+
+    def test_error_responses_are_not_cached(self, cached_pet_api):
+        """Test 404 responses are fetched again on the next call"""
+        cached_pet_api.get_pet_by_id(missing_id())
+        cached_pet_api.get_pet_by_id(missing_id())
+
+        assert cached_pet_api.cache.stats()["misses"] == 2
+
+    def test_concurrent_identical_gets_share_one_fetch(self):
+        """Test single-flight: concurrent callers wait for one in-flight fetch"""
+        cache = ResponseCache()
+        calls = []
+        release = threading.Event()
+
+        def fetch():
+            calls.append(1)
+            release.wait(5)
+            response = requests.Response()
+            response.status_code = 200
+            response._content = b"[]"
+            return response
+
+        key = cache.make_key(
+            "GET", "http://petstore/pet/findByStatus", {"status": "sold"}
+        )
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            futures = [
+                executor.submit(cache.get_or_fetch, key, fetch) for _ in range(8)
+            ]
+            while cache.stats()["coalesced"] < 7:
+                time.sleep(0.01)
+            release.set()
+            responses = [future.result() for future in futures]
+
+        assert len(calls) == 1
+        assert len({id(response) for response in responses}) == 8
+        assert all(response.content == b"[]" for response in responses)
@@ -0,0 +1,68 @@
+import asyncio
+import pytest
+from utils.test_data import TestDataFactory, PetDataBuilder
+
+pytestmark = pytest.mark.asyncio(loop_scope="session")
+
+
+class TestAsyncPetCrud:
+    """Test cases for the async pet client"""
+
+    async def test_create_and_get_pet(self, async_pet_api, cleanup_pet):
+        """Test create a pet and read it back"""
+        pet_data = TestDataFactory.valid_pet()
+
+        response = await async_pet_api.create_pet(pet_data)
+        cleanup_pet(pet_data["id"])
+
+        assert response.status_code == 200, f"Failed: {response.text}"
+        assert response.json()["id"] == pet_data["id"]
+
+        response = await async_pet_api.get_pet_by_id(pet_data["id"])
+
+        assert response.status_code == 200
+        assert response.json()["name"] == pet_data["name"]
+
+    async def test_update_pet_with_form_data(self, async_pet_api, cleanup_pet):
+        """Test update pet using form data"""
+        pet_data = TestDataFactory.valid_pet()
+        await async_pet_api.create_pet(pet_data)
+        cleanup_pet(pet_data["id"])
+
+        response = await async_pet_api.update_pet_with_form(
+            pet_data["id"], name="Form Updated", status="pending"
+        )
+
+        assert response.status_code == 200
+        data = (await async_pet_api.get_pet_by_id(pet_data["id"])).json()
+        assert data["name"] == "Form Updated"
+        assert data["status"] == "pending"
+
+    async def test_find_pets_by_multiple_statuses(self, async_pet_api):
+        """Test find pets with multiple statuses"""
+        response = await async_pet_api.find_pets_by_status(["available", "pending"])
+
+        assert response.status_code == 200
+        assert isinstance(response.json(), list)
+
+    async def test_concurrent_pet_lifecycle(self, async_pet_api, cleanup_pet):
+        """Test many pets created, fetched and deleted concurrently"""
+        pets = [
+            PetDataBuilder().with_id().with_name(f"Async{i}").build() for i in range(20)
+        ]
+
+        responses = await asyncio.gather(*(async_pet_api.create_pet(p) for p in pets))
+        # Already deleted by the end unless an assertion fails first
+        for pet in pets:
+            cleanup_pet(pet["id"])
+        assert all(r.status_code == 200 for r in responses)
+
+        responses = await asyncio.gather(
+            *(async_pet_api.get_pet_by_id(p["id"]) for p in pets)
+        )
+        assert [r.json()["name"] for r in responses] == [p["name"] for p in pets]
+
+        responses = await asyncio.gather(
+            *(async_pet_api.delete_pet(p["id"]) for p in pets)
+        )
+        assert all(r.status_code == 200 for r in responses)
@@ -0,0 +1,42 @@
+import pytest
+from api.pet_pool import PetPool
+
+
+class TestPetPool:
+    """Test cases for the pre-created pet pool"""
+
+    @pytest.fixture
+    def api(self, local_pet_api):
+        return local_pet_api()
+
+    def test_acquire_returns_created_pets(self, api):
+        """Test pooled pets exist on the server and are handed out once"""
+        pool = PetPool(api, size=4, low_water=1).start()
+        pets = [pool.acquire() for _ in range(6)]
+        pool.close()
+
+        assert len({pet["id"] for pet in pets}) == 6
+        for pet in pets:
+            assert api.get_pet_by_id(pet["id"]).status_code == 200
+        assert pool.stats()["handed_out"] + pool.stats()["misses"] == 6
+
+    def test_close_deletes_leftovers(self, api):
+        """Test pets nobody acquired are removed at the end"""
+        pool = PetPool(api, size=5, low_water=0).start()
+        taken = pool.acquire()
+        leftovers = pool.close()
+
+        assert leftovers
+        assert taken["id"] not in leftovers
+        for pet_id in leftovers:
+            assert api.get_pet_by_id(pet_id).status_code == 404
+        assert api.get_pet_by_id(taken["id"]).status_code == 200
+
+    def test_disabled_pool_creates_inline(self, api):
+        """Test size 0 creates each pet on acquire without a background thread"""
+        pool = PetPool(api, size=0).start()
+        pet = pool.acquire()
+
+        assert api.get_pet_by_id(pet["id"]).status_code == 200
+        assert pool.stats() == {"ready": 0, "created": 0, "handed_out": 0, "misses": 1}
+        assert pool.close() == []
@@ -0,0 +1,72 @@
+from api.pet_api import PetAPI
+from api.reaper import PetReaper
+from utils.test_data import TestDataFactory
+
+
+class FlakyPetAPI(PetAPI):
+    """PetAPI whose first DELETE per pet fails with a connection error"""
+
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        self.attempts = {}
+
+    def delete_pet(self, pet_id):
+        self.attempts[pet_id] = self.attempts.get(pet_id, 0) + 1
+        if self.attempts[pet_id] == 1:
+            raise ConnectionError("connection reset")
+        return super().delete_pet(pet_id)
+
+
+class TestPetReaper:
+    """Test cases for deferred pet cleanup"""
+
+    def _create(self, api, count):
+        pets = [TestDataFactory.valid_pet() for _ in range(count)]
+        api.create_pets(pets)
+        return [pet["id"] for pet in pets]
+
+    def test_close_deletes_registered_pets(self, local_pet_api):
+        """Test everything registered is gone after close, in several batches"""
+        api = local_pet_api()
+        pet_ids = self._create(api, 7)
+        reaper = PetReaper(api, batch_size=3, interval=None).start()
+        reaper.register(*pet_ids)
+
+        assert api.get_pet_by_id(pet_ids[0]).status_code == 200
+        assert reaper.close() == {}
+        assert reaper.deleted == 7
+        for pet_id in pet_ids:
+            assert api.get_pet_by_id(pet_id).status_code == 404
+
+    def test_background_flush_at_batch_size(self, local_pet_api):
+        """Test a full batch is deleted without waiting for close"""
+        api = local_pet_api()
+        pet_ids = self._create(api, 4)
+        reaper = PetReaper(api, batch_size=4, interval=60).start()
+        reaper.register(*pet_ids)
+
+        with reaper._condition:
+            reaper._condition.wait_for(lambda: not reaper._pending, 5)
+        reaper.close()
+        assert reaper.deleted == 4
+
+    def test_transient_failures_are_retried(self, local_pet_api):
+        """Test a failed DELETE is retried and the pet is not reported"""
+        api = local_pet_api(FlakyPetAPI)
+        pet_ids = self._create(api, 3)
+        reaper = PetReaper(api, interval=None, backoff=0).start()
+        reaper.register(*pet_ids)
+
+        assert reaper.close() == {}
+        assert all(api.attempts[pet_id] == 2 for pet_id in pet_ids)
+
+    def test_unreachable_target_is_reported(self, local_petstore, local_pet_api):
+        """Test pets that cannot be deleted are reported with the last error"""
+        api = local_pet_api()
+        local_petstore.stop()
+        reaper = PetReaper(api, interval=None, retries=1, backoff=0).start()
+        reaper.register(1, 2)
+
+        failed = reaper.close()
+        assert set(failed) == {1, 2}
+        assert "Error" in failed[1]
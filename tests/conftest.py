@@ -1,13 +1,25 @@
 import datetime
+import json
 import pytest
-from selenium import webdriver
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from selenium.webdriver.chrome.service import Service as ChromeService
-from selenium.webdriver.firefox.service import Service as FirefoxService
 import os
+import pytest_asyncio
+from api.cache import ResponseCache
+from api.cassette import Cassette, CassetteAdapter
+from api.metrics import default_recorder
 from api.pet_api import PetAPI
-from utils.test_data import TestDataFactory, PetDataBuilder
+from api.pet_pool import PetPool
+from api.reaper import PetReaper
+from api.async_pet_api import AsyncPetAPI
+from config.config import ConfigApi, ConfigUI
+from loadgen.arrival import ConstantRate
+from loadgen.jmx import parse_jmx
+from loadgen.open_model import OpenModelRunner
+from loadgen.sla import SLA
+from utils import id_allocator
+from utils.n11_server import N11Server
+from pages.waits import default_wait_recorder
+from utils.browser_pool import BrowserPool, create_driver
+from utils.petstore_server import PetstoreServer
 
 
 def pytest_addoption(parser):
@@ -18,34 +30,114 @@ def pytest_addoption(parser):
         default="chrome",
         help="Browser to run tests: chrome or firefox",
     )
+    parser.addoption(
+        "--browser-pool-size",
+        action="store",
+        type=int,
+        default=ConfigUI.BROWSER_POOL_SIZE,
+        help="Browser sessions launched up front and reused across UI tests",
+    )
+    parser.addoption(
+        "--api-cache",
+        action="store_true",
+        default=False,
+        help="Cache idempotent Pet API GET responses",
+    )
+    parser.addoption(
+        "--latency-report",
+        action="store",
+        default=None,
+        help="Save per-endpoint API latency percentiles to this JSON file",
+    )
+    parser.addoption(
+        "--wait-report",
+        action="store",
+        default=None,
+        help="Save per-locator UI wait times to this JSON file",
+    )
+    parser.addoption(
+        "--local-petstore",
+        action="store_true",
+        default=False,
+        help="Run API tests against an in-process Petstore instead of the public one",
+    )
+    parser.addoption(
+        "--cassette",
+        action="store",
+        default=None,
+        help="Cassette file for recording/replaying Pet API traffic",
+    )
+    parser.addoption(
+        "--cassette-mode",
+        action="store",
+        default="auto",
+        choices=CassetteAdapter.MODES,
+        help="record, replay (no network) or auto (replay, record misses)",
+    )
+    parser.addoption(
+        "--load-target",
+        action="store",
+        default=None,
+        help="Base URL for SLA load tests (default: local n11 stand-in)",
+    )
 
 
-@pytest.fixture(scope="function")
-def driver(request):
-    """Initialize and return WebDriver based on browser parameter"""
+def pytest_configure(config):
+    """Register the sla marker and set up run-wide API test state
+
+    The local Petstore starts before any API client reads the base URL, and
+    cassette runs get a fixed pet id range.
+    """
+    config.addinivalue_line(
+        "markers",
+        "sla(p95_ms, p99_ms, error_rate, min_throughput, labels): "
+        "thresholds the test's load_scenario run must meet",
+    )
+    if config.getoption("--local-petstore"):
+        config.petstore_server = PetstoreServer().start()
+        ConfigApi.BASE_URL = config.petstore_server.base_url
+    if config.getoption("--cassette"):
+        # Recorded bodies contain generated pet ids, so they must repeat per run
+        id_allocator.configure(run_id="cassette")
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node):
+    """xdist controller: note the run whose shared id counter to remove"""
+    node.config.xdist_testrunuid = node.workerinput["testrunuid"]
+
+
+def pytest_sessionfinish(session):
+    # Set only on the xdist controller, which finishes after every worker
+    xdist_run = getattr(session.config, "xdist_testrunuid", None)
+    if xdist_run:
+        id_allocator.remove_state(xdist_run)
+
+
+def pytest_unconfigure(config):
+    server = getattr(config, "petstore_server", None)
+    if server:
+        server.stop()
+
+
+@pytest.fixture(scope="session")
+def browser_pool(request):
+    """Browser sessions of this worker, launched once and reused"""
     browser = request.config.getoption("--browser").lower()
+    pool = BrowserPool(
+        lambda: create_driver(browser),
+        size=request.config.getoption("--browser-pool-size"),
+    )
+    yield pool.start()
+    pool.close()
 
-    if browser == "chrome":
-        options = webdriver.ChromeOptions()
-        options.add_argument("--start-maximized")
-        options.add_argument("--disable-blink-features=AutomationControlled")
-        prefs = {"profile.default_content_setting_values.notifications": 2}
-        options.add_experimental_option("prefs", prefs)
-        driver = webdriver.Chrome(
-            service=ChromeService(ChromeDriverManager().install()), options=options
-        )
-    elif browser == "firefox":
-        options = webdriver.FirefoxOptions()
-        driver = webdriver.Firefox(
-            service=FirefoxService(GeckoDriverManager().install()), options=options
-        )
-        driver.maximize_window()
-    else:
-        raise ValueError(f"Unsupported browser: {browser}")
 
+@pytest.fixture(scope="function")
+def driver(browser_pool):
+    """A reset WebDriver session from the pool"""
+    driver = browser_pool.acquire()
     yield driver
-
-    driver.quit()
+    browser_pool.release(driver)
 
 
 @pytest.hookimpl(tryfirst=True, hookwrapper=True)
@@ -73,15 +165,124 @@ def pytest_runtest_makereport(item, call):
 
 
 @pytest.fixture(scope="session")
-def pet_api():
+def api_transport(request):
+    """Cassette transport shared by every PetAPI when --cassette is given"""
+    if not request.config.getoption("--cassette"):
+        return None
+    return CassetteAdapter(
+        Cassette(request.config.getoption("--cassette")),
+        mode=request.config.getoption("--cassette-mode"),
+        pool_maxsize=ConfigApi.POOL_SIZE,
+    )
+
+
+@pytest.fixture(scope="session")
+def pet_api(request, api_transport):
     """Create PetAPI instance for the test session"""
-    api = PetAPI()
+    cache = None
+    if request.config.getoption("--api-cache"):
+        cache = ResponseCache()
+        request.config.api_cache = cache
+    api = PetAPI(cache=cache, transport=api_transport)
     yield api
     api.close()
 
 
+def _report_waits(terminalreporter, config):
+    """Where UI tests spent their time waiting, costliest waits first"""
+    waits = default_wait_recorder.summary()
+    if not waits:
+        return
+
+    terminalreporter.write_sep("-", "UI waits")
+    terminalreporter.write_line(
+        f"{'wait':<64}{'count':>6}{'total s':>9}{'p95 ms':>10}"
+        f"{'max ms':>10}{'polls':>7}{'timeouts':>10}"
+    )
+    for label, stats in waits.items():
+        terminalreporter.write_line(
+            f"{label[:63]:<64}{stats['count']:>6}{stats['total_s']:>9}"
+            f"{stats['p95_ms']:>10}{stats['max_ms']:>10}"
+            f"{stats['mean_polls']:>7}{stats['timeouts']:>10}"
+        )
+
+    report_path = config.getoption("--wait-report")
+    if report_path:
+        os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+        with open(report_path, "w") as report_file:
+            json.dump(waits, report_file, indent=2)
+        terminalreporter.write_line(f"Wait report saved: {report_path}")
+
+
+def pytest_terminal_summary(terminalreporter, config):
+    """Report API latency percentiles, cache savings and UI wait times"""
+    reaper = getattr(config, "pet_reaper", None)
+    if reaper and reaper.failed:
+        terminalreporter.write_sep("-", "Pets left behind")
+        for pet_id, reason in reaper.failed.items():
+            terminalreporter.write_line(f"{pet_id}: {reason}")
+
+    cache = getattr(config, "api_cache", None)
+    if cache:
+        stats = cache.stats()
+        terminalreporter.write_sep("-", "Pet API response cache")
+        terminalreporter.write_line(
+            ", ".join(f"{name}: {value}" for name, value in stats.items())
+        )
+
+    _report_waits(terminalreporter, config)
+
+    latency = default_recorder.summary()
+    if not latency:
+        return
+
+    terminalreporter.write_sep("-", "API latency (ms)")
+    terminalreporter.write_line(
+        f"{'endpoint':<32}{'count':>7}{'p50':>10}{'p95':>10}{'p99':>10}"
+        f"{'server p95':>12}{'errors':>8}"
+    )
+    for label, stats in latency.items():
+        total, server = stats["total"], stats["server"]
+        terminalreporter.write_line(
+            f"{label:<32}{total['count']:>7}{total['p50_ms']:>10}"
+            f"{total['p95_ms']:>10}{total['p99_ms']:>10}"
+            f"{str(server['p95_ms']):>12}{stats['errors']:>8}"
+        )
+
+    report_path = config.getoption("--latency-report")
+    if report_path:
+        os.makedirs(os.path.dirname(report_path) or ".", exist_ok=True)
+        with open(report_path, "w") as report_file:
+            json.dump(latency, report_file, indent=2)
+        terminalreporter.write_line(f"Latency report saved: {report_path}")
+
+
+@pytest_asyncio.fixture(scope="session", loop_scope="session")
+async def async_pet_api(request):
+    """Create AsyncPetAPI instance sharing one connection pool for the session"""
+    if request.config.getoption("--cassette"):
+        # Cassettes hook into requests; aiohttp traffic would reach the network
+        pytest.skip("async Pet API tests are not recorded in cassettes")
+    api = AsyncPetAPI()
+    yield api
+    await api.close()
+
+
+@pytest.fixture(scope="session")
+def pet_reaper(request, pet_api):
+    """Deletes registered pets in the background and once more at session end"""
+    # Cassettes delete only at session end so recorded traffic stays in order
+    interval = (
+        None if request.config.getoption("--cassette") else ConfigApi.REAPER_INTERVAL
+    )
+    reaper = PetReaper(pet_api, interval=interval).start()
+    request.config.pet_reaper = reaper
+    yield reaper
+    reaper.close()
+
+
 @pytest.fixture(scope="function")
-def cleanup_pet(pet_api):
+def cleanup_pet(pet_reaper):
     """Fixture for cleaning up pets after test"""
     pets_to_cleanup = []
 
@@ -90,43 +291,100 @@ def cleanup_pet(pet_api):
 
     yield _add_pet
 
-    # Cleanup after test
-    for pet_id in pets_to_cleanup:
-        try:
-            pet_api.delete_pet(pet_id)
-        except:
-            pass
+    # Deleted by the reaper, off the test's teardown
+    pet_reaper.register(*pets_to_cleanup)
 
 
-@pytest.fixture(scope="module")
-def valid_pet_data():
-    """Get valid pet data"""
-    return TestDataFactory.valid_pet()
+@pytest.fixture(scope="session")
+def pet_pool(request, pet_api, pet_reaper):
+    """Valid pets created in the background ahead of the fixtures that need them"""
+    # Background creation would reorder recorded traffic, so cassettes get none
+    size = 0 if request.config.getoption("--cassette") else ConfigApi.PET_POOL_SIZE
+    pool = PetPool(pet_api, size=size, reaper=pet_reaper).start()
+    yield pool
+    pool.close()
 
 
 @pytest.fixture(scope="module")
-def created_pet(pet_api, valid_pet_data):
-    """Create a pet and return its data"""
-    response = pet_api.create_pet(valid_pet_data)
-    pet_data = response.json()
+def created_pet(pet_pool, pet_reaper):
+    """Take a created pet from the pool and return its data"""
+    pet_data = pet_pool.acquire()
     yield pet_data
-    # Cleanup
-    try:
-        pet_api.delete_pet(pet_data["id"])
-    except:
-        pass
+    pet_reaper.register(pet_data["id"])
 
 
 @pytest.fixture(scope="function")
-def pet_for_deletion(pet_api):
-    """Create a pet specifically for deletion tests"""
-    pet_data = (
-        PetDataBuilder()
-        .with_id()
-        .with_name("PetToDelete")
-        .with_status("available")
-        .build()
-    )
+def pet_for_deletion(pet_pool, pet_reaper):
+    """Take a created pet from the pool specifically for deletion tests"""
+    pet_data = pet_pool.acquire()
+    yield pet_data
+    # Usually deleted by the test already; a 404 counts as cleaned
+    pet_reaper.register(pet_data["id"])
+
+
+@pytest.fixture(scope="function")
+def local_petstore():
+    """A fresh in-process Petstore for tests that need their own store"""
+    with PetstoreServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="function")
+def local_pet_api(local_petstore):
+    """Factory for Pet API clients pointed at local_petstore
+
+    local_pet_api(api_class=PetAPI, **kwargs) builds a client; all of them
+    are closed after the test.
+    """
+    apis = []
+
+    def _build(api_class=PetAPI, **kwargs):
+        api = api_class(**kwargs)
+        api.base_url = local_petstore.base_url
+        apis.append(api)
+        return api
+
+    yield _build
+    for api in apis:
+        api.close()
+
+
+@pytest.fixture(scope="function")
+def n11_server():
+    """Local stand-in for the n11 homepage and search pages"""
+    with N11Server() as server:
+        yield server
+
+
+@pytest.fixture(scope="function")
+def load_target(request):
+    """Base URL for load scenarios: --load-target or a local n11 stand-in"""
+    target = request.config.getoption("--load-target")
+    if target:
+        yield target
+        return
+    with N11Server() as server:
+        yield server.base_url
+
+
+@pytest.fixture(scope="function")
+def load_scenario(request):
+    """Run a plan at a constant arrival rate and fail the test if it breaks its sla marker
+
+    Latency is checked after coordinated-omission correction.
+    """
+    marker = request.node.get_closest_marker("sla")
+
+    def _run(jmx_path, rate, duration, **options):
+        result = OpenModelRunner(
+            parse_jmx(jmx_path), ConstantRate(rate, duration), **options
+        ).run()
+        if marker:
+            sla = SLA(**marker.kwargs)
+            request.node.user_properties.append(("sla", sla.measure(result.corrected)))
+            violations = sla.violations(result.corrected)
+            if violations:
+                pytest.fail(f"SLA violated: {'; '.join(violations)}", pytrace=False)
+        return result
 
-    response = pet_api.create_pet(pet_data)
-    return response.json()
+    return _run
@@ -0,0 +1,81 @@
+import random
+from collections import Counter
+
+import pytest
+from loadgen.corpus import CorpusGenerator, typo, vocabulary
+from loadgen.feed import CsvFeed
+from loadgen.jmx import CsvDataSet, parse_jmx
+from loadgen.runner import LoadRunner
+
+
+class TestCorpusGenerator:
+    """Test cases for generated search-term feeds"""
+
+    def test_zipf_popularity(self):
+        """Test the most popular term gets about 1/H(n) of the rows"""
+        generator = CorpusGenerator(1000, typo_rate=0, special_rate=0, seed=3)
+        counts = Counter(generator.terms_stream(20000))
+        top_term, top_count = counts.most_common(1)[0]
+
+        assert top_term == generator.terms[0]
+        assert top_count / 20000 == pytest.approx(1 / 7.485, rel=0.1)
+        assert counts[generator.terms[0]] > counts[generator.terms[9]] * 5
+        assert generator.head_share(0.01) == pytest.approx(0.39, abs=0.01)
+
+    def test_repeatable_for_seed(self):
+        first = list(CorpusGenerator(500, seed=1).terms_stream(1000))
+
+        assert first == list(CorpusGenerator(500, seed=1).terms_stream(1000))
+        assert first != list(CorpusGenerator(500, seed=2).terms_stream(1000))
+
+    def test_character_mix(self):
+        """Test Turkish letters, typos and special characters all show up"""
+        generator = CorpusGenerator(2000, typo_rate=0.2, special_rate=0.1)
+        terms = list(generator.terms_stream(5000))
+        vocabulary_terms = set(generator.terms)
+
+        assert any(set(term) & set("çğıöşü") for term in terms)
+        assert any(set(term) & set("!@#$%^&*()") for term in terms)
+        assert 0.2 < sum(term not in vocabulary_terms for term in terms) / 5000 < 0.35
+        assert not any(set(term) & set(',"\n\r') for term in terms)
+
+    def test_vocabulary_is_distinct(self):
+        terms = vocabulary(20000)
+
+        assert len(set(terms)) == 20000
+
+    @pytest.mark.parametrize("seed", range(20))
+    def test_typo_changes_term(self, seed):
+        assert typo("kulaklık", random.Random(seed)) != "kulaklık"
+
+
+class TestCorpusFeed:
+    """Test cases for reading a generated corpus in load runs"""
+
+    def test_partitioned_feeds_read_every_row_once(self, tmp_path):
+        path = str(tmp_path / "terms.csv")
+        generator = CorpusGenerator(300, seed=4)
+        generator.write(path, 1000)
+        data_set = CsvDataSet(path, ["SEARCH_QUERY"], recycle=False, stop_thread=True)
+
+        rows = []
+        for index in range(3):
+            feed = CsvFeed(data_set, 3, index)
+            while (row := feed.next_row()) is not None:
+                rows.append(row["SEARCH_QUERY"])
+            feed.close()
+
+        assert sorted(rows) == sorted(generator.terms_stream(1000))
+
+    def test_plan_runs_on_generated_corpus(self, n11_server, tmp_path):
+        """Test --csv style override replaces the plan's hand-written queries"""
+        path = str(tmp_path / "terms.csv")
+        CorpusGenerator(100, typo_rate=0, special_rate=0, seed=5).write(path, 10)
+
+        plan = parse_jmx("jmeter/test_n11.jmx", csv_file=path)
+        LoadRunner(plan, base_url=n11_server.base_url, timer_scale=0).run()
+
+        searches = [q for p, q in n11_server.requests if p == "/arama"]
+        assert len(searches) == 10
+        assert searches[0] != "q=laptop&q=laptop&srt=PRICE_HIGH"
+        assert plan.thread_groups[0].csv_data_sets[0].filename == path
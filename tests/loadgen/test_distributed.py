@@ -0,0 +1,67 @@
+from loadgen.arrival import ConstantRate
+from loadgen.distributed import DistributedRunner
+from loadgen.open_model import ITERATION_LABEL
+
+JMX_PATH = "jmeter/test_n11.jmx"
+
+
+def _searches(server):
+    return [query for path, query in server.requests if path == "/arama"]
+
+
+class TestDistributedRunner:
+    """Test cases for multi-process load runs"""
+
+    def test_open_model_merges_worker_histograms(self, n11_server):
+        """Test arrivals and CSV rows are split across workers without overlap"""
+        runner = DistributedRunner(
+            JMX_PATH,
+            workers=2,
+            schedule=ConstantRate(10, 1),
+            base_url=n11_server.base_url,
+        )
+
+        result = runner.run()
+
+        assert result.scheduled == 10
+        assert result.uncorrected.labels[ITERATION_LABEL].count == 10
+        assert result.uncorrected.errors == 0
+        with open("jmeter/test_data_n11.csv", encoding="utf-8") as csv_file:
+            rows = csv_file.read().splitlines()
+        searches = [q for q in _searches(n11_server) if "%3CEOF%3E" not in q]
+        assert len(searches) == len(set(searches)) == len(rows)
+
+    def test_closed_model_splits_threads(self, n11_server):
+        """Test plan threads are divided between workers and results merged"""
+        runner = DistributedRunner(
+            JMX_PATH,
+            workers=2,
+            threads=4,
+            loops=3,
+            timer_scale=0,
+            base_url=n11_server.base_url,
+        )
+
+        result = runner.run()
+
+        assert result.count == 4 * 3 * 2
+        assert len(n11_server.requests) == 24
+
+    def test_more_workers_than_threads_reads_every_row(self, n11_server):
+        """Test workers are capped at the thread count so no CSV slice is skipped"""
+        runner = DistributedRunner(
+            JMX_PATH,
+            workers=4,
+            threads=2,
+            loops=5,
+            timer_scale=0,
+            base_url=n11_server.base_url,
+        )
+
+        result = runner.run()
+
+        assert result.count == 2 * 5 * 2
+        with open("jmeter/test_data_n11.csv", encoding="utf-8") as csv_file:
+            rows = csv_file.read().splitlines()
+        searches = [q for q in _searches(n11_server) if "%3CEOF%3E" not in q]
+        assert len(searches) == len(set(searches)) == len(rows)
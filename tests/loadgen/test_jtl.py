@@ -0,0 +1,115 @@
+import csv
+
+import pytest
+from loadgen.jmx import parse_jmx
+from loadgen.jtl import OTHER_LABELS, JtlAnalyzer, JtlWriter
+from loadgen.runner import LoadRunner
+
+HEADER = "timeStamp,elapsed,label,responseCode,success,bytes,Latency\n"
+
+
+def _write_jtl(path, rows):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(HEADER)
+        for timestamp, elapsed, label, ok in rows:
+            success = "true" if ok else "false"
+            code = 200 if ok else 500
+            f.write(f"{timestamp},{elapsed},{label},{code},{success},100,{elapsed}\n")
+    return str(path)
+
+
+class TestJtlAnalyzer:
+    """Test cases for streaming JTL analysis"""
+
+    def test_totals_and_windows(self, tmp_path):
+        """Test per-label totals, error rate and per-window percentiles"""
+        rows = [
+            (1_000_000 + i * 10, i % 100 + 1, "Home", i % 50 != 0) for i in range(1000)
+        ]
+        rows += [(1_000_000 + i * 10, 500, "Search", True) for i in range(1000)]
+        path = _write_jtl(tmp_path / "run.jtl", sorted(rows))
+
+        report = JtlAnalyzer(window=1, chunk_rows=128).analyze(path)
+        home = report.totals.summary()["Home"]
+
+        assert report.rows == 2000
+        assert home["count"] == 1000
+        assert home["errors"] == 20
+        assert home["bytes"] == 100_000
+        assert home["elapsed"]["p50_ms"] == pytest.approx(50, rel=0.01)
+        assert home["elapsed"]["p99_ms"] == pytest.approx(99, rel=0.01)
+        assert home["latency"]["max_ms"] == 100
+        assert report.totals.duration == pytest.approx(10.49)
+        assert [w["start"] for w in report.windows] == list(range(1000, 1010))
+        assert report.windows[0]["labels"]["Search"]["count"] == 100
+        assert report.windows[0]["labels"]["Search"]["throughput"] == 100
+
+    def test_out_of_order_rows(self, tmp_path):
+        """Test rows older than the grace period still count in the totals"""
+        rows = [(t * 1000, 10, "A", True) for t in (0, 1, 2, 3, 1, 0)]
+        path = _write_jtl(tmp_path / "late.jtl", rows)
+
+        report = JtlAnalyzer(window=1, grace=1, chunk_rows=1).analyze(path)
+
+        assert report.late == 2
+        assert report.totals.count == 6
+        assert sum(w["labels"]["A"]["count"] for w in report.windows) == 4
+
+    def test_label_limit(self, tmp_path):
+        """Test labels past max_labels are folded together"""
+        rows = [(i, 10, f"Search for {i}", True) for i in range(10)]
+        path = _write_jtl(tmp_path / "labels.jtl", rows)
+
+        report = JtlAnalyzer(max_labels=3).analyze(path)
+
+        assert len(report.totals.labels) == 4
+        assert report.totals.labels[OTHER_LABELS].count == 7
+
+    def test_missing_header(self, tmp_path):
+        path = tmp_path / "bare.jtl"
+        path.write_text("1000,10,Home,200,true\n")
+
+        with pytest.raises(ValueError, match="fieldNames"):
+            JtlAnalyzer().analyze(str(path))
+
+    def test_timeseries_export(self, tmp_path):
+        path = _write_jtl(tmp_path / "run.jtl", [(0, 10, "A", True)] * 3)
+        report = JtlAnalyzer().analyze(path)
+
+        report.write_timeseries(str(tmp_path / "ts.csv"))
+
+        with open(tmp_path / "ts.csv", newline="") as f:
+            rows = list(csv.DictReader(f))
+        assert rows == [
+            {
+                "start": "0",
+                "label": "A",
+                "count": "3",
+                "errors": "0",
+                "rps": "0.05",
+                "p50_ms": "10.0",
+                "p95_ms": "10.0",
+                "p99_ms": "10.0",
+            }
+        ]
+
+
+class TestJtlWriter:
+    """Test cases for writing JTL files from load runs"""
+
+    def test_round_trip(self, n11_server, tmp_path):
+        """Test a run written as JTL analyzes to the same counts"""
+        path = str(tmp_path / "n11.jtl")
+        with JtlWriter(path) as writer:
+            result = LoadRunner(
+                parse_jmx("jmeter/test_n11.jmx"),
+                base_url=n11_server.base_url,
+                timer_scale=0,
+                listeners=[writer],
+            ).run()
+
+        report = JtlAnalyzer(max_labels=1).analyze(path)
+
+        assert report.rows == result.count == 20
+        assert report.totals.labels["1. N11 Homepage Load"].count == 10
+        assert report.totals.errors == result.errors
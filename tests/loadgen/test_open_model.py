@@ -0,0 +1,99 @@
+import pytest
+from loadgen.arrival import (
+    ArrivalSchedule,
+    ConstantRate,
+    PoissonRate,
+    RampRate,
+    StepRate,
+    build_schedule,
+)
+from loadgen.jmx import parse_jmx
+from loadgen.open_model import ITERATION_LABEL, OpenModelRunner
+from utils.n11_server import N11Server
+
+
+class TestArrivalSchedules:
+    """Test cases for arrival rate profiles"""
+
+    def test_constant_rate(self):
+        assert list(ConstantRate(4, 1)) == [0, 0.25, 0.5, 0.75]
+
+    def test_ramp_rate(self):
+        """Test a 0 -> 100/s ramp over 10s schedules its area and speeds up"""
+        offsets = list(RampRate(0, 100, 10))
+
+        assert len(offsets) == 500
+        assert offsets == sorted(offsets)
+        assert offsets[1] - offsets[0] > offsets[-1] - offsets[-2]
+
+    def test_poisson_rate(self):
+        """Test Poisson arrivals average the requested rate and are repeatable"""
+        offsets = list(PoissonRate(100, 50, seed=1))
+
+        assert len(offsets) == pytest.approx(5000, rel=0.05)
+        assert offsets == list(PoissonRate(100, 50, seed=1))
+
+    def test_step_rate(self):
+        assert list(StepRate([(2, 1), (4, 0.5)])) == [0, 0.5, 1.0, 1.25]
+
+    def test_partition_covers_every_arrival_once(self):
+        schedule = ConstantRate(10, 1)
+        parts = [list(schedule.partition(3, i)) for i in range(3)]
+
+        assert sorted(sum(parts, [])) == list(schedule)
+
+    def test_base_schedule_is_abstract(self):
+        with pytest.raises(TypeError):
+            ArrivalSchedule()
+
+    @pytest.mark.parametrize(
+        "profile, rate, duration, end_rate, steps",
+        [
+            ("constant", 10, 0, None, None),
+            ("poisson", 0, 10, None, None),
+            ("ramp", 5, 0, 10, None),
+            ("ramp", 0, 10, 0, None),
+            ("step", None, None, None, [(10, 0)]),
+            ("step", None, None, None, None),
+            ("burst", 10, 10, None, None),
+        ],
+    )
+    def test_invalid_arguments_are_rejected(
+        self, profile, rate, duration, end_rate, steps
+    ):
+        with pytest.raises(ValueError):
+            build_schedule(profile, rate, duration, end_rate, steps)
+
+
+class TestOpenModelRunner:
+    """Test cases for coordinated-omission corrected latency"""
+
+    def test_backlog_shows_in_corrected_latency_only(self):
+        """Test a saturated target: uncorrected p99 stays flat, corrected grows"""
+        plan = parse_jmx("jmeter/test_n11.jmx")
+
+        with N11Server(delay=0.02) as server:
+            result = OpenModelRunner(
+                plan, ConstantRate(40, 0.5), base_url=server.base_url, max_in_flight=1
+            ).run()
+
+        uncorrected = result.uncorrected.labels[ITERATION_LABEL].elapsed
+        corrected = result.corrected.labels[ITERATION_LABEL].elapsed
+        assert result.scheduled == 20
+        assert uncorrected.percentile(99) < 0.2
+        assert corrected.percentile(99) > 3 * uncorrected.percentile(99)
+        # Every request of a late iteration is corrected, not just the first
+        for label, stats in result.uncorrected.labels.items():
+            fixed = result.corrected.labels[label].elapsed
+            assert fixed.percentile(99) > 3 * stats.elapsed.percentile(99)
+
+    def test_unsaturated_target_needs_no_correction(self, n11_server):
+        """Test corrected and uncorrected agree when nothing queues"""
+        plan = parse_jmx("jmeter/test_n11.jmx")
+
+        result = OpenModelRunner(
+            plan, ConstantRate(20, 0.5), base_url=n11_server.base_url
+        ).run()
+
+        assert result.uncorrected.count == 30
+        assert result.lag.percentile(99) < 0.05
@@ -0,0 +1,98 @@
+import json
+import threading
+
+import pytest
+from api.cassette import Cassette, CassetteAdapter
+from api.pet_api import PetAPI
+from loadgen.replay import TrafficReplayer, load_cassette, load_har
+from utils.petstore_server import PetstoreServer
+from utils.test_data import TestDataFactory
+
+
+def _har_entry(page, started, url):
+    return {
+        "pageref": page,
+        "startedDateTime": started,
+        "time": 50,
+        "request": {"method": "GET", "url": url, "headers": []},
+        "response": {"status": 200},
+    }
+
+
+@pytest.fixture
+def har_path(tmp_path):
+    """Two users browsing n11.com, the second starting one second later"""
+    entries = [
+        _har_entry("page_1", "2024-05-01T10:00:00.000Z", "https://www.n11.com/"),
+        _har_entry(
+            "page_1", "2024-05-01T10:00:02.000Z", "https://www.n11.com/arama?q=laptop"
+        ),
+        _har_entry("page_2", "2024-05-01T10:00:01.000Z", "https://www.n11.com/"),
+        _har_entry(
+            "page_2", "2024-05-01T10:00:03.000Z", "https://www.n11.com/arama?q=saat"
+        ),
+    ]
+    path = tmp_path / "n11.har"
+    path.write_text(json.dumps({"log": {"entries": entries}}))
+    return str(path)
+
+
+class TestTrafficReplayer:
+    """Test cases for replaying captured sessions as load"""
+
+    def test_har_sessions(self, har_path):
+        sessions = load_har(har_path)
+
+        assert [s.name for s in sessions] == ["page_1", "page_2"]
+        assert [r.offset for r in sessions[1].requests] == [1.0, 3.0]
+
+    def test_replay_keeps_timing_scaled_and_order(self, har_path, n11_server):
+        """Test 10x speed: 3 s of captured traffic replays in about 0.3 s"""
+        replayer = TrafficReplayer(
+            load_har(har_path), base_url=n11_server.base_url, speed=10, repeat=2
+        )
+
+        result = replayer.run()
+
+        assert result.scheduled == 8
+        assert result.uncorrected.errors == 0
+        assert 0.3 <= result.duration < 1.0
+        assert result.uncorrected.labels["GET /arama"].count == 4
+        # Both copies start together: homepage, homepage, then page_2 ...
+        paths = [path for path, _ in n11_server.requests]
+        assert paths == ["/", "/", "/", "/", "/arama", "/arama", "/arama", "/arama"]
+        assert [q for _, q in n11_server.requests[4:6]] == ["q=laptop"] * 2
+
+    def test_replay_recorded_pet_api_traffic(self, tmp_path):
+        """Test a cassette recorded by two threads replays as two sessions"""
+        path = str(tmp_path / "pets.cassette")
+        with PetstoreServer() as server:
+            api = PetAPI(transport=CassetteAdapter(Cassette(path), mode="record"))
+            api.base_url = server.base_url
+
+            def user():
+                pet = TestDataFactory.valid_pet()
+                api.create_pet(pet)
+                api.get_pet_by_id(pet["id"])
+                api.delete_pet(pet["id"])
+
+            threads = [threading.Thread(target=user) for _ in range(2)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            api.close()
+
+        sessions = load_cassette(path)
+        assert len(sessions) == 2
+        assert [r.method for r in sessions[0].requests] == ["POST", "GET", "DELETE"]
+
+        with PetstoreServer() as target:
+            result = TrafficReplayer(
+                sessions, base_url=target.base_url, speed=100
+            ).run()
+
+        labels = result.uncorrected.summary()
+        assert labels["POST /v2/pet"]["count"] == 2
+        assert labels["GET /v2/pet/{id}"]["errors"] == 0
+        assert labels["DELETE /v2/pet/{id}"]["count"] == 2
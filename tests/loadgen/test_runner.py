@@ -0,0 +1,75 @@
+import pytest
+from loadgen.jmx import parse_jmx
+from loadgen.runner import LoadRunner
+
+JMX_PATH = "jmeter/test_n11.jmx"
+
+
+@pytest.fixture(scope="module")
+def n11_plan():
+    return parse_jmx(JMX_PATH)
+
+
+class TestJmxParsing:
+    """Test cases for reading jmeter/test_n11.jmx"""
+
+    def test_thread_group_settings(self, n11_plan):
+        """Test thread group, timer and HTTP defaults are read"""
+        group = n11_plan.thread_groups[0]
+
+        assert (group.threads, group.ramp_time, group.loops) == (1, 1, 10)
+        assert group.timers == [3.0]
+        assert group.base_url == "https://www.n11.com"
+        assert group.headers["Accept-Language"] == "en-US,en;q=0.9,tr;q=0.8"
+
+    def test_csv_data_set(self, n11_plan):
+        """Test the CSV data set is resolved next to the plan"""
+        data_set = n11_plan.thread_groups[0].csv_data_sets[0]
+
+        assert data_set.filename.endswith("jmeter/test_data_n11.csv")
+        assert data_set.variable_names == ["SEARCH_QUERY"]
+        assert data_set.recycle is False
+
+    def test_samplers(self, n11_plan):
+        """Test samplers render paths with substituted variables"""
+        home, search = n11_plan.thread_groups[0].samplers
+
+        assert home.url_path({}) == "/"
+        assert (
+            search.url_path({"SEARCH_QUERY": "ayakkabı"})
+            == "/arama?q=ayakkab%C4%B1&q=ayakkab%C4%B1&srt=PRICE_HIGH"
+        )
+        # One label per sampler, not one per search term
+        assert search.name == "2. Execute Search for ${SEARCH_QUERY}"
+
+
+class TestLoadRunner:
+    """Test cases for running the n11 plan against a local stand-in"""
+
+    def test_runs_plan_like_jmeter(self, n11_plan, n11_server):
+        """Test loops, sampler order and CSV rows follow the plan"""
+        result = LoadRunner(n11_plan, base_url=n11_server.base_url, timer_scale=0).run()
+
+        assert result.count == 20
+        assert result.errors == 0
+        assert [path for path, _ in n11_server.requests[:4]] == ["/", "/arama"] * 2
+        queries = [query for path, query in n11_server.requests if path == "/arama"]
+        assert queries[0] == "q=laptop&q=laptop&srt=PRICE_HIGH"
+        # recycle=false: rows after the last one read as <EOF>
+        assert queries[-1].startswith("q=%3CEOF%3E")
+
+    def test_many_virtual_users(self, n11_plan, n11_server):
+        """Test thread and loop overrides scale the load"""
+        samples = []
+        result = LoadRunner(
+            n11_plan,
+            base_url=n11_server.base_url,
+            timer_scale=0,
+            threads=20,
+            loops=5,
+            listeners=[samples.append],
+        ).run()
+
+        assert result.count == len(samples) == 200
+        assert result.errors == 0
+        assert len({sample.thread for sample in samples}) == 20
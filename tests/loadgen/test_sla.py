@@ -0,0 +1,69 @@
+import pytest
+from loadgen.runner import RunResult, Sample
+from loadgen.sla import SLA
+from utils.n11_server import N11Server
+
+JMX_PATH = "jmeter/test_n11.jmx"
+
+
+def _result(elapsed_ms, label="2. Execute Search for laptop", errors=0, duration=1.0):
+    result = RunResult()
+    for i, ms in enumerate(elapsed_ms):
+        ok = i >= errors
+        result.add(Sample(label, 0, ms / 1000, ms / 1000, 200, ok, 0, "", "t"))
+    result.started, result.finished = 0.0, duration
+    return result
+
+
+class TestN11SearchSla:
+    """Load gate for the n11 homepage + search scenario
+
+    Runs against a local stand-in unless --load-target points elsewhere.
+    """
+
+    @pytest.mark.sla(p95_ms=500, p99_ms=1000, error_rate=0.01, min_throughput=20)
+    def test_search_scenario_meets_sla(self, load_scenario, load_target):
+        result = load_scenario(JMX_PATH, rate=20, duration=2, base_url=load_target)
+
+        assert result.scheduled == 40
+
+    @pytest.mark.sla(p99_ms=50, labels="2. Execute Search")
+    def test_slow_search_breaks_sla(self, load_scenario):
+        """Test a latency regression fails the test like a functional failure"""
+        with N11Server(delay=0.1) as server:
+            with pytest.raises(pytest.fail.Exception, match="p99_ms"):
+                load_scenario(JMX_PATH, rate=10, duration=0.5, base_url=server.base_url)
+
+
+class TestSla:
+    """Test cases for threshold checks"""
+
+    def test_passing_run(self):
+        sla = SLA(p95_ms=100, p99_ms=200, error_rate=0.05, min_throughput=50)
+
+        assert sla.violations(_result([10] * 100)) == []
+
+    def test_each_threshold(self):
+        """Test every broken threshold is reported"""
+        sla = SLA(p95_ms=100, p99_ms=200, error_rate=0.05, min_throughput=50)
+        result = _result([10] * 90 + [300] * 10, errors=10, duration=10)
+
+        assert sla.violations(result) == [
+            "p95_ms 300 > 100",
+            "p99_ms 300 > 200",
+            "error_rate 0.1 > 0.05",
+            "throughput 10.00/s < 50/s",
+        ]
+
+    def test_labels_prefix(self):
+        """Test only matching labels count towards the SLA"""
+        result = _result([10] * 10)
+        result.merge(_result([900] * 10, label="1. N11 Homepage Load"))
+
+        assert SLA(p99_ms=100, labels="2. Execute Search").violations(result) == []
+        assert SLA(p99_ms=100).violations(result) == ["p99_ms 900 > 100"]
+
+    def test_no_matching_samples(self):
+        assert SLA(labels="missing").violations(_result([10])) == [
+            "no samples matched the SLA"
+        ]
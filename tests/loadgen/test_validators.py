@@ -0,0 +1,84 @@
+import pytest
+from loadgen.jmx import parse_jmx
+from loadgen.runner import LoadRunner, Sample
+from loadgen.validators import SearchResultsValidator, parse_search_page
+from utils.n11_server import N11Server, render_search_page
+
+ERROR_PAGE = b"<html><body><h1>Bir hata olu\xc5\x9ftu</h1></body></html>"
+
+
+def _sample(query, body, ok=True):
+    url = f"https://www.n11.com/arama?q={query}&srt=PRICE_HIGH"
+    return Sample("search", 0, 0.1, 0.1, 200, ok, len(body), url, "t", body=body)
+
+
+class TestParseSearchPage:
+    """Test cases for extracting search page markers"""
+
+    def test_result_page(self):
+        page = parse_search_page(render_search_page("laptop", 1234).encode(), 30)
+
+        assert (page.result_count, page.cards, page.no_results) == (1234, 24, False)
+
+    def test_no_results_page(self):
+        page = parse_search_page(render_search_page("zxywvut-nonexistent", 0))
+
+        assert page.no_results
+        assert page.result_count is None
+
+    def test_stops_once_outcome_is_known(self):
+        """Test markup after the count and first card is not parsed"""
+        body = render_search_page("laptop", 50) + "<div class='pro'>" * 100_000
+
+        page = parse_search_page(body, min_cards=1)
+
+        assert page.result_count == 50
+        assert page.cards < 100
+
+
+class TestSearchResultsValidator:
+    """Test cases for failing 200 responses that are not result pages"""
+
+    @pytest.mark.parametrize(
+        "query, body, error",
+        [
+            ("laptop", render_search_page("laptop", 10).encode(), None),
+            ("laptop", ERROR_PAGE, "Not a result page for 'laptop'"),
+            ("laptop", render_search_page("laptop", 0).encode(), "No results"),
+            ("", render_search_page("", 0).encode(), None),
+            ("zxywvut-nonexistent", render_search_page("x", 0).encode(), None),
+            ("zxywvut-nonexistent", render_search_page("x", 3).encode(), "Expected"),
+        ],
+    )
+    def test_search_pages(self, query, body, error):
+        message = SearchResultsValidator()(_sample(query, body))
+
+        if error is None:
+            assert message is None
+        else:
+            assert message.startswith(error)
+
+    def test_other_paths_and_failed_samples_are_skipped(self):
+        validator = SearchResultsValidator()
+        homepage = _sample("laptop", ERROR_PAGE)
+        homepage.url = "https://www.n11.com/"
+
+        assert validator(homepage) is None
+        assert validator(_sample("laptop", ERROR_PAGE, ok=False)) is None
+
+    @pytest.mark.parametrize("error_page, errors", [(False, 0), (True, 8)])
+    def test_runner_marks_invalid_pages_as_errors(self, error_page, errors):
+        """Test a 200 error page counts as a failed search in the run result"""
+        plan = parse_jmx("jmeter/test_n11.jmx")
+
+        with N11Server(error_page=error_page) as server:
+            result = LoadRunner(
+                plan,
+                base_url=server.base_url,
+                timer_scale=0,
+                loops=8,
+                validators=[SearchResultsValidator()],
+            ).run()
+
+        assert result.count == 16
+        assert result.errors == errors
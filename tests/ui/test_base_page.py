@@ -0,0 +1,138 @@
+import pytest
+from selenium.common.exceptions import TimeoutException
+from selenium.webdriver.common.by import By
+from config.config import ConfigUI
+from pages.base_page import (
+    DOM_QUIET_SCRIPT,
+    EXTRACT_ROWS_SCRIPT,
+    BasePage,
+    _script_query,
+)
+from pages.qa_jobs_page import QAJobsPage
+from pages.waits import AdaptiveWait, WaitRecorder
+
+
+class ScriptedDriver:
+    """Answers execute_script with the given results in turn, the last one forever"""
+
+    def __init__(self, *results):
+        self.results = list(results)
+        self.calls = []
+
+    def execute_script(self, script, *args):
+        self.calls.append((script, args))
+        return self.results.pop(0) if len(self.results) > 1 else self.results[0]
+
+
+class AsyncScriptDriver:
+    """Finds any element and answers execute_async_script with result"""
+
+    def __init__(self, result):
+        self.result = result
+        self.async_calls = []
+        self.script_timeouts = []
+
+    def find_element(self, by, value):
+        return f"{by}={value}"
+
+    def set_script_timeout(self, seconds):
+        self.script_timeouts.append(seconds)
+
+    def execute_async_script(self, script, *args):
+        self.async_calls.append((script, args))
+        return self.result
+
+
+def _page(driver, recorder, page_class=BasePage):
+    page = page_class(driver)
+    page.wait = AdaptiveWait(driver, first_poll=0.01, recorder=recorder)
+    return page
+
+
+class TestExtractRows:
+    """Test cases for reading a list of rows in one script call"""
+
+    @pytest.mark.parametrize(
+        "locator, query",
+        [
+            ((By.CSS_SELECTOR, ".job"), ["css", ".job"]),
+            ((By.XPATH, "//li[@class='job']"), ["xpath", "//li[@class='job']"]),
+            ((By.ID, "jobs-list"), ["css", '[id="jobs-list"]']),
+            ((By.CLASS_NAME, "position-title"), ["css", ".position-title"]),
+            ((By.TAG_NAME, "li"), ["css", "li"]),
+        ],
+    )
+    def test_locators_become_script_queries(self, locator, query):
+        assert _script_query(locator) == query
+
+    def test_unsupported_locator_is_rejected(self):
+        with pytest.raises(ValueError):
+            _script_query((By.LINK_TEXT, "View Role"))
+
+    def test_rows_are_read_once_they_appear(self):
+        """Test the script is polled until rows exist and gets one query per field"""
+        rows = [{"position": "QA Engineer", "location": None}]
+        driver = ScriptedDriver([], [], rows)
+        recorder = WaitRecorder()
+
+        result = _page(driver, recorder).extract_rows(
+            (By.CSS_SELECTOR, ".job"),
+            {"position": (By.CLASS_NAME, "title"), "location": (By.XPATH, "./span")},
+        )
+
+        assert result == rows
+        assert driver.calls[0] == (
+            EXTRACT_ROWS_SCRIPT,
+            (
+                ["css", ".job"],
+                {"position": ["css", ".title"], "location": ["xpath", "./span"]},
+            ),
+        )
+        stats = recorder.summary()["BasePage.extract_rows css selector=.job"]
+        assert (stats["count"], stats["mean_polls"]) == (1, 3)
+
+    def test_no_rows_gives_an_empty_list(self):
+        page = _page(ScriptedDriver([]), WaitRecorder())
+
+        assert page.extract_rows((By.CSS_SELECTOR, ".job"), {}, timeout=0.05) == []
+
+
+class TestDomQuiet:
+    """Test cases for waiting on in-page DOM changes to settle"""
+
+    def test_quiet_elements_return(self):
+        """Test one script call watches every element and the timeout is restored"""
+        driver = AsyncScriptDriver(True)
+
+        _page(driver, WaitRecorder()).wait_for_dom_quiet(
+            (By.ID, "count"), (By.ID, "list"), quiet=0.5, timeout=10
+        )
+
+        script, args = driver.async_calls[0]
+        assert script == DOM_QUIET_SCRIPT
+        assert args == (["id=count", "id=list"], 500, 10000, False, None)
+        assert driver.script_timeouts == [15, ConfigUI.SCRIPT_TIMEOUT]
+
+    def test_no_change_times_out(self):
+        """Test an update that never starts is a timeout, not a quiet page"""
+        driver = AsyncScriptDriver(False)
+
+        with pytest.raises(TimeoutException, match="did not change and settle"):
+            _page(driver, WaitRecorder()).wait_for_dom_quiet(
+                (By.ID, "count"), timeout=1, after_change=True
+            )
+        assert driver.script_timeouts[-1] == ConfigUI.SCRIPT_TIMEOUT
+
+    def test_jobs_wait_for_the_reload(self):
+        """Test a known previous count makes the wait need a change first"""
+        driver = AsyncScriptDriver(True)
+        page = _page(driver, WaitRecorder(), QAJobsPage)
+        page.find_elements = lambda locator: []
+
+        page.wait_for_jobs_to_load()
+        page.wait_for_jobs_to_load("42")
+
+        first, second = (args for _, args in driver.async_calls)
+        assert first[0] == ["id=deneme", "id=jobs-list"]
+        assert first[3:] == (False, None)
+        assert second[3:] == (True, "42")
@@ -43,16 +43,17 @@ def test_insider_careers(driver):
 
     print("Click 'See all QA jobs'")
     qa_jobs_page.click_see_all_qa_jobs()
+    all_jobs_count = qa_jobs_page.get_job_count()
 
     print("Filter jobs by Department: 'Quality Assurance'")
     qa_jobs_page.wait_for_deparment_filter_population()
-    qa_jobs_page.wait_for_jobs_to_load()
+    qa_jobs_page.wait_for_jobs_to_load(all_jobs_count)
 
     print("Filter jobs by Location: 'Istanbul, Turkiye'")
     qa_jobs_page.filter_by_location("Istanbul, Turkiye")
 
     print("Check the presence of the job list")
-    qa_jobs_page.wait_for_jobs_to_load()
+    assert qa_jobs_page.get_job_listings(), "The job list is empty"
 
     print(
         "Check that all jobs' Position contains 'Quality Assurance', Department contains 'Quality Assurance', and Location contains 'Istanbul, Turkiye'"
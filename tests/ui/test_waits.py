@@ -0,0 +1,61 @@
+import time
+
+import pytest
+from selenium.common.exceptions import NoSuchElementException, TimeoutException
+from pages.waits import AdaptiveWait, WaitRecorder
+
+
+class TestAdaptiveWait:
+    """Test cases for the backing-off page wait and its telemetry"""
+
+    def test_returns_value_and_records_polls(self):
+        """Test a condition met on the third poll is recorded with three polls"""
+        recorder = WaitRecorder()
+        wait = AdaptiveWait(None, timeout=5, first_poll=0.01, recorder=recorder)
+        calls = []
+
+        def third_time(driver):
+            calls.append(1)
+            if len(calls) < 3:
+                raise NoSuchElementException()
+            return "element"
+
+        assert wait.until(third_time, "Page.present css=.x") == "element"
+        stats = recorder.summary()["Page.present css=.x"]
+        assert (stats["count"], stats["mean_polls"], stats["timeouts"]) == (1, 3, 0)
+
+    def test_poll_interval_backs_off(self):
+        """Test polls start fast and slow down instead of a fixed interval"""
+        wait = AdaptiveWait(
+            None, first_poll=0.01, max_poll=0.08, backoff=2, recorder=WaitRecorder()
+        )
+        times = []
+
+        with pytest.raises(TimeoutException):
+            wait.until(lambda driver: times.append(time.perf_counter()), timeout=0.5)
+
+        gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+        assert gaps[0] < 0.05
+        assert max(gaps) >= 0.07
+        # A fixed 0.5 s poll (WebDriverWait's default) would have checked twice
+        assert 8 <= len(times) <= 15
+
+    def test_timeout_is_recorded(self):
+        recorder = WaitRecorder()
+        wait = AdaptiveWait(None, first_poll=0.01, recorder=recorder)
+
+        with pytest.raises(TimeoutException, match="Page.windows 2"):
+            wait.until(lambda driver: False, "Page.windows 2", timeout=0.05)
+
+        assert recorder.summary()["Page.windows 2"]["timeouts"] == 1
+
+    def test_summary_puts_costliest_waits_first(self):
+        recorder = WaitRecorder()
+        recorder.record("short", 0.1, 1)
+        recorder.record("long", 2.0, 9)
+        recorder.record("short", 0.2, 2)
+
+        summary = recorder.summary()
+        assert list(summary) == ["long", "short"]
+        assert summary["short"]["count"] == 2
+        assert summary["short"]["mean_polls"] == 1.5
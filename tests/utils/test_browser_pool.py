@@ -0,0 +1,179 @@
+import json
+
+import pytest
+from selenium.common.exceptions import WebDriverException
+from utils.browser_pool import BrowserPool, DriverPathCache
+
+
+class FakeSwitchTo:
+    def __init__(self, driver):
+        self.driver = driver
+
+    def window(self, handle):
+        self.driver.current = handle
+
+
+class FakeDriver:
+    """Just enough of a WebDriver session to be reset and quit"""
+
+    def __init__(self):
+        self.window_handles = ["main"]
+        self.current = "main"
+        self.origins = {"main": "null"}
+        self.cleared = []
+        self.cookies = {"session": "1"}
+        self.url = "about:blank"
+        self.script_timeout = 30
+        self.crashed = False
+        self.quit_called = False
+        self.switch_to = FakeSwitchTo(self)
+
+    def open_window(self, handle, origin):
+        self.window_handles.append(handle)
+        self.origins[handle] = origin
+        self.current = handle
+
+    def close(self):
+        self.window_handles.remove(self.current)
+
+    def execute_script(self, script):
+        if self.crashed:
+            raise WebDriverException("chrome not reachable")
+        self.cleared.append(self.origins[self.current])
+        return self.origins[self.current]
+
+    def set_script_timeout(self, seconds):
+        self.script_timeout = seconds
+
+    def delete_all_cookies(self):
+        self.cookies.clear()
+
+    def get(self, url):
+        self.url = url
+
+    def quit(self):
+        self.quit_called = True
+
+
+class FakeChromeDriver(FakeDriver):
+    """FakeDriver that also takes Chrome DevTools commands"""
+
+    def __init__(self):
+        super().__init__()
+        self.cdp_commands = []
+
+    def execute_cdp_cmd(self, cmd, cmd_args):
+        self.cdp_commands.append((cmd, cmd_args))
+        return {}
+
+
+class TestBrowserPool:
+    """Test cases for reusing WebDriver sessions across tests"""
+
+    def test_sessions_are_reused_and_reset(self):
+        """Test the next test gets the same session without windows or cookies"""
+        drivers = []
+        pool = BrowserPool(lambda: drivers.append(FakeDriver()) or drivers[-1])
+        pool.start()
+
+        driver = pool.acquire()
+        driver.open_window("lever", "https://jobs.lever.co")
+        driver.url = "https://jobs.lever.co/"
+        driver.script_timeout = 65
+        pool.release(driver)
+
+        assert pool.acquire() is driver
+        assert driver.window_handles == ["main"]
+        assert driver.current == "main"
+        assert driver.cookies == {}
+        assert driver.url == "about:blank"
+        assert driver.cleared == ["https://jobs.lever.co", "null"]
+        assert driver.script_timeout == 30
+        assert pool.launched == 1
+
+    def test_chrome_clears_each_visited_origin(self):
+        """Test Chrome drops all cookies and the storage of every open origin"""
+        pool = BrowserPool(FakeChromeDriver, size=1).start()
+        driver = pool.acquire()
+        driver.origins["main"] = "https://useinsider.com"
+        driver.open_window("lever", "https://jobs.lever.co")
+        pool.release(driver)
+
+        assert driver.cdp_commands[0] == ("Network.clearBrowserCookies", {})
+        assert sorted(args["origin"] for _, args in driver.cdp_commands[1:]) == [
+            "https://jobs.lever.co",
+            "https://useinsider.com",
+        ]
+        assert pool.failed_resets == 0
+
+    def test_recycled_after_max_uses(self):
+        pool = BrowserPool(FakeDriver, size=1, max_uses=2).start()
+
+        first = pool.acquire()
+        pool.release(first)
+        assert pool.acquire() is first
+        pool.release(first)
+
+        assert first.quit_called
+        assert pool.acquire() is not first
+        assert (pool.launched, pool.recycled) == (2, 1)
+
+    def test_crashed_session_is_replaced(self):
+        pool = BrowserPool(FakeDriver, size=1).start()
+        driver = pool.acquire()
+        driver.crashed = True
+        pool.release(driver)
+
+        assert pool.acquire() is not driver
+        assert (pool.recycled, pool.failed_resets) == (1, 1)
+
+    def test_unexpected_reset_error_is_raised(self):
+        """Test a bug in the reset is not mistaken for a dead browser"""
+        pool = BrowserPool(FakeDriver, size=1).start()
+        driver = pool.acquire()
+        driver.origins = {}
+
+        with pytest.raises(KeyError):
+            pool.release(driver)
+
+    def test_close_quits_every_session(self):
+        pool = BrowserPool(FakeDriver, size=2).start()
+        busy = pool.acquire()
+        idle = pool.acquire()
+        pool.release(idle)
+        pool.close()
+
+        assert busy.quit_called and idle.quit_called
+
+
+class TestDriverPathCache:
+    """Test cases for the on-disk driver path cache"""
+
+    def test_install_runs_once(self, tmp_path):
+        binary = tmp_path / "chromedriver"
+        binary.write_text("")
+        cache = DriverPathCache(str(tmp_path / "drivers.json"))
+        calls = []
+
+        def install():
+            calls.append(1)
+            return str(binary)
+
+        assert cache.resolve("chrome", install) == str(binary)
+        assert cache.resolve("chrome", install) == str(binary)
+        assert len(calls) == 1
+
+    def test_stale_path_used_when_offline(self, tmp_path):
+        binary = tmp_path / "geckodriver"
+        binary.write_text("")
+        path = tmp_path / "drivers.json"
+        path.write_text(json.dumps({"firefox": {"path": str(binary), "resolved": 0}}))
+
+        def offline():
+            raise ConnectionError("no network")
+
+        assert DriverPathCache(str(path)).resolve("firefox", offline) == str(binary)
+        assert (
+            DriverPathCache(str(tmp_path / "none.json")).resolve("firefox", offline)
+            is None
+        )
@@ -0,0 +1,83 @@
+import multiprocessing
+import threading
+
+from utils import id_allocator
+from utils.id_allocator import MISSING_BASE, IdAllocator, missing_id
+
+
+def _claim_ids(state_path, count):
+    allocator = IdAllocator("run", state_path, block_size=10)
+    return [allocator.next_id() for _ in range(count)]
+
+
+class TestIdAllocator:
+    """Test cases for block-allocated test data ids"""
+
+    def test_processes_sharing_a_counter_never_collide(self, tmp_path):
+        """Test worker processes of one run get disjoint blocks"""
+        state_path = str(tmp_path / "ids")
+        context = multiprocessing.get_context("spawn")
+        with context.Pool(4) as pool:
+            results = pool.starmap(_claim_ids, [(state_path, 95)] * 4)
+
+        ids = [pet_id for result in results for pet_id in result]
+        assert len(set(ids)) == len(ids) == 380
+        # 10 blocks of 10 per process; the counter only moved once per block
+        assert (tmp_path / "ids").read_text() == "40"
+
+    def test_threads_share_one_process_block(self):
+        allocator = IdAllocator("run", block_size=100)
+        ids = []
+
+        def claim():
+            ids.extend(allocator.next_id() for _ in range(250))
+
+        threads = [threading.Thread(target=claim) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(set(ids)) == 1000
+
+    def test_run_id_fixes_the_sequence(self):
+        """Test the same run id repeats ids (cassettes), others are disjoint"""
+        first = [IdAllocator("cassette").next_id() for _ in range(3)]
+        again = IdAllocator("cassette")
+        other = IdAllocator("other run")
+
+        assert first[0] == again.next_id()
+        assert abs(other.next_id() - first[0]) >= 10**9
+
+    def test_missing_ids_are_reserved(self):
+        """Test allocated ids never reach the never-exists range"""
+        allocator = IdAllocator("x" * 40)
+
+        assert allocator.base + 10**9 < MISSING_BASE < missing_id() < 2**53
+        assert missing_id(1) != missing_id()
+
+    def test_next_ids_spans_blocks(self):
+        """Test a bulk claim continues the current block and then takes new ones"""
+        allocator = IdAllocator("run", block_size=10)
+        first = allocator.next_id()
+        ranges = allocator.next_ids(25)
+
+        ids = [pet_id for id_range in ranges for pet_id in id_range]
+        assert ids == list(range(first + 1, first + 26))
+        assert len(ranges) == 3
+        assert allocator.next_id() == first + 26
+
+    def test_default_allocator_is_built_on_first_use(self, monkeypatch, tmp_path):
+        """Test an xdist worker's allocator picks up the run only when asked"""
+        monkeypatch.setattr(id_allocator, "default_allocator", None)
+        monkeypatch.setattr(id_allocator.tempfile, "gettempdir", lambda: str(tmp_path))
+        monkeypatch.setenv("PYTEST_XDIST_TESTRUNUID", "abc")
+
+        allocator = id_allocator.get_allocator()
+        allocator.next_id()
+
+        assert id_allocator.get_allocator() is allocator
+        assert allocator.state_path == str(tmp_path / "pet-ids-abc")
+        id_allocator.remove_state("abc")
+        id_allocator.remove_state("abc")
+        assert not (tmp_path / "pet-ids-abc").exists()
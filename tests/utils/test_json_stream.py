@@ -0,0 +1,45 @@
+import json
+import pytest
+from utils.json_stream import iter_json_array
+
+
+def _chunks(raw, size):
+    return [raw[i : i + size] for i in range(0, len(raw), size)]
+
+
+class TestIterJsonArray:
+    """Test cases for incremental JSON array decoding"""
+
+    @pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+    def test_any_chunking_yields_same_items(self, chunk_size):
+        """Test items split across chunks, including multi-byte characters"""
+        pets = [{"id": i, "name": "宠物🐕Питомец", "tags": []} for i in range(100)]
+        raw = json.dumps(pets, ensure_ascii=False).encode()
+
+        assert list(iter_json_array(_chunks(raw, chunk_size))) == pets
+
+    def test_scalars_at_chunk_boundaries(self):
+        """Test a number cut by a chunk boundary is not yielded early"""
+        assert list(iter_json_array([b"[12", b"34, 5", b"6]"])) == [1234, 56]
+
+    def test_empty_array(self):
+        assert list(iter_json_array([b" [ ", b"] "])) == []
+
+    def test_stops_reading_when_caller_stops(self):
+        """Test early termination leaves remaining chunks unread"""
+        read = []
+
+        def chunks():
+            for i in range(1000):
+                read.append(i)
+                yield (b"[" if i == 0 else b",") + json.dumps({"id": i}).encode()
+
+        items = iter_json_array(chunks())
+        assert next(items) == {"id": 0}
+        items.close()
+
+        assert len(read) <= 2
+
+    def test_rejects_non_array(self):
+        with pytest.raises(ValueError):
+            list(iter_json_array([b'{"id": 1}']))
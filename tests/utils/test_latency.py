@@ -0,0 +1,66 @@
+import random
+import pytest
+from api.metrics import LatencyRecorder, endpoint_label
+from utils.latency import LatencyHistogram
+
+
+class TestLatencyHistogram:
+    """Test cases for the bounded-memory latency histogram"""
+
+    def test_percentiles_within_precision(self):
+        """Test percentiles stay within the bucket precision of exact values"""
+        rng = random.Random(7)
+        values = sorted(rng.lognormvariate(-3, 1) for _ in range(20000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percent in (50, 95, 99):
+            exact = values[int(len(values) * percent / 100) - 1]
+            assert histogram.percentile(percent) == pytest.approx(exact, rel=0.02)
+
+    def test_memory_is_bounded_by_bucket_count(self):
+        """Test many samples in a narrow range collapse into few buckets"""
+        histogram = LatencyHistogram()
+        for i in range(100000):
+            histogram.record(0.1 + (i % 100) / 10000)
+
+        assert histogram.count == 100000
+        assert len(histogram.buckets) < 20
+
+    def test_merge_matches_single_histogram(self):
+        """Test merged histograms equal one histogram fed all samples"""
+        combined, left, right = (
+            LatencyHistogram(),
+            LatencyHistogram(),
+            LatencyHistogram(),
+        )
+        for i in range(1, 1001):
+            combined.record(i / 1000)
+            (left if i % 2 else right).record(i / 1000)
+
+        merged = LatencyHistogram.from_dict(left.to_dict()).merge(right)
+
+        assert merged.buckets == combined.buckets
+        assert merged.summary() == combined.summary()
+
+
+class TestLatencyRecorder:
+    """Test cases for per-endpoint latency collection"""
+
+    def test_ids_are_collapsed_into_one_endpoint(self):
+        """Test numeric path segments share one endpoint label"""
+        assert endpoint_label("GET", "/pet/123") == "GET /pet/{id}"
+        assert endpoint_label("GET", "/pet/findByStatus") == "GET /pet/findByStatus"
+
+    def test_records_total_server_and_errors(self):
+        """Test samples are split into total, server time and error count"""
+        recorder = LatencyRecorder()
+        recorder.record("GET", "/pet/1", 0.2, server=0.15)
+        recorder.record("GET", "/pet/2", 0.3, error=True)
+
+        stats = recorder.summary()["GET /pet/{id}"]
+
+        assert stats["total"]["count"] == 2
+        assert stats["server"]["count"] == 1
+        assert stats["errors"] == 1
@@ -0,0 +1,25 @@
+from utils.petstore_server import PetStore
+
+
+class TestPetStore:
+    """Test cases for the local Petstore storage"""
+
+    def test_reads_are_snapshots(self):
+        """Test pets handed out are not changed by later updates"""
+        store = PetStore()
+        pet = store.put({"name": "Rex", "photoUrls": [], "status": "available"})
+        before = store.get(pet["id"])
+        found = store.find(store.by_status, ["available"])
+
+        store.update_fields(pet["id"], name="Max", status="sold")
+
+        assert before["name"] == found[0]["name"] == "Rex"
+        assert store.get(pet["id"])["name"] == "Max"
+
+    def test_put_copies_its_input(self):
+        store = PetStore()
+        pet = {"name": "Rex", "photoUrls": [], "tags": [{"id": 1, "name": "a"}]}
+        stored = store.put(pet)
+        pet["tags"][0]["name"] = "changed"
+
+        assert store.get(stored["id"])["tags"][0]["name"] == "a"
@@ -0,0 +1,37 @@
+import json
+
+from utils.test_data import STATUSES, TestDataFactory
+
+
+class TestBulkPets:
+    """Test cases for TestDataFactory.many()"""
+
+    def test_same_seed_same_pets(self):
+        """Test generation is repeatable for a seed and varies between seeds"""
+        first = list(TestDataFactory.many(200, seed=7, first_id=1))
+        again = list(TestDataFactory.many(200, seed=7, first_id=1))
+        other = list(TestDataFactory.many(200, seed=8, first_id=1))
+
+        assert first == again
+        assert first != other
+
+    def test_pets_have_builder_shape(self):
+        """Test bulk pets carry the same fields as TestDataFactory.valid_pet()"""
+        batch = TestDataFactory.many(1000, seed=1)
+        pets = list(batch)
+
+        assert len(batch) == 1000
+        assert len({pet["id"] for pet in pets}) == 1000
+        assert all(pet.keys() == TestDataFactory.valid_pet().keys() for pet in pets)
+        # Weighted choice still covers every status
+        assert {pet["status"] for pet in pets} == set(STATUSES)
+        assert batch[-1] == pets[-1]
+
+    def test_write_jsonl_matches_dicts(self, tmp_path):
+        """Test the JSON lines decode to exactly the pets iteration yields"""
+        path = tmp_path / "pets.jsonl"
+        batch = TestDataFactory.many(500, seed=3, first_id=100)
+        batch.write_jsonl(str(path))
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line) for line in lines] == list(batch)
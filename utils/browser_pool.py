@@ -0,0 +1,212 @@
+"""Reusable WebDriver sessions for UI tests
+
+Launching a browser costs seconds, so a worker keeps its sessions and hands
+them out test after test. Between tests a session is reset: extra windows
+are closed, cookies and storage are cleared and it goes back to about:blank.
+A session is quit and replaced after max_uses tests, or as soon as it stops
+answering or cannot be reset.
+
+Driver binaries are resolved once and the path is kept in a small JSON file,
+so later runs, and runs without network access, skip webdriver-manager.
+"""
+
+import json
+import os
+import threading
+import time
+from selenium import webdriver
+from selenium.common.exceptions import WebDriverException
+from selenium.webdriver.chrome.service import Service as ChromeService
+from selenium.webdriver.firefox.service import Service as FirefoxService
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from config.config import ConfigUI
+
+
+class DriverPathCache:
+    """Driver binary paths per browser, remembered on disk
+
+    path    - JSON file holding the resolved paths
+    max_age - seconds before a cached path is resolved again; a stale path is
+              still used when resolving fails (e.g. offline)
+    """
+
+    def __init__(
+        self, path=ConfigUI.DRIVER_CACHE_PATH, max_age=ConfigUI.DRIVER_CACHE_MAX_AGE
+    ):
+        self.path = path
+        self.max_age = max_age
+
+    def _load(self):
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, entries):
+        os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+        temporary = f"{self.path}.{os.getpid()}"
+        with open(temporary, "w", encoding="utf-8") as f:
+            json.dump(entries, f)
+        os.replace(temporary, self.path)
+
+    def resolve(self, browser, install):
+        """Cached driver path for browser, calling install() when there is none
+
+        Returns None when nothing is cached and install() fails, which leaves
+        the lookup to Selenium Manager.
+        """
+        entries = self._load()
+        cached = entries.get(browser)
+        if cached and os.path.exists(cached["path"]):
+            if time.time() - cached["resolved"] < self.max_age:
+                return cached["path"]
+        try:
+            path = install()
+        except Exception as e:
+            print(f"Warning: could not resolve {browser} driver: {e}")
+            return cached["path"] if cached and os.path.exists(cached["path"]) else None
+        entries[browser] = {"path": path, "resolved": time.time()}
+        self._save(entries)
+        return path
+
+
+def create_driver(browser, path_cache=None):
+    """Launch a Chrome or Firefox session configured for the UI tests"""
+    path_cache = path_cache or DriverPathCache()
+    if browser == "chrome":
+        options = webdriver.ChromeOptions()
+        options.add_argument("--start-maximized")
+        options.add_argument("--disable-blink-features=AutomationControlled")
+        prefs = {"profile.default_content_setting_values.notifications": 2}
+        options.add_experimental_option("prefs", prefs)
+        path = path_cache.resolve(browser, lambda: ChromeDriverManager().install())
+        return webdriver.Chrome(service=ChromeService(path), options=options)
+    if browser == "firefox":
+        options = webdriver.FirefoxOptions()
+        path = path_cache.resolve(browser, lambda: GeckoDriverManager().install())
+        driver = webdriver.Firefox(service=FirefoxService(path), options=options)
+        driver.maximize_window()
+        return driver
+    raise ValueError(f"Unsupported browser: {browser}")
+
+
+# Clears the storage of the window's origin and returns it ("null" for about:blank)
+CLEAR_STORAGE_SCRIPT = """
+try { localStorage.clear(); sessionStorage.clear(); } catch (e) {}
+return location.origin;
+"""
+
+
+def reset_driver(driver):
+    """Bring a used session back to a blank state
+
+    Storage is cleared for the origin open in each window. Chrome also drops
+    every cookie and the remaining storage (IndexedDB, cache, ...) of those
+    origins; elsewhere only cookies of the first window's origin can go.
+    """
+    handles = driver.window_handles
+    origins = set()
+    # The first window is cleared last and stays open
+    for handle in reversed(handles):
+        driver.switch_to.window(handle)
+        origins.add(driver.execute_script(CLEAR_STORAGE_SCRIPT))
+        if handle != handles[0]:
+            driver.close()
+    driver.delete_all_cookies()
+    if hasattr(driver, "execute_cdp_cmd"):
+        driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        for origin in origins - {None, "null"}:
+            driver.execute_cdp_cmd(
+                "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+            )
+    # Tests may have raised it for in-page waits
+    driver.set_script_timeout(ConfigUI.SCRIPT_TIMEOUT)
+    driver.get("about:blank")
+
+
+def _quit(driver):
+    try:
+        driver.quit()
+    except Exception:
+        pass
+
+
+class BrowserPool:
+    """WebDriver sessions launched once and reused across tests
+
+    factory  - callable returning a new session
+    size     - sessions launched up front and kept idle between tests
+    max_uses - tests a session serves before it is quit and replaced
+    """
+
+    def __init__(
+        self,
+        factory,
+        size=ConfigUI.BROWSER_POOL_SIZE,
+        max_uses=ConfigUI.BROWSER_MAX_USES,
+    ):
+        self.factory = factory
+        self.size = size
+        self.max_uses = max_uses
+        self._idle = []
+        self._uses = {}
+        self._lock = threading.Lock()
+        self.launched = 0
+        self.recycled = 0
+        self.failed_resets = 0
+
+    def _launch(self):
+        driver = self.factory()
+        with self._lock:
+            self._uses[driver] = 0
+            self.launched += 1
+        return driver
+
+    def start(self):
+        for _ in range(self.size):
+            self._idle.append(self._launch())
+        return self
+
+    def acquire(self):
+        with self._lock:
+            driver = self._idle.pop() if self._idle else None
+        if driver is None:
+            driver = self._launch()
+        with self._lock:
+            self._uses[driver] += 1
+        return driver
+
+    def release(self, driver):
+        """Reset the session for the next test, or retire it"""
+        with self._lock:
+            worn_out = self._uses[driver] >= self.max_uses
+        if not worn_out:
+            try:
+                reset_driver(driver)
+            except WebDriverException as e:
+                # Crashed browser, or a driver process that no longer answers
+                print(f"Warning: retiring browser session that failed to reset: {e}")
+                with self._lock:
+                    self.failed_resets += 1
+                worn_out = True
+        if worn_out:
+            self._retire(driver)
+            return
+        with self._lock:
+            self._idle.append(driver)
+
+    def _retire(self, driver):
+        with self._lock:
+            self._uses.pop(driver, None)
+            self.recycled += 1
+        _quit(driver)
+
+    def close(self):
+        with self._lock:
+            drivers = list(self._uses)
+            self._idle.clear()
+            self._uses.clear()
+        for driver in drivers:
+            _quit(driver)
@@ -0,0 +1,67 @@
+"""Shared plumbing for the local HTTP stand-ins used by tests and load runs"""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+class LocalHTTPHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    # Send headers and body in one segment; avoids 40 ms delayed-ACK stalls
+    wbufsize = -1
+    disable_nagle_algorithm = True
+
+    @property
+    def app(self):
+        return self.server.app
+
+    def log_message(self, format, *args):
+        pass
+
+    def _send(self, status, body=b"", content_type="application/json"):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _read_body(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        return self.rfile.read(length) if length else b""
+
+
+class _ThreadingServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # The default backlog of 5 drops SYNs when many clients connect at once
+    request_queue_size = 1024
+
+
+class LocalHTTPServer:
+    """Multi-threaded HTTP server running on a background thread"""
+
+    handler_class = LocalHTTPHandler
+    base_path = ""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.httpd = _ThreadingServer((host, port), self.handler_class)
+        self.httpd.app = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}{self.base_path}"
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc_info):
+        self.stop()
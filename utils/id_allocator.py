@@ -0,0 +1,147 @@
+"""Unique pet ids for parallel test runs
+
+Ids are handed out from blocks. A process claims a whole block at a time
+from a counter file shared by every worker of the run (pytest-xdist sets
+PYTEST_XDIST_TESTRUNUID for all of them), then hands out ids from it without
+further coordination. Each run starts at its own offset, so concurrent runs
+against the public Petstore do not collide either.
+
+Ids at or above MISSING_BASE are never handed out or created by tests; use
+missing_id() where a pet must not exist.
+"""
+
+import os
+import tempfile
+import threading
+import zlib
+
+try:
+    import fcntl
+except ImportError:  # Windows: no shared counter, blocks are per process
+    fcntl = None
+
+# Allocated ids stay below 2**53 so they survive JSON round trips in any client
+ALLOCATION_BASE = 10**12
+RUN_SPAN = 10**9
+RUN_SLOTS = 10**6
+MISSING_BASE = 9 * 10**15
+
+
+def missing_id(offset=0):
+    """An id from the reserved range that no test ever creates"""
+    return MISSING_BASE + 1 + offset
+
+
+class IdAllocator:
+    """Block allocator of ids unique within a run
+
+    run_id     - runs with different ids get disjoint ranges; the same run id
+                 (e.g. for cassette recording and replay) gives the same ids
+    state_path - counter file shared between processes of one run; None keeps
+                 the counter in this process
+    block_size - ids claimed from the shared counter at once
+    """
+
+    def __init__(self, run_id="", state_path=None, block_size=1000):
+        self.run_id = run_id
+        self.state_path = state_path
+        self.block_size = block_size
+        self.base = ALLOCATION_BASE + zlib.crc32(run_id.encode()) % RUN_SLOTS * RUN_SPAN
+        self._next = self._end = 0
+        self._local_blocks = 0
+        self._lock = threading.Lock()
+
+    def _claim_block(self):
+        """Index of the next unused block of this run"""
+        if self.state_path is None or fcntl is None:
+            block = self._local_blocks
+            self._local_blocks += 1
+            return block
+        with open(self.state_path, "a+") as f:
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.seek(0)
+                block = int(f.read() or 0)
+                f.seek(0)
+                f.truncate()
+                f.write(str(block + 1))
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        return block
+
+    def _next_block(self):
+        block = self._claim_block()
+        if (block + 1) * self.block_size > RUN_SPAN:
+            raise RuntimeError(f"Run {self.run_id!r} used up its id range")
+        self._next = self.base + block * self.block_size
+        self._end = self._next + self.block_size
+
+    def next_id(self):
+        with self._lock:
+            if self._next == self._end:
+                self._next_block()
+            pet_id = self._next
+            self._next += 1
+            return pet_id
+
+    def next_ids(self, count):
+        """count ids as a list of ranges, claiming as many blocks as needed"""
+        ranges = []
+        with self._lock:
+            while count:
+                if self._next == self._end:
+                    self._next_block()
+                take = min(count, self._end - self._next)
+                ranges.append(range(self._next, self._next + take))
+                self._next += take
+                count -= take
+        return ranges
+
+
+def state_path_for(xdist_run):
+    """Counter file shared by the workers of one pytest-xdist run"""
+    return os.path.join(tempfile.gettempdir(), f"pet-ids-{xdist_run}")
+
+
+def remove_state(xdist_run):
+    """Delete the run's counter file once no worker needs it any more"""
+    try:
+        os.remove(state_path_for(xdist_run))
+    except FileNotFoundError:
+        pass
+
+
+def allocator_for_run(run_id=None):
+    """Allocator shared by all pytest-xdist workers of the current run
+
+    Without xdist the counter stays in this process. Without a run_id the
+    xdist run id, or a random one, picks the run's range.
+    """
+    xdist_run = os.environ.get("PYTEST_XDIST_TESTRUNUID")
+    state_path = state_path_for(xdist_run) if xdist_run else None
+    if run_id is None:
+        run_id = xdist_run or os.urandom(8).hex()
+    return IdAllocator(run_id, state_path)
+
+
+# Built on first use, so importing this module touches no files
+default_allocator = None
+_default_lock = threading.Lock()
+
+
+def configure(run_id=None):
+    """Replace the default allocator, e.g. with a fixed run_id for cassettes"""
+    global default_allocator
+    with _default_lock:
+        default_allocator = allocator_for_run(run_id)
+        return default_allocator
+
+
+def get_allocator():
+    """The default allocator, built for the current run on first use"""
+    global default_allocator
+    with _default_lock:
+        if default_allocator is None:
+            default_allocator = allocator_for_run()
+        return default_allocator
@@ -0,0 +1,57 @@
+import codecs
+import json
+
+_decoder = json.JSONDecoder()
+_WHITESPACE = " \t\n\r"
+
+
+def iter_json_array(chunks):
+    """Yield the elements of a top-level JSON array from an iterable of byte chunks
+
+    Only the element being decoded is buffered, so memory stays constant in
+    the size of the array; stopping the iteration early stops reading chunks.
+    """
+    text_decoder = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    position = 0
+    started = False
+    chunks = iter(chunks)
+    exhausted = False
+
+    while True:
+        # Skip separators between elements
+        while position < len(buffer) and buffer[position] in _WHITESPACE + ",":
+            if buffer[position] == "," and not started:
+                raise ValueError("Expected '[' at start of JSON array")
+            position += 1
+
+        if position < len(buffer):
+            char = buffer[position]
+            if not started:
+                if char != "[":
+                    raise ValueError("Expected '[' at start of JSON array")
+                started = True
+                position += 1
+                continue
+            if char == "]":
+                return
+            try:
+                item, end = _decoder.raw_decode(buffer, position)
+            except json.JSONDecodeError:
+                item = end = None
+            # A scalar ending at the buffer edge may continue in the next chunk
+            if end is not None and (end < len(buffer) or exhausted):
+                position = end
+                yield item
+                continue
+
+        if exhausted:
+            raise ValueError("Unexpected end of JSON array")
+
+        chunk = next(chunks, None)
+        if chunk is None:
+            exhausted = True
+            buffer = buffer[position:] + text_decoder.decode(b"", final=True)
+        else:
+            buffer = buffer[position:] + text_decoder.decode(chunk)
+        position = 0
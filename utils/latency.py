@@ -0,0 +1,105 @@
+import math
+
+
+class LatencyHistogram:
+    """Log-bucketed latency histogram with bounded memory and mergeable state
+
+    Values are stored in seconds. Each bucket spans a fixed relative width
+    (1% by default), so percentiles are accurate to that precision no matter
+    how many samples are recorded.
+    """
+
+    MIN_VALUE = 1e-6
+
+    def __init__(self, precision=0.01):
+        self.precision = precision
+        self._log_base = math.log1p(precision)
+        self.buckets = {}
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+
+    def _index(self, value):
+        if value <= self.MIN_VALUE:
+            return 0
+        return int(math.log(value / self.MIN_VALUE) / self._log_base) + 1
+
+    def _value(self, index):
+        """Representative (upper edge) value of a bucket"""
+        if index == 0:
+            return self.MIN_VALUE
+        return self.MIN_VALUE * math.exp(index * self._log_base)
+
+    def record(self, value, count=1):
+        index = self._index(value)
+        self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += count
+        self.total += value * count
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    def merge(self, other):
+        """Fold another histogram with the same precision into this one"""
+        if other.precision != self.precision:
+            raise ValueError("Cannot merge histograms with different precision")
+        for index, count in other.buckets.items():
+            self.buckets[index] = self.buckets.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None:
+            self.min = other.min if self.min is None else min(self.min, other.min)
+            self.max = other.max if self.max is None else max(self.max, other.max)
+        return self
+
+    def percentile(self, percent):
+        """Value below which the given percent of samples fall"""
+        if not self.count:
+            return None
+        rank = max(1, math.ceil(self.count * percent / 100))
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(self._value(index), self.max)
+        return self.max
+
+    @property
+    def mean(self):
+        return self.total / self.count if self.count else None
+
+    def summary(self):
+        """Count, mean, min/max and p50/p95/p99 in milliseconds"""
+
+        def _ms(value):
+            return None if value is None else round(value * 1000, 3)
+
+        return {
+            "count": self.count,
+            "mean_ms": _ms(self.mean),
+            "min_ms": _ms(self.min),
+            "p50_ms": _ms(self.percentile(50)),
+            "p95_ms": _ms(self.percentile(95)),
+            "p99_ms": _ms(self.percentile(99)),
+            "max_ms": _ms(self.max),
+        }
+
+    def to_dict(self):
+        return {
+            "precision": self.precision,
+            "buckets": self.buckets,
+            "count": self.count,
+            "total": self.total,
+            "min": self.min,
+            "max": self.max,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        histogram = cls(data["precision"])
+        histogram.buckets = {int(k): v for k, v in data["buckets"].items()}
+        histogram.count = data["count"]
+        histogram.total = data["total"]
+        histogram.min = data["min"]
+        histogram.max = data["max"]
+        return histogram
@@ -0,0 +1,84 @@
+"""Local stand-in for the n11.com homepage and /arama search used by load tests"""
+
+import html
+import threading
+import time
+import zlib
+from urllib.parse import parse_qs, urlsplit
+from utils.http_server import LocalHTTPHandler, LocalHTTPServer
+
+HOMEPAGE = (
+    "<!DOCTYPE html><html><head><title>n11.com</title></head>"
+    '<body><form action="/arama"><input name="q"></form></body></html>'
+)
+
+
+def render_search_page(query, result_count, cards=24):
+    """Search result page in the shape the n11 validators expect"""
+    query = html.escape(query)
+    if not result_count:
+        return (
+            "<!DOCTYPE html><html><body>"
+            f'<div class="notFoundContainer"><h2>"{query}" için sonuç bulunamadı</h2>'
+            "</div></body></html>"
+        )
+    items = "".join(
+        f'<li class="column"><div class="pro">'
+        f'<h3 class="productName">{query} ürün {i}</h3>'
+        f'<ins class="newPrice">{100 + i},99 TL</ins></div></li>'
+        for i in range(min(cards, result_count))
+    )
+    return (
+        "<!DOCTYPE html><html><body>"
+        f'<div class="resultText"><h1>{query}</h1>'
+        f'<span class="resultCount">{result_count} sonuç</span></div>'
+        f'<ul class="list-ul">{items}</ul></body></html>'
+    )
+
+
+class N11Handler(LocalHTTPHandler):
+    def do_GET(self):
+        url = urlsplit(self.path)
+        app = self.app
+        app.log_request(url.path, url.query)
+        if app.delay:
+            time.sleep(app.delay)
+
+        if url.path == "/":
+            return self._send(200, HOMEPAGE.encode(), "text/html; charset=utf-8")
+        if url.path != "/arama":
+            return self._send(404, b"Not Found", "text/plain")
+
+        query = (parse_qs(url.query).get("q") or [""])[0]
+        if app.error_page:
+            page = "<html><body><h1>Bir hata oluştu</h1></body></html>"
+        else:
+            page = render_search_page(query, app.result_count(query))
+        self._send(200, page.encode(), "text/html; charset=utf-8")
+
+
+class N11Server(LocalHTTPServer):
+    """Homepage and search results with per-query deterministic result counts
+
+    delay       - seconds to sleep before answering, to simulate a slow target
+    error_page  - answer searches with a 200 error page instead of results
+    """
+
+    handler_class = N11Handler
+
+    def __init__(self, host="127.0.0.1", port=0, delay=0.0, error_page=False):
+        super().__init__(host, port)
+        self.delay = delay
+        self.error_page = error_page
+        self.requests = []
+        self._lock = threading.Lock()
+
+    def log_request(self, path, query):
+        with self._lock:
+            self.requests.append((path, query))
+
+    @staticmethod
+    def result_count(query):
+        if not query.strip() or "nonexistent" in query:
+            return 0
+        return zlib.crc32(query.encode()) % 5000 + 1
@@ -0,0 +1,210 @@
+"""In-process stand-in for the public Swagger Petstore /pet endpoints"""
+
+import copy
+import itertools
+import json
+import threading
+from urllib.parse import parse_qs, urlsplit
+from utils.http_server import LocalHTTPHandler, LocalHTTPServer
+
+BASE_PATH = "/v2"
+PET_NOT_FOUND = {"code": 1, "type": "error", "message": "Pet not found"}
+INVALID_INPUT = {"code": 405, "type": "unknown", "message": "Invalid input"}
+
+
+class PetStore:
+    """Thread-safe pet storage indexed by id, status and tag name
+
+    Pets are copied on the way in and out under the lock, so handlers can
+    serialize what they get while other requests update the same pet.
+    """
+
+    def __init__(self):
+        self.pets = {}
+        self.by_status = {}
+        self.by_tag = {}
+        self._lock = threading.Lock()
+        self._ids = itertools.count(9_000_000_000)
+
+    def _index(self, pet):
+        self.by_status.setdefault(pet.get("status"), set()).add(pet["id"])
+        for tag in pet["tags"]:
+            self.by_tag.setdefault(tag.get("name"), set()).add(pet["id"])
+
+    def _unindex(self, pet):
+        self.by_status.get(pet.get("status"), set()).discard(pet["id"])
+        for tag in pet["tags"]:
+            self.by_tag.get(tag.get("name"), set()).discard(pet["id"])
+
+    def put(self, pet):
+        """Insert or replace a pet, assigning an id when none is given"""
+        pet = copy.deepcopy(pet)
+        pet.setdefault("tags", [])
+        with self._lock:
+            if not pet.get("id"):
+                pet["id"] = next(self._ids)
+            existing = self.pets.get(pet["id"])
+            if existing is not None:
+                self._unindex(existing)
+            self.pets[pet["id"]] = pet
+            self._index(pet)
+            return copy.deepcopy(pet)
+
+    def get(self, pet_id):
+        with self._lock:
+            return copy.deepcopy(self.pets.get(pet_id))
+
+    def update_fields(self, pet_id, **fields):
+        with self._lock:
+            pet = self.pets.get(pet_id)
+            if pet is None:
+                return None
+            self._unindex(pet)
+            pet.update(fields)
+            self._index(pet)
+            return copy.deepcopy(pet)
+
+    def delete(self, pet_id):
+        with self._lock:
+            pet = self.pets.pop(pet_id, None)
+            if pet is not None:
+                self._unindex(pet)
+            return pet
+
+    def find(self, index, keys):
+        with self._lock:
+            ids = set().union(*(index.get(key, set()) for key in keys))
+            return [copy.deepcopy(self.pets[pet_id]) for pet_id in sorted(ids)]
+
+    def seed(self, count, status="available"):
+        """Pre-populate the store, e.g. to mimic a large public inventory"""
+        for i in range(count):
+            self.put(
+                {
+                    "name": f"SeedPet{i}",
+                    "photoUrls": ["https://example.com/seed.jpg"],
+                    "status": status,
+                }
+            )
+
+
+class PetstoreHandler(LocalHTTPHandler):
+    @property
+    def store(self):
+        return self.app.store
+
+    def _send_json(self, status, payload=None):
+        body = b"" if payload is None else json.dumps(payload).encode()
+        self._send(status, body)
+
+    def _route(self):
+        """Split the request into (path parts under /pet, query)"""
+        url = urlsplit(self.path)
+        path = url.path
+        if not path.startswith(f"{BASE_PATH}/pet"):
+            return None, None
+        parts = [part for part in path[len(BASE_PATH) + 1 :].split("/") if part]
+        return parts[1:], parse_qs(url.query)
+
+    def _pet_id(self, raw_id):
+        try:
+            return int(raw_id)
+        except ValueError:
+            self._send_json(
+                404,
+                {
+                    "code": 404,
+                    "type": "unknown",
+                    "message": f'java.lang.NumberFormatException: For input string: "{raw_id}"',
+                },
+            )
+            return None
+
+    def _read_pet(self):
+        try:
+            pet = json.loads(self._read_body())
+        except ValueError:
+            pet = None
+        if not isinstance(pet, dict) or not pet.get("name") or "photoUrls" not in pet:
+            self._send_json(405, INVALID_INPUT)
+            return None
+        return pet
+
+    def do_GET(self):
+        parts, query = self._route()
+        if parts is None or len(parts) != 1:
+            return self._send_json(404, {"code": 404, "type": "unknown"})
+
+        if parts[0] in ("findByStatus", "findByTags"):
+            name, index = (
+                ("status", self.store.by_status)
+                if parts[0] == "findByStatus"
+                else ("tags", self.store.by_tag)
+            )
+            keys = [
+                key for value in query.get(name, []) for key in value.split(",") if key
+            ]
+            return self._send_json(200, self.store.find(index, keys))
+
+        pet_id = self._pet_id(parts[0])
+        if pet_id is None:
+            return
+        pet = self.store.get(pet_id)
+        if pet is None:
+            return self._send_json(404, PET_NOT_FOUND)
+        self._send_json(200, pet)
+
+    def do_POST(self):
+        parts, _ = self._route()
+        if parts is None or len(parts) > 1:
+            return self._send_json(404, {"code": 404, "type": "unknown"})
+
+        if not parts:
+            pet = self._read_pet()
+            if pet is not None:
+                self._send_json(200, self.store.put(pet))
+            return
+
+        form = parse_qs(self._read_body().decode())
+        pet_id = self._pet_id(parts[0])
+        if pet_id is None:
+            return
+        fields = {
+            key: values[0] for key, values in form.items() if key in ("name", "status")
+        }
+        if self.store.update_fields(pet_id, **fields) is None:
+            return self._send_json(404, PET_NOT_FOUND)
+        self._send_json(200, {"code": 200, "type": "unknown", "message": str(pet_id)})
+
+    def do_PUT(self):
+        parts, _ = self._route()
+        if parts != []:
+            return self._send_json(404, {"code": 404, "type": "unknown"})
+
+        # Like the public Petstore, an unknown id is created rather than refused
+        pet = self._read_pet()
+        if pet is not None:
+            self._send_json(200, self.store.put(pet))
+
+    def do_DELETE(self):
+        parts, _ = self._route()
+        if parts is None or len(parts) != 1:
+            return self._send_json(404, {"code": 404, "type": "unknown"})
+
+        pet_id = self._pet_id(parts[0])
+        if pet_id is None:
+            return
+        if self.store.delete(pet_id) is None:
+            return self._send_json(404)
+        self._send_json(200, {"code": 200, "type": "unknown", "message": str(pet_id)})
+
+
+class PetstoreServer(LocalHTTPServer):
+    """Multi-threaded local Petstore running on a background thread"""
+
+    handler_class = PetstoreHandler
+    base_path = BASE_PATH
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.store = PetStore()
+        super().__init__(host, port)
@@ -1,4 +1,32 @@
+import json
 import random
+from array import array
+from utils import id_allocator
+
+# Value pools and weights for bulk pets
+PET_NAMES = (
+    "Buddy",
+    "Max",
+    "Bella",
+    "Luna",
+    "Charlie",
+    "Lucy",
+    "Cooper",
+    "Daisy",
+    "Rocky",
+    "Molly",
+    "Zeytin",
+    "Pamuk",
+    "Boncuk",
+    "Karamel",
+    "Tarçın",
+    "Duman",
+)
+STATUSES = ("available", "pending", "sold")
+STATUS_WEIGHTS = (6, 2, 2)
+CATEGORIES = ((1, "Dogs"), (2, "Cats"), (3, "Birds"), (4, "Fish"), (5, "Reptiles"))
+CATEGORY_WEIGHTS = (40, 35, 10, 10, 5)
+TAGS = ("friendly", "trained", "vaccinated", "young")
 
 
 class PetDataBuilder:
@@ -48,8 +76,104 @@ class PetDataBuilder:
 
     @staticmethod
     def generate_random_id():
-        """Generate random pet ID"""
-        return random.randint(10000, 99999)
+        """Generate a pet ID no other test of this run (or parallel run) uses"""
+        return id_allocator.get_allocator().next_id()
+
+
+class PetBatch:
+    """Many pets stored column by column
+
+    Each pet is an id in an array of int64 plus one small index per field
+    into the value pools, so 100k pets take a few hundred KB instead of
+    100k dicts. Indexing and iteration build the dicts on demand, and
+    write_jsonl() formats lines without building them at all.
+    """
+
+    def __init__(self, ids, names, statuses, categories, tag_masks):
+        self.ids = ids
+        self.names = names
+        self.statuses = statuses
+        self.categories = categories
+        self.tag_masks = tag_masks
+
+    @classmethod
+    def generate(cls, count, seed=0, first_id=None):
+        """count pets with fields drawn from seed
+
+        Ids are first_id, first_id + 1, ... when given, else taken from the
+        run's id allocator so they never clash with other tests.
+        """
+        rng = random.Random(seed)
+        if first_id is None:
+            ids = array("q")
+            for id_range in id_allocator.get_allocator().next_ids(count):
+                ids.extend(id_range)
+        else:
+            ids = array("q", range(first_id, first_id + count))
+        return cls(
+            ids,
+            array("B", rng.choices(range(len(PET_NAMES)), k=count)),
+            array("B", rng.choices(range(len(STATUSES)), STATUS_WEIGHTS, k=count)),
+            array("B", rng.choices(range(len(CATEGORIES)), CATEGORY_WEIGHTS, k=count)),
+            array("B", rng.choices(range(1 << len(TAGS)), k=count)),
+        )
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __getitem__(self, index):
+        pet_id = self.ids[index]
+        category_id, category_name = CATEGORIES[self.categories[index]]
+        mask = self.tag_masks[index]
+        return {
+            "name": PET_NAMES[self.names[index]],
+            "photoUrls": [f"https://example.com/pets/{pet_id}.jpg"],
+            "id": pet_id,
+            "status": STATUSES[self.statuses[index]],
+            "category": {"id": category_id, "name": category_name},
+            "tags": [
+                {"id": i, "name": tag}
+                for i, tag in enumerate(TAGS, 1)
+                if mask & 1 << (i - 1)
+            ],
+        }
+
+    def __iter__(self):
+        return map(self.__getitem__, range(len(self)))
+
+    def jsonl_lines(self):
+        """Each pet as one line of JSON, formatted from pre-encoded pool values"""
+        names = [json.dumps(name, ensure_ascii=False) for name in PET_NAMES]
+        statuses = [json.dumps(status) for status in STATUSES]
+        categories = [
+            json.dumps({"id": category_id, "name": name}, separators=(",", ":"))
+            for category_id, name in CATEGORIES
+        ]
+        tags = [
+            json.dumps(
+                [
+                    {"id": i, "name": tag}
+                    for i, tag in enumerate(TAGS, 1)
+                    if mask & 1 << (i - 1)
+                ],
+                separators=(",", ":"),
+            )
+            for mask in range(1 << len(TAGS))
+        ]
+        for pet_id, name, status, category, mask in zip(
+            self.ids, self.names, self.statuses, self.categories, self.tag_masks
+        ):
+            yield (
+                f'{{"name":{names[name]},'
+                f'"photoUrls":["https://example.com/pets/{pet_id}.jpg"],'
+                f'"id":{pet_id},"status":{statuses[status]},'
+                f'"category":{categories[category]},"tags":{tags[mask]}}}\n'
+            )
+
+    def write_jsonl(self, path):
+        """Write one pet per line as UTF-8 JSON"""
+        with open(path, "w", encoding="utf-8", buffering=1 << 20) as f:
+            f.writelines(self.jsonl_lines())
 
 
 class TestDataFactory:
@@ -68,6 +192,15 @@ class TestDataFactory:
             .build()
         )
 
+    @staticmethod
+    def many(count, seed=0, first_id=None):
+        """count varied valid pets as a PetBatch
+
+        The same seed gives the same fields; ids repeat only with first_id, as
+        they otherwise come from the run's id allocator.
+        """
+        return PetBatch.generate(count, seed, first_id)
+
     @staticmethod
     def minimal_pet():
         """Create minimal valid pet data"""